@@ -0,0 +1,43 @@
+"""import jobs
+
+Revision ID: 0002_import_jobs
+Revises: 0001_initial
+Create Date: 2026-10-18 00:00:00.000000
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0002_import_jobs"
+down_revision = "0001_initial"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "import_jobs",
+        sa.Column("id", sa.Uuid(as_uuid=True), primary_key=True),
+        sa.Column("filename", sa.String(), nullable=False),
+        sa.Column(
+            "status",
+            sa.Enum("QUEUED", "RUNNING", "DONE", "FAILED", name="import_job_status"),
+            nullable=False,
+        ),
+        sa.Column("payload", sa.LargeBinary(), nullable=True),
+        sa.Column("result", sa.String(), nullable=True),
+        sa.Column("error_code", sa.String(), nullable=True),
+        sa.Column("order_id", sa.Uuid(as_uuid=True), nullable=True),
+        sa.Column("created_by", sa.Uuid(as_uuid=True), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.Column("started_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("finished_at", sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(["order_id"], ["orders.id"], ondelete="SET NULL"),
+        sa.ForeignKeyConstraint(["created_by"], ["users.id"]),
+    )
+    op.create_index(op.f("ix_import_jobs_status"), "import_jobs", ["status"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_import_jobs_status"), table_name="import_jobs")
+    op.drop_table("import_jobs")
+    op.execute("DROP TYPE IF EXISTS import_job_status")
@@ -0,0 +1,47 @@
+"""order view indexes
+
+Revision ID: 0003_order_view_indexes
+Revises: 0002_import_jobs
+Create Date: 2026-10-18 00:00:00.000000
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0003_order_view_indexes"
+down_revision = "0002_import_jobs"
+branch_labels = None
+depends_on = None
+
+NOT_GIVEN = "(status IS NULL OR status != 'DEJA DONNER')"
+
+VIEW_PREDICATES = {
+    "to_prepare": f"prepared IS false AND {NOT_GIVEN}",
+    "to_build": f"prepared IS true AND built IS false AND {NOT_GIVEN}",
+    "to_deliver": "built IS true AND delivered IS false",
+    "done": "delivered IS true",
+}
+
+
+def _keyset_columns() -> list:
+    return [sa.text("sold_at DESC"), sa.text("id DESC")]
+
+
+def upgrade() -> None:
+    # The unique constraint already provides an index on invoice_number.
+    op.drop_index("ix_orders_invoice_number", table_name="orders")
+
+    op.create_index("ix_orders_sold_at_id", "orders", _keyset_columns())
+    for view, predicate in VIEW_PREDICATES.items():
+        op.create_index(
+            f"ix_orders_{view}",
+            "orders",
+            _keyset_columns(),
+            postgresql_where=sa.text(predicate),
+        )
+
+
+def downgrade() -> None:
+    for view in VIEW_PREDICATES:
+        op.drop_index(f"ix_orders_{view}", table_name="orders")
+    op.drop_index("ix_orders_sold_at_id", table_name="orders")
+    op.create_index("ix_orders_invoice_number", "orders", ["invoice_number"], unique=False)
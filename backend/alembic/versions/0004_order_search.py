@@ -0,0 +1,81 @@
+"""order search
+
+Revision ID: 0004_order_search
+Revises: 0003_order_view_indexes
+Create Date: 2026-10-18 00:00:00.000000
+"""
+import unicodedata
+
+from alembic import context, op
+import sqlalchemy as sa
+
+revision = "0004_order_search"
+down_revision = "0003_order_view_indexes"
+branch_labels = None
+depends_on = None
+
+BATCH_SIZE = 5000
+
+
+def _normalize(*parts: str | None) -> str:
+    text = " ".join(part for part in parts if part)
+    decomposed = unicodedata.normalize("NFKD", text)
+    stripped = "".join(char for char in decomposed if not unicodedata.combining(char))
+    return " ".join(stripped.casefold().split())
+
+
+def upgrade() -> None:
+    op.add_column(
+        "orders", sa.Column("search_text", sa.String(), server_default="", nullable=False)
+    )
+
+    if not context.is_offline_mode():
+        _backfill_search_text()
+
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index(
+        "ix_orders_search_text_trgm",
+        "orders",
+        ["search_text"],
+        postgresql_using="gin",
+        postgresql_ops={"search_text": "gin_trgm_ops"},
+    )
+
+
+def _backfill_search_text() -> None:
+    # Normalized in Python so existing rows match what the application writes.
+    bind = op.get_bind()
+    orders = sa.table(
+        "orders",
+        sa.column("id", sa.Uuid(as_uuid=True)),
+        sa.column("invoice_number", sa.String()),
+        sa.column("client_name", sa.String()),
+        sa.column("product_name", sa.String()),
+        sa.column("store", sa.String()),
+        sa.column("search_text", sa.String()),
+    )
+    rows = bind.execute(
+        sa.select(
+            orders.c.id,
+            orders.c.invoice_number,
+            orders.c.client_name,
+            orders.c.product_name,
+            orders.c.store,
+        )
+    ).all()
+    update = (
+        orders.update()
+        .where(orders.c.id == sa.bindparam("order_id"))
+        .values(search_text=sa.bindparam("value"))
+    )
+    for start in range(0, len(rows), BATCH_SIZE):
+        batch = rows[start : start + BATCH_SIZE]
+        bind.execute(
+            update,
+            [{"order_id": row.id, "value": _normalize(*row[1:])} for row in batch],
+        )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_orders_search_text_trgm", table_name="orders")
+    op.drop_column("orders", "search_text")
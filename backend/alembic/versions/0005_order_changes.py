@@ -0,0 +1,32 @@
+"""order changes feed
+
+Revision ID: 0005_order_changes
+Revises: 0004_order_search
+Create Date: 2026-10-18 00:00:00.000000
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0005_order_changes"
+down_revision = "0004_order_search"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_orders_updated_at_id", "orders", ["updated_at", "id"])
+    op.create_table(
+        "order_tombstones",
+        sa.Column("order_id", sa.Uuid(as_uuid=True), primary_key=True),
+        sa.Column("invoice_number", sa.String(), nullable=False),
+        sa.Column("deleted_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+    )
+    op.create_index(
+        op.f("ix_order_tombstones_deleted_at"), "order_tombstones", ["deleted_at"], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_order_tombstones_deleted_at"), table_name="order_tombstones")
+    op.drop_table("order_tombstones")
+    op.drop_index("ix_orders_updated_at_id", table_name="orders")
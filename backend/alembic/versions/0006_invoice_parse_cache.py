@@ -0,0 +1,34 @@
+"""invoice parse cache
+
+Revision ID: 0006_invoice_parse_cache
+Revises: 0005_order_changes
+Create Date: 2026-10-18 00:00:00.000000
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0006_invoice_parse_cache"
+down_revision = "0005_order_changes"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "invoice_parse_cache",
+        sa.Column("sha256", sa.String(length=64), primary_key=True),
+        sa.Column("parser_version", sa.String(), nullable=False),
+        sa.Column("data", sa.JSON(), nullable=True),
+        sa.Column("error_code", sa.String(), nullable=True),
+        sa.Column("backend", sa.String(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.Column("last_used_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+    )
+    op.create_index(
+        op.f("ix_invoice_parse_cache_last_used_at"), "invoice_parse_cache", ["last_used_at"], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_invoice_parse_cache_last_used_at"), table_name="invoice_parse_cache")
+    op.drop_table("invoice_parse_cache")
@@ -0,0 +1,23 @@
+"""stamp order writes with clock_timestamp()
+
+Revision ID: 0007_write_timestamps
+Revises: 0006_invoice_parse_cache
+Create Date: 2026-10-18 00:00:00.000000
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0007_write_timestamps"
+down_revision = "0006_invoice_parse_cache"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.alter_column("orders", "updated_at", server_default=sa.text("clock_timestamp()"))
+    op.alter_column("order_tombstones", "deleted_at", server_default=sa.text("clock_timestamp()"))
+
+
+def downgrade() -> None:
+    op.alter_column("order_tombstones", "deleted_at", server_default=sa.func.now())
+    op.alter_column("orders", "updated_at", server_default=sa.func.now())
@@ -1,18 +1,47 @@
+import time
 import uuid
+from dataclasses import dataclass
+from datetime import datetime
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Query, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.security import decode_access_token
-from app.db.session import SessionLocal
-from app.models.user import User
+from app.core.cache import TTLCache
+from app.core.config import get_settings
+from app.core.security import STREAM_SCOPE, decode_access_token
+from app.db.session import AsyncSessionLocal, SessionLocal
+from app.models.user import User, UserRole
+from app.services.events import broker, publish_order_event_async
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login")
+optional_oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login", auto_error=False)
 
+settings = get_settings()
+user_cache = TTLCache(maxsize=settings.auth_cache_size, ttl=settings.auth_cache_ttl_seconds)
 
-def get_db():
+
+@dataclass(frozen=True)
+class CurrentUser:
+    id: uuid.UUID
+    username: str
+    role: UserRole
+    created_at: datetime
+    updated_at: datetime
+
+
+async def get_db():
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+def get_session_factory():
+    # For handlers that outlive their dependencies, e.g. streaming responses.
+    return AsyncSessionLocal
+
+
+def get_sync_db():
     db = SessionLocal()
     try:
         yield db
@@ -20,15 +49,71 @@ def get_db():
         db.close()
 
 
-def get_current_user(
-    token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)
-) -> User:
+def _discard_user(user_id: uuid.UUID) -> None:
+    user_cache.discard_where(lambda cached: cached.id == user_id)
+
+
+def _on_user_invalidated(event) -> None:
+    if event.type == "user_invalidated":
+        _discard_user(uuid.UUID(event.data["id"]))
+
+
+broker.add_listener(_on_user_invalidated)
+
+
+async def invalidate_user(user_id: uuid.UUID) -> None:
+    # Each worker caches users; the other workers hear about it through the
+    # event fan-out (NOTIFY with EVENTS_BACKEND=postgres).
+    _discard_user(user_id)
+    await publish_order_event_async("user_invalidated", {"id": str(user_id)})
+
+
+async def get_current_user(
+    token: str = Depends(oauth2_scheme), db: AsyncSession = Depends(get_db)
+) -> CurrentUser:
+    return await _user_from_token(token, db)
+
+
+async def _user_from_token(token: str, db: AsyncSession, scope: str | None = None) -> CurrentUser:
+    # Keyed by scope too, so a stream token cached by the stream is still
+    # refused as a bearer token.
+    cache_key = (scope, token)
+    cached = user_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
     try:
         payload = decode_access_token(token)
         user_id = uuid.UUID(payload.get("sub"))
     except (JWTError, ValueError, TypeError) as exc:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token") from exc
-    user = db.get(User, user_id)
+    if payload.get("scope") != scope:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token")
+    user = await db.get(User, user_id)
     if not user:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found")
-    return user
+
+    current_user = CurrentUser(
+        id=user.id,
+        username=user.username,
+        role=user.role,
+        created_at=user.created_at,
+        updated_at=user.updated_at,
+    )
+    # Never serve a token from cache past its own expiry.
+    user_cache.set(cache_key, current_user, ttl=payload.get("exp", 0) - time.time())
+    return current_user
+
+
+async def get_stream_user(
+    token: str | None = Depends(optional_oauth2_scheme),
+    access_token: str | None = Query(None),
+    db: AsyncSession = Depends(get_db),
+) -> CurrentUser:
+    # EventSource cannot send an Authorization header, so the query string
+    # carries a stream token from POST /auth/stream-token instead.
+    if token:
+        return await _user_from_token(token, db)
+    if access_token:
+        return await _user_from_token(access_token, db, scope=STREAM_SCOPE)
+    raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Not authenticated")
@@ -1,9 +1,10 @@
 from fastapi import APIRouter
 
-from app.api.routes import auth, imports, orders, users
+from app.api.routes import auth, imports, metrics, orders, users
 
 api_router = APIRouter(prefix="/api")
 api_router.include_router(auth.router)
 api_router.include_router(orders.router)
 api_router.include_router(imports.router)
 api_router.include_router(users.router)
+api_router.include_router(metrics.router)
@@ -1,9 +1,14 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_current_user, get_db
-from app.core.security import create_access_token, verify_password
-from app.models.user import User
+from app.api.deps import CurrentUser, get_current_user, get_db, user_cache
+from app.core.security import (
+    create_access_token,
+    create_stream_token,
+    verify_and_update_password_async,
+)
+from app.models.user import User, UserRole
 from app.schemas.auth import LoginRequest, Token
 from app.schemas.user import UserOut
 
@@ -11,14 +16,32 @@ router = APIRouter(prefix="/auth", tags=["auth"])
 
 
 @router.post("/login", response_model=Token)
-def login(payload: LoginRequest, db: Session = Depends(get_db)) -> Token:
-    user = db.query(User).filter(User.username == payload.username).first()
-    if not user or not verify_password(payload.password, user.password_hash):
+async def login(payload: LoginRequest, db: AsyncSession = Depends(get_db)) -> Token:
+    user = await db.scalar(select(User).where(User.username == payload.username))
+    if not user:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid credentials")
+    valid, new_hash = await verify_and_update_password_async(payload.password, user.password_hash)
+    if not valid:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid credentials")
+    if new_hash:
+        user.password_hash = new_hash
+        await db.commit()
     token = create_access_token(str(user.id))
     return Token(access_token=token)
 
 
+@router.post("/stream-token", response_model=Token)
+async def stream_token(current_user: CurrentUser = Depends(get_current_user)) -> Token:
+    return Token(access_token=create_stream_token(str(current_user.id)))
+
+
 @router.get("/me", response_model=UserOut)
-def me(current_user: User = Depends(get_current_user)) -> UserOut:
+async def me(current_user: CurrentUser = Depends(get_current_user)) -> UserOut:
     return current_user
+
+
+@router.get("/cache-stats")
+async def cache_stats(current_user: CurrentUser = Depends(get_current_user)) -> dict:
+    if current_user.role != UserRole.ADMIN:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Forbidden")
+    return user_cache.stats()
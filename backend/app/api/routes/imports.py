@@ -1,50 +1,162 @@
-from datetime import datetime
+import uuid
 
 from fastapi import APIRouter, Depends, File, HTTPException, UploadFile, status
 from sqlalchemy.orm import Session
 
-from app.api.deps import get_current_user, get_db
-from app.invoice_parser import InvoiceParseError, parse_invoice_pdf
+from app.api.deps import get_current_user, get_sync_db
+from app.core.config import get_settings
+from app.models.import_job import ImportJob
 from app.models.order import Order
 from app.models.user import UserRole
-from app.schemas.imports import ImportResult
+from app.schemas.imports import ImportJobOut, ImportResult
 from app.schemas.order import OrderOut
+from app.services.import_jobs import job_runner
+from app.services.invoice_import import import_parsed_invoices, parse_invoices
+from app.services.parse_cache import parse_cached
+from app.services.uploads import SpooledFile, TooManyFiles, UploadSpool, UploadTooLarge
 
+# Imports are CPU-bound (parsing) and stay sync handlers on a sync session so
+# they run in the threadpool instead of blocking the event loop.
 router = APIRouter(prefix="/import", tags=["import"])
 
 
+def _require_importer(current_user) -> None:
+    if current_user.role not in {UserRole.ADMIN, UserRole.VENDOR}:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Forbidden")
+
+
+def _too_many_files(max_files: int) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST, detail=f"Too many files (max {max_files})"
+    )
+
+
 @router.post("/invoice", response_model=ImportResult)
 def import_invoice(
     file: UploadFile = File(...),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_sync_db),
     current_user=Depends(get_current_user),
 ) -> ImportResult:
-    if current_user.role not in {UserRole.ADMIN, UserRole.VENDOR}:
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Forbidden")
+    _require_importer(current_user)
 
     if not file.filename.lower().endswith(".pdf"):
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="PDF required")
 
-    try:
-        data = parse_invoice_pdf(file.file.read())
-    except InvoiceParseError as exc:
-        return ImportResult(status="error", errors={"code": exc.code})
+    with UploadSpool() as spool:
+        spooled = spool.add(file.filename, file.file, get_settings().pdf_max_bytes)
+        parsed = parse_cached(
+            db, [(spooled.filename, spooled.path)], parse_invoices, [spooled.sha256]
+        )
+    return import_parsed_invoices(db, parsed, current_user.id)[0]
 
-    existing = (
-        db.query(Order).filter(Order.invoice_number == data["invoice_number"]).first()
-    )
-    if existing:
-        return ImportResult(status="already_exists", order=OrderOut.model_validate(existing))
-
-    order = Order(
-        invoice_number=data["invoice_number"],
-        store=data["store"],
-        client_name=data["client_name"],
-        product_name=data["product_name"],
-        sold_at=datetime.fromisoformat(data["sold_at"]),
-        created_by=current_user.id,
-    )
-    db.add(order)
+
+@router.post("/invoices", response_model=list[ImportResult])
+def import_invoices(
+    files: list[UploadFile] = File(...),
+    db: Session = Depends(get_sync_db),
+    current_user=Depends(get_current_user),
+) -> list[ImportResult]:
+    _require_importer(current_user)
+    settings = get_settings()
+
+    with UploadSpool() as spool:
+        # Keep the caller's file order: unsupported uploads are reported in place.
+        slots: list[ImportResult | None] = []
+        to_parse: list[SpooledFile] = []
+        for upload in files:
+            lowered = upload.filename.lower()
+            if not lowered.endswith((".pdf", ".zip")):
+                slots.append(
+                    ImportResult(
+                        filename=upload.filename,
+                        status="error",
+                        errors={"code": "UNSUPPORTED_FILE"},
+                    )
+                )
+                continue
+            if lowered.endswith(".pdf"):
+                max_bytes = settings.pdf_max_bytes
+            else:
+                max_bytes = settings.upload_max_request_bytes
+            spooled = spool.add(upload.filename, upload.file, max_bytes)
+            # Archives get what is left of the batch budgets.
+            max_total_bytes = None
+            if settings.upload_max_request_bytes:
+                max_total_bytes = settings.upload_max_request_bytes - sum(
+                    item.size for item in to_parse
+                )
+            try:
+                expanded = spool.expand(
+                    spooled, settings.import_batch_max_files - len(to_parse), max_total_bytes
+                )
+            except TooManyFiles as exc:
+                raise _too_many_files(settings.import_batch_max_files) from exc
+            if not expanded:
+                slots.append(
+                    ImportResult(
+                        filename=upload.filename, status="error", errors={"code": "EMPTY_ARCHIVE"}
+                    )
+                )
+                continue
+            for item in expanded:
+                slots.append(None)
+                to_parse.append(item)
+
+        if len(to_parse) > settings.import_batch_max_files:
+            raise _too_many_files(settings.import_batch_max_files)
+
+        parsed = parse_cached(
+            db,
+            [(item.filename, item.path) for item in to_parse],
+            parse_invoices,
+            [item.sha256 for item in to_parse],
+        )
+
+    imported = iter(import_parsed_invoices(db, parsed, current_user.id))
+    return [slot if slot is not None else next(imported) for slot in slots]
+
+
+def _job_out(db: Session, job: ImportJob) -> ImportJobOut:
+    out = ImportJobOut.model_validate(job)
+    if job.order_id:
+        order = db.get(Order, job.order_id)
+        if order:
+            out.order = OrderOut.model_validate(order)
+    return out
+
+
+@router.post("/jobs", response_model=ImportJobOut, status_code=status.HTTP_202_ACCEPTED)
+def create_import_job(
+    file: UploadFile = File(...),
+    db: Session = Depends(get_sync_db),
+    current_user=Depends(get_current_user),
+) -> ImportJobOut:
+    _require_importer(current_user)
+
+    if not file.filename.lower().endswith(".pdf"):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="PDF required")
+
+    max_bytes = get_settings().pdf_max_bytes
+    payload = file.file.read(max_bytes + 1) if max_bytes else file.file.read()
+    if max_bytes and len(payload) > max_bytes:
+        raise UploadTooLarge(file.filename, max_bytes)
+
+    job = ImportJob(filename=file.filename, payload=payload, created_by=current_user.id)
+    db.add(job)
     db.commit()
-    db.refresh(order)
-    return ImportResult(status="created", order=order)
+    db.refresh(job)
+    job_runner.submit(job.id)
+    return _job_out(db, job)
+
+
+@router.get("/jobs/{job_id}", response_model=ImportJobOut)
+def get_import_job(
+    job_id: uuid.UUID,
+    db: Session = Depends(get_sync_db),
+    current_user=Depends(get_current_user),
+) -> ImportJobOut:
+    _require_importer(current_user)
+    job = db.get(ImportJob, job_id)
+    if not job:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Job not found")
+    return _job_out(db, job)
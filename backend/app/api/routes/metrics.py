@@ -0,0 +1,18 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+
+from app.api.deps import CurrentUser, get_current_user
+from app.core.metrics import db_metrics, pool_status
+from app.db.session import async_engine, engine
+from app.models.user import UserRole
+
+router = APIRouter(prefix="/metrics", tags=["metrics"])
+
+
+@router.get("/db")
+async def database_metrics(current_user: CurrentUser = Depends(get_current_user)) -> dict:
+    if current_user.role != UserRole.ADMIN:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Forbidden")
+    return {
+        "pools": {"sync": pool_status(engine), "async": pool_status(async_engine.sync_engine)},
+        "routes": db_metrics.snapshot(),
+    }
@@ -1,126 +1,570 @@
-from datetime import datetime
+import base64
+import hashlib
+import uuid
+from datetime import date, datetime, timedelta, timezone
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy import and_, or_
-from sqlalchemy.orm import Session
+from fastapi import (
+    APIRouter,
+    Body,
+    Depends,
+    Header,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    status,
+)
+from fastapi.responses import StreamingResponse
+from sqlalchemy import delete, func, select, text, tuple_, update
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_current_user, get_db
-from app.models.order import Order
+from app.api.deps import get_current_user, get_db, get_session_factory, get_stream_user
+from app.core.cache import TTLCache
+from app.core.config import get_settings
+from app.core.responses import OrderJSONResponse, dumps
+from app.db.search import search_condition, search_rank
+from app.models.order import ORDER_VIEW_FILTERS, Order
+from app.models.order_tombstone import OrderTombstone
 from app.models.user import UserRole
-from app.schemas.order import OrderCreate, OrderOut, OrderPatch
+from app.schemas.order import (
+    DayOrderCounts,
+    OrderBulkPatchItem,
+    OrderBulkPatchResult,
+    OrderChanges,
+    OrderCounts,
+    OrderCreate,
+    OrderOut,
+    OrderPatch,
+    OrderStats,
+    StoreOrderCounts,
+)
+from app.services.events import (
+    broker,
+    order_event_stream,
+    order_payload,
+    publish_order_event_async,
+)
+from app.services.order_export import EXPORT_FORMATS, export_chunks, export_statement
 
 router = APIRouter(prefix="/orders", tags=["orders"])
 
 
+ORDER_FIELDS = tuple(OrderOut.model_fields)
+KEYSET_FIELDS = ("sold_at", "id")
+ORDER_LIST_CACHE_MAX_BODY = 1024 * 1024
+
+settings = get_settings()
+# Serialized list bodies keyed by query; each entry carries the set fingerprint
+# it was built from, and any order event empties the cache.
+order_list_cache = TTLCache(
+    maxsize=settings.order_list_cache_size, ttl=settings.order_list_cache_ttl_seconds
+)
+broker.add_listener(lambda event: order_list_cache.clear())
+
+
+def order_filters(
+    view: str = "all",
+    q: str | None = None,
+    from_date: datetime | None = None,
+    to_date: datetime | None = None,
+    dialect_name: str = "",
+) -> list:
+    conditions = []
+
+    if q:
+        conditions.append(search_condition(Order.search_text, q, dialect_name))
+
+    if from_date:
+        conditions.append(Order.sold_at >= from_date)
+    if to_date:
+        conditions.append(Order.sold_at <= to_date)
+
+    if view in ORDER_VIEW_FILTERS:
+        conditions.append(ORDER_VIEW_FILTERS[view])
+
+    return conditions
+
+
+def encode_cursor(moment: datetime, order_id: uuid.UUID | None = None) -> str:
+    raw = moment.isoformat() if order_id is None else f"{moment.isoformat()}|{order_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, require_id: bool = True) -> tuple[datetime, uuid.UUID | None]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        moment, _, order_id = raw.partition("|")
+        if require_id and not order_id:
+            raise ValueError("missing id")
+        return datetime.fromisoformat(moment), uuid.UUID(order_id) if order_id else None
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor") from exc
+
+
+Position = tuple[datetime, uuid.UUID]
+
+
+def encode_sync_cursor(
+    issued_at: datetime, orders_at: Position | None, deleted_at: Position | None
+) -> str:
+    positions = (
+        f"{position[0].isoformat()}|{position[1]}" if position else ""
+        for position in (orders_at, deleted_at)
+    )
+    raw = ";".join((issued_at.isoformat(), *positions))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_sync_cursor(cursor: str) -> tuple[datetime, Position | None, Position | None]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        issued, orders_part, deleted_part = raw.split(";")
+        positions = []
+        for part in (orders_part, deleted_part):
+            moment, _, row_id = part.partition("|")
+            positions.append((datetime.fromisoformat(moment), uuid.UUID(row_id)) if part else None)
+        return datetime.fromisoformat(issued), positions[0], positions[1]
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor") from exc
+
+
+def _parse_fields(fields: str | None) -> tuple[str, ...] | None:
+    if fields is None:
+        return None
+    requested = tuple(dict.fromkeys(name.strip() for name in fields.split(",") if name.strip()))
+    unknown = set(requested) - set(ORDER_FIELDS)
+    if not requested or unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown fields: {', '.join(sorted(unknown))}" if unknown else "No fields",
+        )
+    return requested
+
+
+async def _count_orders(db: AsyncSession, conditions: list) -> tuple[int, bool]:
+    if not conditions and db.get_bind().dialect.name == "postgresql":
+        # Planner statistics avoid a full scan when the whole table is listed.
+        estimate = await db.scalar(
+            text("SELECT reltuples::bigint FROM pg_class WHERE oid = 'orders'::regclass")
+        )
+        if estimate is not None and estimate >= 0:
+            return estimate, True
+    return await db.scalar(select(func.count()).select_from(Order).where(*conditions)), False
+
+
+async def _order_set_state(db: AsyncSession, conditions: list, with_count: bool) -> tuple:
+    # Cheap fingerprint of the matching set: newest write, a deletion counter
+    # and, when filtered, its size (a row can leave a filtered set without
+    # being the newest). None of it materializes rows.
+    columns = [
+        func.max(Order.updated_at),
+        select(func.count()).select_from(OrderTombstone).scalar_subquery(),
+        select(func.max(OrderTombstone.deleted_at)).scalar_subquery(),
+    ]
+    if with_count:
+        columns.append(func.count())
+    return tuple((await db.execute(select(*columns).select_from(Order).where(*conditions))).one())
+
+
+def order_rows_json(rows, names: tuple[str, ...]) -> bytes:
+    # Rows start with the requested columns, in order; keyset columns may follow.
+    width = len(names)
+    return dumps([dict(zip(names, row[:width])) for row in rows])
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    if if_none_match.strip() == "*":
+        return True
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return etag.removeprefix("W/") in candidates
+
+
 @router.get("", response_model=list[OrderOut])
-def list_orders(
+async def list_orders(
     view: str = Query("all", pattern="^(all|to_prepare|to_build|to_deliver|done)$"),
     q: str | None = None,
     from_date: datetime | None = Query(None, alias="from"),
     to_date: datetime | None = Query(None, alias="to"),
-    db: Session = Depends(get_db),
+    limit: int | None = Query(None, ge=1, le=1000),
+    cursor: str | None = None,
+    fields: str | None = None,
+    sort: str = Query("date", pattern="^(date|relevance)$"),
+    if_none_match: str | None = Header(None),
+    db: AsyncSession = Depends(get_db),
     current_user=Depends(get_current_user),
-) -> list[OrderOut]:
-    query = db.query(Order)
+):
+    if sort == "relevance" and (not q or cursor is not None):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Relevance sort requires q and does not support cursors",
+        )
+    dialect_name = db.get_bind().dialect.name
+    conditions = order_filters(view, q, from_date, to_date, dialect_name)
+    projection = _parse_fields(fields)
 
-    if q:
-        like = f"%{q}%"
-        query = query.filter(
-            or_(
-                Order.invoice_number.ilike(like),
-                Order.client_name.ilike(like),
-                Order.product_name.ilike(like),
-                Order.store.ilike(like),
-            )
+    cache_key = (view, q, from_date, to_date, limit, cursor, projection, sort)
+    # The whole table on Postgres is counted from planner statistics instead.
+    exact_count = bool(conditions) or dialect_name != "postgresql"
+    state = await _order_set_state(db, conditions, exact_count)
+    digest = hashlib.sha1(repr((cache_key, state)).encode()).hexdigest()
+    validators = {"ETag": f'W/"{digest}"', "Cache-Control": "private, no-cache"}
+    if if_none_match and _etag_matches(if_none_match, validators["ETag"]):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=validators)
+    cached = order_list_cache.get(cache_key)
+    if cached is not None and cached[0] == digest:
+        return OrderJSONResponse(cached[1], headers=cached[2])
+
+    headers: dict[str, str] = {}
+    if limit is not None and cursor is None:
+        if exact_count:
+            total, estimated = state[-1], False
+        else:
+            total, estimated = await _count_orders(db, conditions)
+        headers["X-Total-Count"] = str(total)
+        if estimated:
+            headers["X-Total-Count-Estimated"] = "true"
+
+    if cursor is not None:
+        sold_at, order_id = decode_cursor(cursor)
+        conditions.append(tuple_(Order.sold_at, Order.id) < tuple_(sold_at, order_id))
+
+    # Plain column tuples straight to orjson: no ORM instances, no pydantic pass.
+    names = projection or ORDER_FIELDS
+    statement = select(*(getattr(Order, name) for name in dict.fromkeys(names + KEYSET_FIELDS)))
+    statement = statement.where(*conditions)
+    if sort == "relevance":
+        statement = statement.order_by(search_rank(Order.search_text, q, dialect_name).desc())
+    statement = statement.order_by(Order.sold_at.desc(), Order.id.desc())
+    if limit is not None:
+        statement = statement.limit(limit + 1)
+
+    rows = (await db.execute(statement)).all()
+    if limit is not None and len(rows) > limit:
+        rows = rows[:limit]
+        if sort == "date":
+            last = rows[-1]
+            headers["X-Next-Cursor"] = encode_cursor(last.sold_at, last.id)
+
+    body = order_rows_json(rows, names)
+    headers.update(validators)
+    if len(body) <= ORDER_LIST_CACHE_MAX_BODY:
+        order_list_cache.set(cache_key, (digest, body, headers))
+    return OrderJSONResponse(body, headers=headers)
+
+
+@router.get("/stats", response_model=OrderStats)
+async def order_stats(
+    from_date: datetime | None = Query(None, alias="from"),
+    to_date: datetime | None = Query(None, alias="to"),
+    db: AsyncSession = Depends(get_db),
+    current_user=Depends(get_current_user),
+) -> OrderStats:
+    day = func.date(Order.sold_at)
+    counts = [func.count().label("total")] + [
+        func.count().filter(predicate).label(view) for view, predicate in ORDER_VIEW_FILTERS.items()
+    ]
+    # One grouped scan; per-store, per-day and overall totals are folded here.
+    rows = (
+        await db.execute(
+            select(Order.store, day.label("day"), *counts)
+            .where(*order_filters(from_date=from_date, to_date=to_date))
+            .group_by(Order.store, day)
         )
+    ).all()
 
-    if from_date:
-        query = query.filter(Order.sold_at >= from_date)
-    if to_date:
-        query = query.filter(Order.sold_at <= to_date)
+    totals = OrderCounts()
+    stores: dict[str | None, StoreOrderCounts] = {}
+    days: dict[date, DayOrderCounts] = {}
+    for row in rows:
+        row_day = row.day if isinstance(row.day, date) else date.fromisoformat(row.day)
+        store = stores.setdefault(row.store, StoreOrderCounts(store=row.store))
+        per_day = days.setdefault(row_day, DayOrderCounts(day=row_day))
+        for name in OrderCounts.model_fields:
+            value = getattr(row, name)
+            for target in (totals, store, per_day):
+                setattr(target, name, getattr(target, name) + value)
 
-    if view == "to_prepare":
-        query = query.filter(
-            and_(Order.prepared.is_(False), or_(Order.status.is_(None), Order.status != "DEJA DONNER"))
+    return OrderStats(
+        totals=totals,
+        stores=sorted(stores.values(), key=lambda item: item.store or ""),
+        days=sorted(days.values(), key=lambda item: item.day),
+    )
+
+
+@router.get("/export")
+async def export_orders(
+    format: str = Query("csv", pattern="^(csv|parquet|xlsx)$"),
+    view: str = Query("all", pattern="^(all|to_prepare|to_build|to_deliver|done)$"),
+    q: str | None = None,
+    from_date: datetime | None = Query(None, alias="from"),
+    to_date: datetime | None = Query(None, alias="to"),
+    accept_encoding: str | None = Header(None),
+    db: AsyncSession = Depends(get_db),
+    session_factory=Depends(get_session_factory),
+    current_user=Depends(get_current_user),
+) -> StreamingResponse:
+    export_format = EXPORT_FORMATS[format]
+    if not export_format.available:
+        raise HTTPException(
+            status_code=status.HTTP_501_NOT_IMPLEMENTED,
+            detail=f"{format} export requires {export_format.module}",
         )
-    elif view == "to_build":
-        query = query.filter(
-            and_(
-                Order.prepared.is_(True),
-                Order.built.is_(False),
-                or_(Order.status.is_(None), Order.status != "DEJA DONNER"),
-            )
+    conditions = order_filters(view, q, from_date, to_date, db.get_bind().dialect.name)
+    statement = export_statement(conditions).execution_options(
+        yield_per=get_settings().export_batch_size
+    )
+
+    # The request session is closed before the body is sent, so rows are
+    # streamed from a session of their own through a server-side cursor.
+    async def batches():
+        async with session_factory() as session:
+            result = await session.stream(statement)
+            async for rows in result.partitions():
+                yield rows
+
+    gzip = format == "csv" and "gzip" in (accept_encoding or "").lower()
+    filename = f"orders-{datetime.now(timezone.utc):%Y%m%d}.{export_format.extension}"
+    headers = {"Content-Disposition": f'attachment; filename="{filename}"'}
+    if format == "csv":
+        headers["Vary"] = "Accept-Encoding"
+    if gzip:
+        headers["Content-Encoding"] = "gzip"
+    return StreamingResponse(
+        export_chunks(format, batches(), gzip),
+        media_type=export_format.media_type,
+        headers=headers,
+    )
+
+
+def _tombstone_horizon() -> datetime:
+    return datetime.now(timezone.utc) - timedelta(days=get_settings().tombstone_retention_days)
+
+
+@router.get("/changes", response_model=OrderChanges)
+async def order_changes(
+    since: str | None = None,
+    limit: int = Query(500, ge=1, le=5000),
+    db: AsyncSession = Depends(get_db),
+    current_user=Depends(get_current_user),
+) -> OrderChanges:
+    # The cursor holds when it was issued and two positions, the last order
+    # sent (updated_at, id) and the last tombstone sent (deleted_at, order_id),
+    # both compared strictly so an idle poll comes back empty. Every tombstone
+    # is sent on each poll, so only a cursor issued before the retention
+    # horizon can have missed pruned ones.
+    issued_at = datetime.now(timezone.utc)
+    orders_at = deleted_at = None
+    if since is not None:
+        since_issued_at, orders_at, deleted_at = decode_sync_cursor(since)
+        if since_issued_at.tzinfo is None:
+            since_issued_at = since_issued_at.replace(tzinfo=timezone.utc)
+        if since_issued_at < _tombstone_horizon():
+            return OrderChanges(orders=[], deleted=[], reset=True)
+
+    conditions = []
+    if orders_at is not None:
+        conditions.append(tuple_(Order.updated_at, Order.id) > tuple_(*orders_at))
+    orders = (
+        await db.scalars(
+            select(Order)
+            .where(*conditions)
+            .order_by(Order.updated_at, Order.id)
+            .limit(limit + 1)
         )
-    elif view == "to_deliver":
-        query = query.filter(and_(Order.built.is_(True), Order.delivered.is_(False)))
-    elif view == "done":
-        query = query.filter(Order.delivered.is_(True))
+    ).all()
+    has_more = len(orders) > limit
+    orders = orders[:limit]
+    if orders:
+        orders_at = (orders[-1].updated_at, orders[-1].id)
+
+    tombstones = select(OrderTombstone.deleted_at, OrderTombstone.order_id)
+    deleted = []
+    if since is None:
+        # A full sync has nothing to delete; later deletions start from here.
+        latest = (
+            await db.execute(
+                tombstones.order_by(
+                    OrderTombstone.deleted_at.desc(), OrderTombstone.order_id.desc()
+                ).limit(1)
+            )
+        ).first()
+        deleted_at = tuple(latest) if latest else None
+    else:
+        if deleted_at is not None:
+            tombstones = tombstones.where(
+                tuple_(OrderTombstone.deleted_at, OrderTombstone.order_id) > tuple_(*deleted_at)
+            )
+        rows = (
+            await db.execute(
+                tombstones.order_by(OrderTombstone.deleted_at, OrderTombstone.order_id)
+            )
+        ).all()
+        deleted = [row.order_id for row in rows]
+        if rows:
+            deleted_at = tuple(rows[-1])
 
-    return query.order_by(Order.sold_at.desc()).all()
+    cursor = encode_sync_cursor(issued_at, orders_at, deleted_at)
+    return OrderChanges(orders=orders, deleted=deleted, cursor=cursor, has_more=has_more)
+
+
+@router.get("/stream")
+async def stream_orders(
+    request: Request,
+    last_event_id: str | None = Header(None),
+    resume: str | None = Query(None),
+    current_user=Depends(get_stream_user),
+) -> StreamingResponse:
+    subscription = broker.subscribe(last_event_id or resume)
+
+    async def body():
+        try:
+            async for chunk in order_event_stream(subscription, request.is_disconnected):
+                yield chunk
+        finally:
+            broker.unsubscribe(subscription)
+
+    return StreamingResponse(
+        body(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 
 @router.post("", response_model=OrderOut)
-def create_order(
+async def create_order(
     payload: OrderCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user=Depends(get_current_user),
 ) -> OrderOut:
     if current_user.role not in {UserRole.ADMIN, UserRole.VENDOR}:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Forbidden")
 
-    existing = db.query(Order).filter(Order.invoice_number == payload.invoice_number).first()
+    existing = await db.scalar(
+        select(Order.id).where(Order.invoice_number == payload.invoice_number)
+    )
     if existing:
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Invoice already exists")
 
     order = Order(**payload.model_dump(), created_by=current_user.id)
     db.add(order)
-    db.commit()
-    db.refresh(order)
+    await db.commit()
+    await db.refresh(order)
+    await publish_order_event_async("created", order_payload(order))
     return order
 
 
+def patch_denied(role: UserRole, updates: dict) -> str | None:
+    if role == UserRole.VENDOR:
+        if "built" in updates:
+            return "Cannot modify built"
+    elif role == UserRole.BUILDER:
+        forbidden_fields = {"prepared", "delivered", "status"}
+        if forbidden_fields.intersection(updates):
+            return "Forbidden fields"
+    elif role != UserRole.ADMIN:
+        return "Forbidden"
+    return None
+
+
+@router.patch("", response_model=list[OrderBulkPatchResult])
+async def bulk_patch_orders(
+    payload: list[OrderBulkPatchItem] = Body(..., max_length=1000),
+    db: AsyncSession = Depends(get_db),
+    current_user=Depends(get_current_user),
+) -> list[OrderBulkPatchResult]:
+    results: dict[uuid.UUID, OrderBulkPatchResult] = {}
+    changes: dict[uuid.UUID, dict] = {}
+    for item in payload:
+        updates = item.model_dump(exclude_unset=True, exclude={"id"})
+        denied = patch_denied(current_user.role, updates)
+        if denied:
+            results[item.id] = OrderBulkPatchResult(id=item.id, status="forbidden", detail=denied)
+        else:
+            changes.setdefault(item.id, {}).update(updates)
+    for order_id in results:
+        changes.pop(order_id, None)
+
+    existing = set()
+    if changes:
+        existing = set((await db.scalars(select(Order.id).where(Order.id.in_(changes)))).all())
+    for order_id in changes.keys() - existing:
+        results[order_id] = OrderBulkPatchResult(
+            id=order_id, status="not_found", detail="Order not found"
+        )
+
+    # One UPDATE ... WHERE id IN (...) per distinct change-set.
+    groups: dict[tuple, list[uuid.UUID]] = {}
+    for order_id, updates in changes.items():
+        if order_id in existing and updates:
+            groups.setdefault(tuple(sorted(updates.items())), []).append(order_id)
+    for change_set, order_ids in groups.items():
+        await db.execute(
+            update(Order)
+            .where(Order.id.in_(order_ids))
+            .values(**dict(change_set))
+            .execution_options(synchronize_session=False)
+        )
+    await db.commit()
+
+    updated_ids = [order_id for order_id in changes if order_id in existing]
+    if updated_ids:
+        orders = (
+            await db.scalars(
+                select(Order)
+                .where(Order.id.in_(updated_ids))
+                .execution_options(populate_existing=True)
+            )
+        ).all()
+        for order in orders:
+            results[order.id] = OrderBulkPatchResult(id=order.id, status="updated", order=order)
+            if changes[order.id]:
+                await publish_order_event_async("updated", order_payload(order))
+
+    return [results[item_id] for item_id in dict.fromkeys(item.id for item in payload)]
+
+
 @router.patch("/{order_id}", response_model=OrderOut)
-def patch_order(
-    order_id: str,
+async def patch_order(
+    order_id: uuid.UUID,
     payload: OrderPatch,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user=Depends(get_current_user),
 ) -> OrderOut:
-    order = db.get(Order, order_id)
+    order = await db.get(Order, order_id)
     if not order:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Order not found")
 
     updates = payload.model_dump(exclude_unset=True)
 
-    if current_user.role == UserRole.VENDOR:
-        if "built" in updates:
-            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Cannot modify built")
-    elif current_user.role == UserRole.BUILDER:
-        forbidden_fields = {"prepared", "delivered", "status"}
-        if forbidden_fields.intersection(updates):
-            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Forbidden fields")
-    elif current_user.role != UserRole.ADMIN:
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Forbidden")
+    denied = patch_denied(current_user.role, updates)
+    if denied:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=denied)
 
     for key, value in updates.items():
         setattr(order, key, value)
 
-    db.commit()
-    db.refresh(order)
+    await db.commit()
+    await db.refresh(order)
+    await publish_order_event_async("updated", order_payload(order))
     return order
 
 
 @router.delete("/{order_id}")
-def delete_order(
-    order_id: str,
-    db: Session = Depends(get_db),
+async def delete_order(
+    order_id: uuid.UUID,
+    db: AsyncSession = Depends(get_db),
     current_user=Depends(get_current_user),
 ) -> dict:
     if current_user.role != UserRole.ADMIN:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Forbidden")
-    order = db.get(Order, order_id)
+    order = await db.get(Order, order_id)
     if not order:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Order not found")
-    db.delete(order)
-    db.commit()
+    db.add(OrderTombstone(order_id=order.id, invoice_number=order.invoice_number))
+    await db.execute(
+        delete(OrderTombstone).where(OrderTombstone.deleted_at < _tombstone_horizon())
+    )
+    await db.delete(order)
+    await db.commit()
+    await publish_order_event_async("deleted", {"id": str(order_id)})
     return {"status": "deleted"}
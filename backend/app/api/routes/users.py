@@ -1,8 +1,11 @@
+import uuid
+
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_current_user, get_db
-from app.core.security import hash_password
+from app.api.deps import get_current_user, get_db, invalidate_user
+from app.core.security import hash_password_async
 from app.models.user import User, UserRole
 from app.schemas.user import UserCreate, UserOut, UserUpdate
 
@@ -10,75 +13,77 @@ router = APIRouter(prefix="/users", tags=["users"])
 
 
 @router.get("", response_model=list[UserOut])
-def list_users(
-    db: Session = Depends(get_db),
+async def list_users(
+    db: AsyncSession = Depends(get_db),
     current_user=Depends(get_current_user),
 ) -> list[UserOut]:
     if current_user.role != UserRole.ADMIN:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Forbidden")
-    return db.query(User).order_by(User.username).all()
+    return (await db.scalars(select(User).order_by(User.username))).all()
 
 
 @router.post("", response_model=UserOut)
-def create_user(
+async def create_user(
     payload: UserCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user=Depends(get_current_user),
 ) -> UserOut:
     if current_user.role != UserRole.ADMIN:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Forbidden")
 
-    if db.query(User).filter(User.username == payload.username).first():
+    if await db.scalar(select(User.id).where(User.username == payload.username)):
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Username already exists")
 
     user = User(
         username=payload.username,
         role=payload.role,
-        password_hash=hash_password(payload.password),
+        password_hash=await hash_password_async(payload.password),
     )
     db.add(user)
-    db.commit()
-    db.refresh(user)
+    await db.commit()
+    await db.refresh(user)
     return user
 
 
 @router.patch("/{user_id}", response_model=UserOut)
-def update_user(
-    user_id: str,
+async def update_user(
+    user_id: uuid.UUID,
     payload: UserUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user=Depends(get_current_user),
 ) -> UserOut:
     if current_user.role != UserRole.ADMIN:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Forbidden")
 
-    user = db.get(User, user_id)
+    user = await db.get(User, user_id)
     if not user:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
 
     updates = payload.model_dump(exclude_unset=True)
     if "password" in updates:
-        updates["password_hash"] = hash_password(updates.pop("password"))
+        updates["password_hash"] = await hash_password_async(updates.pop("password"))
 
     for key, value in updates.items():
         setattr(user, key, value)
 
-    db.commit()
-    db.refresh(user)
+    await db.commit()
+    await invalidate_user(user.id)
+    await db.refresh(user)
     return user
 
 
 @router.delete("/{user_id}")
-def delete_user(
-    user_id: str,
-    db: Session = Depends(get_db),
+async def delete_user(
+    user_id: uuid.UUID,
+    db: AsyncSession = Depends(get_db),
     current_user=Depends(get_current_user),
 ) -> dict:
     if current_user.role != UserRole.ADMIN:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Forbidden")
-    user = db.get(User, user_id)
+    user = await db.get(User, user_id)
     if not user:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
-    db.delete(user)
-    db.commit()
+    await db.delete(user)
+    await db.commit()
+    await invalidate_user(user_id)
     return {"status": "deleted"}
@@ -1,8 +1,13 @@
 import argparse
+import os
+from pathlib import Path
 
+from app.core.config import get_settings
 from app.core.security import hash_password
-from app.db.session import SessionLocal
+from app.db.session import SessionLocal, engine
 from app.models.user import User, UserRole
+from app.services.archive_import import ArchiveImportStats, Checkpoint, import_directory
+from app.services.events import PostgresNotifyBridge, broker
 
 
 def create_admin(username: str, password: str, role: str) -> None:
@@ -18,6 +23,31 @@ def create_admin(username: str, password: str, role: str) -> None:
         db.close()
 
 
+def _print_progress(stats: ArchiveImportStats) -> None:
+    print(f"{stats.files} files, {stats.files_per_second:.1f} files/s", flush=True)
+
+
+def import_dir(path: Path, workers: int, chunk_size: int, checkpoint_path: Path | None) -> None:
+    if not path.is_dir():
+        raise SystemExit(f"{path} is not a directory")
+    checkpoint = Checkpoint(checkpoint_path or Path(f"{path.resolve().name}.import-checkpoint"))
+    db = SessionLocal()
+    try:
+        stats = import_directory(db, path, checkpoint, workers, chunk_size, _print_progress)
+    finally:
+        db.close()
+
+    if stats.created and get_settings().events_backend == "postgres":
+        # Too many orders for one event each: live clients resync instead.
+        PostgresNotifyBridge(broker, engine).publish([("reset", {})])
+
+    print(f"{stats.files} files in {stats.elapsed:.1f}s ({stats.files_per_second:.1f} files/s)")
+    outcomes = [("created", stats.created), ("already_exists", stats.already_exists)]
+    for code, count in outcomes + stats.errors.most_common():
+        print(f"  {code:<28} {count:>8}")
+    print(f"Checkpoint {checkpoint.path}: {stats.resumed} files skipped from earlier runs")
+
+
 def main() -> None:
     parser = argparse.ArgumentParser()
     subparsers = parser.add_subparsers(dest="command")
@@ -27,9 +57,17 @@ def main() -> None:
     create_parser.add_argument("--password", required=True)
     create_parser.add_argument("--role", default="ADMIN")
 
+    import_parser = subparsers.add_parser("import-dir")
+    import_parser.add_argument("path", type=Path)
+    import_parser.add_argument("--workers", type=int, default=os.cpu_count())
+    import_parser.add_argument("--chunk-size", type=int, default=1000)
+    import_parser.add_argument("--checkpoint", type=Path)
+
     args = parser.parse_args()
     if args.command == "create-user":
         create_admin(args.username, args.password, args.role)
+    elif args.command == "import-dir":
+        import_dir(args.path, args.workers, args.chunk_size, args.checkpoint)
     else:
         parser.print_help()
 
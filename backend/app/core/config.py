@@ -6,13 +6,39 @@ class Settings(BaseSettings):
     app_name: str = "Liste PC Montage"
     environment: str = "production"
     database_url: str = "postgresql+psycopg2://postgres:postgres@db:5432/pcmontage"
+    async_database_url: str = ""
+    db_pool_size: int = 5
+    db_max_overflow: int = 10
+    db_pool_timeout_seconds: float = 30
+    db_pool_recycle_seconds: int = 1800
+    db_pool_pre_ping: bool = True
     jwt_secret: str = "change-me"
     jwt_algorithm: str = "HS256"
     jwt_expires_minutes: int = 60 * 24
+    stream_token_expires_seconds: int = 60
     cors_origins: str = "*"
     admin_username: str = "admin"
     admin_password: str = "admin1234"
     admin_role: str = "ADMIN"
+    bcrypt_rounds: int = 12
+    password_hash_workers: int = 2
+    auth_cache_size: int = 1024
+    auth_cache_ttl_seconds: float = 60
+    events_backend: str = "memory"
+    events_history_size: int = 1000
+    import_workers: int = 0
+    tombstone_retention_days: int = 30
+    order_list_cache_size: int = 256
+    order_list_cache_ttl_seconds: float = 300
+    export_batch_size: int = 5000
+    import_batch_max_files: int = 500
+    import_job_concurrency: int = 2
+    import_job_timeout_seconds: float = 60
+    pdf_max_pages: int = 3
+    pdf_max_bytes: int = 20 * 1024 * 1024
+    parse_cache_max_entries: int = 10000
+    upload_max_request_bytes: int = 200 * 1024 * 1024
+    upload_spool_dir: str = ""
 
     class Config:
         env_file = ".env"
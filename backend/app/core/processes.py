@@ -0,0 +1,8 @@
+import multiprocessing
+
+# Child processes are started from request and job threads; forking a
+# multi-threaded process can deadlock on locks another thread held (logging,
+# connection pools). The forkserver forks from a clean single-threaded process
+# that has the parser and bcrypt preloaded.
+process_context = multiprocessing.get_context("forkserver")
+process_context.set_forkserver_preload(["app.invoice_parser", "app.core.security"])
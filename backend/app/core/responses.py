@@ -0,0 +1,17 @@
+import orjson
+from fastapi.responses import ORJSONResponse
+
+# UTC datetimes keep the "Z" suffix pydantic emits elsewhere in the API.
+ORJSON_OPTIONS = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+
+
+def dumps(content) -> bytes:
+    return orjson.dumps(content, option=ORJSON_OPTIONS)
+
+
+class OrderJSONResponse(ORJSONResponse):
+    def render(self, content) -> bytes:
+        # Bodies already serialized (e.g. from the list cache) go out untouched.
+        if isinstance(content, bytes):
+            return content
+        return dumps(content)
@@ -1,11 +1,24 @@
+import asyncio
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime, timedelta, timezone
 
 from jose import jwt
 from passlib.context import CryptContext
+from starlette.concurrency import run_in_threadpool
 
 from app.core.config import get_settings
+from app.core.metrics import PASSWORD_HASH_DURATION
+from app.core.processes import process_context
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Hashes made with another cost factor are flagged by needs_update and
+# upgraded at the next successful login.
+pwd_context = CryptContext(
+    schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=get_settings().bcrypt_rounds
+)
+_hash_executor: ProcessPoolExecutor | None = None
+STREAM_SCOPE = "stream"
 
 
 def hash_password(password: str) -> str:
@@ -16,6 +29,60 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
 
+def verify_and_update_password(
+    plain_password: str, hashed_password: str
+) -> tuple[bool, str | None]:
+    return pwd_context.verify_and_update(plain_password, hashed_password)
+
+
+def _get_hash_executor() -> ProcessPoolExecutor | None:
+    global _hash_executor
+    workers = get_settings().password_hash_workers
+    if _hash_executor is None and workers > 0:
+        _hash_executor = ProcessPoolExecutor(max_workers=workers, mp_context=process_context)
+    return _hash_executor
+
+
+def shutdown_hash_executor() -> None:
+    global _hash_executor
+    if _hash_executor is not None:
+        _hash_executor.shutdown(wait=False, cancel_futures=True)
+        _hash_executor = None
+
+
+async def _run_hashing(operation: str, func, *args):
+    # bcrypt is pure CPU: a small process pool keeps a burst of logins from
+    # holding every threadpool slot (and the GIL) of the API worker.
+    started_at = time.perf_counter()
+    try:
+        executor = _get_hash_executor()
+        if executor is None:
+            return await run_in_threadpool(func, *args)
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(executor, func, *args)
+        except BrokenProcessPool:
+            # A killed worker breaks the pool for good: replace it (once, for
+            # all the requests that saw it break) and retry on the new one.
+            if _hash_executor is executor:
+                shutdown_hash_executor()
+            return await loop.run_in_executor(_get_hash_executor(), func, *args)
+    finally:
+        PASSWORD_HASH_DURATION.observe(time.perf_counter() - started_at, operation=operation)
+
+
+async def hash_password_async(password: str) -> str:
+    return await _run_hashing("hash", hash_password, password)
+
+
+async def verify_and_update_password_async(
+    plain_password: str, hashed_password: str
+) -> tuple[bool, str | None]:
+    return await _run_hashing(
+        "verify", verify_and_update_password, plain_password, hashed_password
+    )
+
+
 def create_access_token(subject: str, expires_minutes: int | None = None) -> str:
     settings = get_settings()
     expire_minutes = expires_minutes or settings.jwt_expires_minutes
@@ -24,6 +91,15 @@ def create_access_token(subject: str, expires_minutes: int | None = None) -> str
     return jwt.encode(payload, settings.jwt_secret, algorithm=settings.jwt_algorithm)
 
 
+def create_stream_token(subject: str) -> str:
+    # Only accepted by the event stream, where it travels in the URL (and so
+    # in access logs): short-lived and useless against the rest of the API.
+    settings = get_settings()
+    expire = datetime.now(timezone.utc) + timedelta(seconds=settings.stream_token_expires_seconds)
+    payload = {"sub": subject, "exp": expire, "scope": STREAM_SCOPE}
+    return jwt.encode(payload, settings.jwt_secret, algorithm=settings.jwt_algorithm)
+
+
 def decode_access_token(token: str) -> dict:
     settings = get_settings()
     return jwt.decode(token, settings.jwt_secret, algorithms=[settings.jwt_algorithm])
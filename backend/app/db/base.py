@@ -1,6 +1,9 @@
 from app.db.session import Base
 
+from app.models.import_job import ImportJob
+from app.models.invoice_parse_cache import InvoiceParseCache
 from app.models.order import Order
+from app.models.order_tombstone import OrderTombstone
 from app.models.user import User
 
-__all__ = ["Base", "Order", "User"]
+__all__ = ["Base", "ImportJob", "InvoiceParseCache", "Order", "OrderTombstone", "User"]
@@ -0,0 +1,60 @@
+import unicodedata
+
+from sqlalchemy import DDL, func, literal_column, select, table
+
+# Trigram indexes (pg_trgm, FTS5 trigram tokenizer) need at least three
+# characters; shorter terms fall back to a plain LIKE scan.
+TRIGRAM_MIN_LENGTH = 3
+
+SQLITE_SEARCH_DDL = [
+    DDL(
+        "CREATE VIRTUAL TABLE orders_search USING fts5("
+        "search_text, content='orders', content_rowid='rowid', tokenize='trigram')"
+    ),
+    DDL(
+        "CREATE TRIGGER orders_search_ai AFTER INSERT ON orders BEGIN "
+        "INSERT INTO orders_search(rowid, search_text) VALUES (new.rowid, new.search_text); END"
+    ),
+    DDL(
+        "CREATE TRIGGER orders_search_ad AFTER DELETE ON orders BEGIN "
+        "INSERT INTO orders_search(orders_search, rowid, search_text) "
+        "VALUES ('delete', old.rowid, old.search_text); END"
+    ),
+    DDL(
+        "CREATE TRIGGER orders_search_au AFTER UPDATE OF search_text ON orders BEGIN "
+        "INSERT INTO orders_search(orders_search, rowid, search_text) "
+        "VALUES ('delete', old.rowid, old.search_text); "
+        "INSERT INTO orders_search(rowid, search_text) VALUES (new.rowid, new.search_text); END"
+    ),
+]
+SQLITE_SEARCH_DROP_DDL = DDL("DROP TABLE IF EXISTS orders_search")
+# Migrations install it too; this covers metadata.create_all (benchmarks, load tests).
+POSTGRES_SEARCH_DDL = DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+
+def normalize_search_text(*parts: str | None) -> str:
+    text = " ".join(part for part in parts if part)
+    decomposed = unicodedata.normalize("NFKD", text)
+    stripped = "".join(char for char in decomposed if not unicodedata.combining(char))
+    return " ".join(stripped.casefold().split())
+
+
+def search_condition(column, q: str, dialect_name: str):
+    term = normalize_search_text(q)
+    if dialect_name == "sqlite" and len(term) >= TRIGRAM_MIN_LENGTH:
+        phrase = '"' + term.replace('"', '""') + '"'
+        matches = (
+            select(literal_column("rowid"))
+            .select_from(table("orders_search"))
+            .where(literal_column("orders_search").op("MATCH")(phrase))
+        )
+        return literal_column(f"{column.table.name}.rowid").in_(matches)
+    return column.contains(term, autoescape=True)
+
+
+def search_rank(column, q: str, dialect_name: str):
+    term = normalize_search_text(q)
+    if dialect_name == "postgresql":
+        return func.word_similarity(term, column)
+    # Earlier matches (invoice number, then client name) rank higher.
+    return -func.instr(column, term)
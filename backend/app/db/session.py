@@ -1,13 +1,75 @@
-from sqlalchemy import create_engine
+from sqlalchemy import DateTime, create_engine, make_url
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.orm import DeclarativeBase, sessionmaker
+from sqlalchemy.sql import functions
 
-from app.core.config import get_settings
+from app.core.config import Settings, get_settings
+from app.core.metrics import TimedAsyncAdaptedQueuePool, TimedQueuePool, instrument_engine
 
 
 class Base(DeclarativeBase):
     pass
 
 
+@compiles(functions.now, "sqlite")
+def _sqlite_now(element, compiler, **kw) -> str:
+    # CURRENT_TIMESTAMP only has second precision and a different text layout
+    # than bound datetimes, which breaks (updated_at, id) cursor comparisons.
+    return "strftime('%Y-%m-%d %H:%M:%f000', 'now')"
+
+
+class write_time(functions.FunctionElement):
+    type = DateTime(timezone=True)
+    inherit_cache = True
+
+
+@compiles(write_time)
+def _write_time(element, compiler, **kw) -> str:
+    return compiler.process(functions.now(), **kw)
+
+
+@compiles(write_time, "postgresql")
+def _postgresql_write_time(element, compiler, **kw) -> str:
+    # now() is the transaction start: a write committed after a newer one
+    # would carry an older timestamp and never move max(updated_at).
+    return "clock_timestamp()"
+
+
+ASYNC_DRIVERS = {"postgresql": "asyncpg", "sqlite": "aiosqlite"}
+
+
+def async_database_url(url: str) -> str:
+    parsed = make_url(url)
+    driver = ASYNC_DRIVERS[parsed.get_backend_name()]
+    return parsed.set(drivername=f"{parsed.get_backend_name()}+{driver}").render_as_string(
+        hide_password=False
+    )
+
+
+def engine_options(settings: Settings, is_async: bool = False) -> dict:
+    options = {"pool_pre_ping": settings.db_pool_pre_ping}
+    if make_url(settings.database_url).get_backend_name() != "sqlite":
+        options.update(
+            poolclass=TimedAsyncAdaptedQueuePool if is_async else TimedQueuePool,
+            pool_size=settings.db_pool_size,
+            max_overflow=settings.db_max_overflow,
+            pool_timeout=settings.db_pool_timeout_seconds,
+            pool_recycle=settings.db_pool_recycle_seconds,
+        )
+    return options
+
+
 settings = get_settings()
-engine = create_engine(settings.database_url, pool_pre_ping=True)
+# The sync engine serves the CLI, admin bootstrap, Alembic, background jobs
+# and the CPU-bound import routes; API routes use the async engine. Each
+# has its own pool sized by the db_pool_* settings.
+engine = create_engine(settings.database_url, **engine_options(settings))
 SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False)
+async_engine = create_async_engine(
+    settings.async_database_url or async_database_url(settings.database_url),
+    **engine_options(settings, is_async=True),
+)
+instrument_engine(engine)
+instrument_engine(async_engine.sync_engine)
+AsyncSessionLocal = async_sessionmaker(bind=async_engine, autoflush=False, expire_on_commit=False)
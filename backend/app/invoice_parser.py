@@ -1,113 +1,126 @@
 import io
 import logging
-import re
-from datetime import datetime
+import os
+from typing import Iterator
+
+from app.core.config import get_settings
+from app.services.invoice_fields import InvoiceFields, InvoiceFieldScanner, scan_invoice_text
 
 logger = logging.getLogger(__name__)
 
+# Bump when a parsing change makes previously cached results stale.
+PARSER_VERSION = 1
+
 
 class InvoiceParseError(Exception):
-    def __init__(self, code: str, message: str | None = None) -> None:
+    def __init__(self, code: str, message: str | None = None, backend: str | None = None) -> None:
         super().__init__(message or code)
         self.code = code
+        self.backend = backend
 
 
-def extract_pdf_text(pdf_bytes: bytes) -> str:
-    try:
-        import fitz
+# A PDF is given either as bytes or as a path; paths are opened from disk
+# without loading the whole file in memory first.
+PdfSource = bytes | str | os.PathLike
 
-        with fitz.open(stream=pdf_bytes, filetype="pdf") as doc:
-            return "\n".join(page.get_text("text") for page in doc)
-    except Exception:
-        try:
-            import pdfplumber
 
-            with pdfplumber.open(io.BytesIO(pdf_bytes)) as pdf:
-                return "\n".join(page.extract_text() or "" for page in pdf.pages)
-        except Exception as exc:  # pragma: no cover - defensive guard
-            raise InvoiceParseError("PDF_TEXT_EXTRACTION_FAILED") from exc
+def _fitz_pages(source: PdfSource, max_pages: int | None) -> Iterator[str]:
+    import fitz
 
+    if isinstance(source, bytes):
+        document = fitz.open(stream=source, filetype="pdf")
+    else:
+        document = fitz.open(source)
+    with document as doc:
+        for index, page in enumerate(doc):
+            if max_pages and index >= max_pages:
+                return
+            yield page.get_text("text")
 
-def _normalize_space(value: str) -> str:
-    return re.sub(r"\s+", " ", value).strip()
 
+def _pdfplumber_pages(source: PdfSource, max_pages: int | None) -> Iterator[str]:
+    import pdfplumber
 
-def parse_invoice_pdf(pdf_bytes: bytes) -> dict:
-    text = extract_pdf_text(pdf_bytes)
-    lines = [line.strip() for line in text.splitlines() if line.strip()]
+    with pdfplumber.open(io.BytesIO(source) if isinstance(source, bytes) else source) as pdf:
+        pages = pdf.pages[:max_pages] if max_pages else pdf.pages
+        for page in pages:
+            yield page.extract_text() or ""
 
-    invoice_match = re.search(r"Facture\s+N°\s*([0-9-]+)", text, re.MULTILINE)
-    if not invoice_match:
-        raise InvoiceParseError("MISSING_INVOICE_NUMBER")
-    invoice_number = invoice_match.group(1).strip()
 
-    date_match = re.search(
-        r"Date\s*:\s*([0-9]{2}/[0-9]{2}/[0-9]{4}),\s*([0-9]{2}:[0-9]{2}:[0-9]{2})",
-        text,
-    )
-    if not date_match:
-        raise InvoiceParseError("MISSING_SOLD_AT")
-    sold_at = datetime.strptime(
-        f"{date_match.group(1)} {date_match.group(2)}", "%d/%m/%Y %H:%M:%S"
-    ).isoformat()
+PDF_BACKENDS = (("fitz", _fitz_pages), ("pdfplumber", _pdfplumber_pages))
 
-    store = next(
-        (line for line in lines if re.search(r"DREAM STATION", line, re.IGNORECASE)),
-        None,
-    )
-    if not store:
-        raise InvoiceParseError("MISSING_STORE")
 
-    client_name = next(
-        (line for line in lines if re.match(r"^(Mme|M\.|Mr|Mlle)\s+", line)),
-        None,
-    )
-    if not client_name:
-        raise InvoiceParseError("MISSING_CLIENT")
+def extract_pdf_text(source: PdfSource) -> str:
+    for _, pages in PDF_BACKENDS:
+        try:
+            return "\n".join(pages(source, None))
+        except Exception as exc:
+            error = exc
+    raise InvoiceParseError("PDF_TEXT_EXTRACTION_FAILED") from error
 
-    product_candidates: list[str] = []
-    seen: set[str] = set()
-    component_keywords = (
-        "boitier",
-        "cpu",
-        "carte mere",
-        "carte mère",
-        "ram",
-        "ssd",
-        "ventirad",
-        "carte graphique",
-        "alimentation",
-    )
-    for line in lines:
-        if not re.search(r"(PACK COMPLET\s+)?PC\s+GAMER", line, re.IGNORECASE):
-            continue
-        cleaned = _normalize_space(line)
-        if any(keyword in cleaned.lower() for keyword in component_keywords):
-            continue
-        key = cleaned.lower()
-        if key in seen:
+
+def scan_pdf_fields(source: PdfSource, max_pages: int | None = None) -> tuple[InvoiceFields, str]:
+    # Pages are read lazily from the text layer only; reading stops as soon as
+    # every field is known. pdfplumber restarts from scratch if fitz fails.
+    for backend, pages in PDF_BACKENDS:
+        scanner = InvoiceFieldScanner()
+        try:
+            for text in pages(source, max_pages):
+                if scanner.feed(text.splitlines()):
+                    break
+        except Exception as exc:
+            logger.warning("PDF backend %s failed: %s", backend, exc)
+            error = exc
             continue
-        seen.add(key)
-        product_candidates.append(cleaned)
+        return scanner.fields, backend
+    raise InvoiceParseError("PDF_TEXT_EXTRACTION_FAILED") from error
 
-    if not product_candidates:
-        raise InvoiceParseError("MISSING_PRODUCT")
 
-    product_name = product_candidates[0]
+def _invoice_data(fields: InvoiceFields) -> dict:
+    if not fields.invoice_number:
+        raise InvoiceParseError("MISSING_INVOICE_NUMBER")
+    if not fields.sold_at:
+        raise InvoiceParseError("MISSING_SOLD_AT")
+    if not fields.store:
+        raise InvoiceParseError("MISSING_STORE")
+    if not fields.client_name:
+        raise InvoiceParseError("MISSING_CLIENT")
+    if not fields.product_name:
+        raise InvoiceParseError("MISSING_PRODUCT")
 
+    sold_at = fields.sold_at.isoformat()
     logger.info(
         "Invoice parse preview invoice=%s sold_at=%s store=%s client=%s product=%s",
-        invoice_number,
+        fields.invoice_number,
         sold_at,
-        store,
-        client_name,
-        product_name,
+        fields.store,
+        fields.client_name,
+        fields.product_name,
     )
 
     return {
-        "invoice_number": invoice_number,
+        "invoice_number": fields.invoice_number,
         "sold_at": sold_at,
-        "store": store,
-        "client_name": client_name,
-        "product_name": product_name,
+        "store": fields.store,
+        "client_name": fields.client_name,
+        "product_name": fields.product_name,
     }
+
+
+def parse_invoice_text(text: str) -> dict:
+    return _invoice_data(scan_invoice_text(text))
+
+
+def parse_invoice_pdf(source: PdfSource) -> dict:
+    settings = get_settings()
+    size = len(source) if isinstance(source, bytes) else os.path.getsize(source)
+    if settings.pdf_max_bytes and size > settings.pdf_max_bytes:
+        raise InvoiceParseError("PDF_TOO_LARGE")
+    fields, backend = scan_pdf_fields(source, settings.pdf_max_pages)
+    try:
+        data = _invoice_data(fields)
+    except InvoiceParseError as exc:
+        exc.backend = backend
+        raise
+    logger.info("Invoice %s extracted with %s", data["invoice_number"], backend)
+    return {**data, "backend": backend}
@@ -1,12 +1,34 @@
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, PlainTextResponse
 
 from app.api.router import api_router
 from app.core.config import get_settings
+from app.core.limits import BodySizeLimitMiddleware
+from app.core.metrics import RequestMetricsMiddleware, registry
+from app.core.security import shutdown_hash_executor
+from app.db.session import async_engine, engine
+from app.services.events import start_event_bridge, stop_event_bridge
+from app.services.import_jobs import job_runner
+from app.services.uploads import UploadTooLarge
 
 settings = get_settings()
 
-app = FastAPI(title=settings.app_name)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    start_event_bridge(engine)
+    job_runner.start()
+    yield
+    job_runner.shutdown()
+    shutdown_hash_executor()
+    stop_event_bridge()
+    await async_engine.dispose()
+
+
+app = FastAPI(title=settings.app_name, lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -14,11 +36,35 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"] ,
     allow_headers=["*"],
+    expose_headers=[
+        "ETag",
+        "X-Next-Cursor",
+        "X-Total-Count",
+        "X-Total-Count-Estimated",
+        "Server-Timing",
+    ],
+)
+app.add_middleware(RequestMetricsMiddleware)
+
+app.add_middleware(
+    BodySizeLimitMiddleware,
+    max_bytes=settings.upload_max_request_bytes,
+    path_prefix="/api/import",
 )
 
 app.include_router(api_router)
 
 
+@app.exception_handler(UploadTooLarge)
+def upload_too_large(request: Request, exc: UploadTooLarge) -> JSONResponse:
+    return JSONResponse(status_code=413, content={"detail": f"File too large: {exc.filename}"})
+
+
 @app.get("/health")
 def health() -> dict:
     return {"status": "ok"}
+
+
+@app.get("/metrics", include_in_schema=False)
+def metrics() -> PlainTextResponse:
+    return PlainTextResponse(registry.render(), media_type="text/plain; version=0.0.4")
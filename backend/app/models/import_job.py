@@ -0,0 +1,35 @@
+import enum
+import uuid
+
+from sqlalchemy import Column, DateTime, Enum, ForeignKey, LargeBinary, String, Uuid
+from sqlalchemy.sql import func
+
+from app.db.session import Base
+
+
+class ImportJobStatus(str, enum.Enum):
+    QUEUED = "QUEUED"
+    RUNNING = "RUNNING"
+    DONE = "DONE"
+    FAILED = "FAILED"
+
+
+class ImportJob(Base):
+    __tablename__ = "import_jobs"
+
+    id = Column(Uuid(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    filename = Column(String, nullable=False)
+    status = Column(
+        Enum(ImportJobStatus, name="import_job_status"),
+        nullable=False,
+        default=ImportJobStatus.QUEUED,
+        index=True,
+    )
+    payload = Column(LargeBinary, nullable=True)
+    result = Column(String, nullable=True)
+    error_code = Column(String, nullable=True)
+    order_id = Column(Uuid(as_uuid=True), ForeignKey("orders.id", ondelete="SET NULL"), nullable=True)
+    created_by = Column(Uuid(as_uuid=True), ForeignKey("users.id"), nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    started_at = Column(DateTime(timezone=True), nullable=True)
+    finished_at = Column(DateTime(timezone=True), nullable=True)
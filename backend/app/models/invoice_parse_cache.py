@@ -0,0 +1,16 @@
+from sqlalchemy import JSON, Column, DateTime, String
+from sqlalchemy.sql import func
+
+from app.db.session import Base
+
+
+class InvoiceParseCache(Base):
+    __tablename__ = "invoice_parse_cache"
+
+    sha256 = Column(String(64), primary_key=True)
+    parser_version = Column(String, nullable=False)
+    data = Column(JSON, nullable=True)
+    error_code = Column(String, nullable=True)
+    backend = Column(String, nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    last_used_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False, index=True)
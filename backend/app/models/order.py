@@ -1,26 +1,97 @@
 import uuid
 
-from sqlalchemy import Boolean, Column, DateTime, ForeignKey, String, Uuid
+from sqlalchemy import (
+    Boolean,
+    Column,
+    DateTime,
+    ForeignKey,
+    Index,
+    String,
+    Uuid,
+    and_,
+    event,
+    false,
+    inspect,
+    literal_column,
+    or_,
+)
 from sqlalchemy.sql import func
 
-from app.db.session import Base
+from app.db.search import (
+    POSTGRES_SEARCH_DDL,
+    SQLITE_SEARCH_DDL,
+    SQLITE_SEARCH_DROP_DDL,
+    normalize_search_text,
+)
+from app.db.session import Base, write_time
+
+SEARCH_FIELDS = ("invoice_number", "client_name", "product_name", "store")
+
+
+def _default_search_text(context) -> str:
+    params = context.get_current_parameters()
+    return normalize_search_text(*(params.get(name) for name in SEARCH_FIELDS))
 
 
 class Order(Base):
     __tablename__ = "orders"
 
     id = Column(Uuid(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    invoice_number = Column(String, unique=True, nullable=False, index=True)
+    invoice_number = Column(String, unique=True, nullable=False)
     store = Column(String, nullable=True)
     client_name = Column(String, nullable=False)
     product_name = Column(String, nullable=False)
     sold_at = Column(DateTime(timezone=True), nullable=False)
-    prepared = Column(Boolean, nullable=False, server_default="false")
-    built = Column(Boolean, nullable=False, server_default="false")
-    delivered = Column(Boolean, nullable=False, server_default="false")
+    prepared = Column(Boolean, nullable=False, server_default=false())
+    built = Column(Boolean, nullable=False, server_default=false())
+    delivered = Column(Boolean, nullable=False, server_default=false())
     status = Column(String, nullable=True)
     created_by = Column(Uuid(as_uuid=True), ForeignKey("users.id"), nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at = Column(
-        DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False
+        DateTime(timezone=True), server_default=write_time(), onupdate=write_time(), nullable=False
+    )
+    search_text = Column(String, nullable=False, default=_default_search_text, server_default="")
+
+
+@event.listens_for(Order, "before_update")
+def _refresh_search_text(mapper, connection, target) -> None:
+    state = inspect(target)
+    if not any(state.attrs[name].history.has_changes() for name in SEARCH_FIELDS):
+        return
+    target.search_text = normalize_search_text(*(getattr(target, name) for name in SEARCH_FIELDS))
+
+
+# The status literal is inlined so the planner can match these predicates
+# against the partial indexes below.
+_NOT_GIVEN = or_(Order.status.is_(None), Order.status != literal_column("'DEJA DONNER'"))
+
+ORDER_VIEW_FILTERS = {
+    "to_prepare": and_(Order.prepared.is_(False), _NOT_GIVEN),
+    "to_build": and_(Order.prepared.is_(True), Order.built.is_(False), _NOT_GIVEN),
+    "to_deliver": and_(Order.built.is_(True), Order.delivered.is_(False)),
+    "done": Order.delivered.is_(True),
+}
+
+Index("ix_orders_sold_at_id", Order.sold_at.desc(), Order.id.desc())
+Index("ix_orders_updated_at_id", Order.updated_at, Order.id)
+for _view, _predicate in ORDER_VIEW_FILTERS.items():
+    Index(
+        f"ix_orders_{_view}",
+        Order.sold_at.desc(),
+        Order.id.desc(),
+        postgresql_where=_predicate,
+        sqlite_where=_predicate,
     )
+
+Index(
+    "ix_orders_search_text_trgm",
+    Order.search_text,
+    postgresql_using="gin",
+    postgresql_ops={"search_text": "gin_trgm_ops"},
+).ddl_if(dialect="postgresql")
+
+for _ddl in SQLITE_SEARCH_DDL:
+    event.listen(Order.__table__, "after_create", _ddl.execute_if(dialect="sqlite"))
+event.listen(Order.__table__, "before_drop", SQLITE_SEARCH_DROP_DDL.execute_if(dialect="sqlite"))
+event.listen(Order.__table__, "before_create", POSTGRES_SEARCH_DDL.execute_if(dialect="postgresql"))
@@ -0,0 +1,10 @@
+from sqlalchemy import Column, DateTime, String, Uuid
+from app.db.session import Base, write_time
+
+
+class OrderTombstone(Base):
+    __tablename__ = "order_tombstones"
+
+    order_id = Column(Uuid(as_uuid=True), primary_key=True)
+    invoice_number = Column(String, nullable=False)
+    deleted_at = Column(DateTime(timezone=True), server_default=write_time(), nullable=False, index=True)
@@ -1,9 +1,30 @@
+import uuid
+from datetime import datetime
+
 from pydantic import BaseModel
 
+from app.models.import_job import ImportJobStatus
 from app.schemas.order import OrderOut
 
 
 class ImportResult(BaseModel):
+    filename: str | None = None
     status: str
+    backend: str | None = None
     order: OrderOut | None = None
     errors: dict[str, str] | None = None
+
+
+class ImportJobOut(BaseModel):
+    id: uuid.UUID
+    filename: str
+    status: ImportJobStatus
+    result: str | None = None
+    error_code: str | None = None
+    order: OrderOut | None = None
+    created_at: datetime
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
+
+    class Config:
+        from_attributes = True
@@ -1,5 +1,5 @@
 import uuid
-from datetime import datetime
+from datetime import date, datetime
 
 from pydantic import BaseModel
 
@@ -27,6 +27,10 @@ class OrderPatch(BaseModel):
     status: str | None = None
 
 
+class OrderBulkPatchItem(OrderPatch):
+    id: uuid.UUID
+
+
 class OrderOut(OrderBase):
     id: uuid.UUID
     created_by: uuid.UUID | None = None
@@ -35,3 +39,40 @@ class OrderOut(OrderBase):
 
     class Config:
         from_attributes = True
+
+
+class OrderCounts(BaseModel):
+    total: int = 0
+    to_prepare: int = 0
+    to_build: int = 0
+    to_deliver: int = 0
+    done: int = 0
+
+
+class StoreOrderCounts(OrderCounts):
+    store: str | None = None
+
+
+class DayOrderCounts(OrderCounts):
+    day: date
+
+
+class OrderStats(BaseModel):
+    totals: OrderCounts
+    stores: list[StoreOrderCounts]
+    days: list[DayOrderCounts]
+
+
+class OrderChanges(BaseModel):
+    orders: list[OrderOut]
+    deleted: list[uuid.UUID]
+    cursor: str | None = None
+    has_more: bool = False
+    reset: bool = False
+
+
+class OrderBulkPatchResult(BaseModel):
+    id: uuid.UUID
+    status: str
+    detail: str | None = None
+    order: OrderOut | None = None
@@ -0,0 +1,17 @@
+import logging
+
+from alembic import command
+from alembic.config import Config
+
+from app.core.admin import create_default_admin_if_missing
+
+
+def main() -> None:
+    # Runs once per container, before the server forks its workers.
+    logging.basicConfig(level=logging.INFO)
+    command.upgrade(Config("alembic.ini"), "head")
+    create_default_admin_if_missing()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+import multiprocessing
+import os
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Iterator
+
+from sqlalchemy import insert, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.models.order import Order
+from app.services.invoice_import import ParsedInvoice, order_row, parse_invoice_safe
+
+
+@dataclass
+class ArchiveImportStats:
+    files: int = 0
+    created: int = 0
+    already_exists: int = 0
+    # Files finished by an earlier run, according to the checkpoint.
+    resumed: int = 0
+    errors: Counter = field(default_factory=Counter)
+    started_at: float = field(default_factory=time.perf_counter)
+
+    @property
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started_at
+
+    @property
+    def files_per_second(self) -> float:
+        return self.files / max(self.elapsed, 1e-9)
+
+
+class Checkpoint:
+    # Append-only list of finished files, relative to the imported directory.
+    # A file is only recorded once the chunk holding its order is committed.
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.done: set[str] = set()
+        if path.exists():
+            self.done = {line for line in path.read_text().splitlines() if line}
+
+    def record(self, names: list[str]) -> None:
+        if not names:
+            return
+        with self.path.open("a") as handle:
+            handle.writelines(f"{name}\n" for name in names)
+            handle.flush()
+            os.fsync(handle.fileno())
+        self.done.update(names)
+
+
+def iter_pdf_paths(root: Path) -> Iterator[Path]:
+    for directory, dirnames, filenames in os.walk(root):
+        dirnames.sort()
+        for name in sorted(filenames):
+            if name.lower().endswith(".pdf"):
+                yield Path(directory, name)
+
+
+def _parse_path(path: str) -> ParsedInvoice:
+    return parse_invoice_safe(path, path)
+
+
+def _insert_orders(db: Session, rows: list[dict]) -> int:
+    try:
+        db.execute(insert(Order), rows)
+        db.commit()
+        return len(rows)
+    except IntegrityError:
+        # The API imported some of these invoices since the preload.
+        db.rollback()
+    numbers = [row["invoice_number"] for row in rows]
+    taken = set(db.scalars(select(Order.invoice_number).where(Order.invoice_number.in_(numbers))))
+    fresh = [row for row in rows if row["invoice_number"] not in taken]
+    if fresh:
+        db.execute(insert(Order), fresh)
+        db.commit()
+    return len(fresh)
+
+
+def import_directory(
+    db: Session,
+    root: Path,
+    checkpoint: Checkpoint,
+    workers: int | None = None,
+    chunk_size: int = 1000,
+    progress: Callable[[ArchiveImportStats], None] | None = None,
+) -> ArchiveImportStats:
+    stats = ArchiveImportStats()
+    known = set(db.scalars(select(Order.invoice_number)))
+    pending: dict[str, str] = {}
+    for path in iter_pdf_paths(root):
+        name = path.relative_to(root).as_posix()
+        if name in checkpoint.done:
+            stats.resumed += 1
+        else:
+            pending[str(path)] = name
+
+    rows: list[dict] = []
+    finished: list[str] = []
+
+    def flush() -> None:
+        if not finished:
+            return
+        if rows:
+            created = _insert_orders(db, rows)
+            stats.created += created
+            stats.already_exists += len(rows) - created
+        checkpoint.record(finished)
+        rows.clear()
+        finished.clear()
+        if progress:
+            progress(stats)
+
+    with multiprocessing.Pool(workers) as pool:
+        for parsed in pool.imap_unordered(_parse_path, pending, chunksize=8):
+            stats.files += 1
+            finished.append(pending[parsed.filename])
+            if parsed.data is None:
+                stats.errors[parsed.error_code] += 1
+            elif parsed.data["invoice_number"] in known:
+                stats.already_exists += 1
+            else:
+                known.add(parsed.data["invoice_number"])
+                rows.append(order_row(parsed.data, None))
+            if len(finished) >= chunk_size:
+                flush()
+        flush()
+    return stats
@@ -0,0 +1,265 @@
+import asyncio
+import json
+import logging
+import select
+import threading
+import time
+import uuid
+from collections import deque
+from dataclasses import dataclass, field
+
+from sqlalchemy import bindparam, text
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.types import Text
+from starlette.concurrency import run_in_threadpool
+
+from app.core.config import get_settings
+from app.schemas.order import OrderOut
+
+logger = logging.getLogger(__name__)
+
+NOTIFY_CHANNEL = "order_events"
+NOTIFY_STATEMENT = text(
+    "SELECT pg_notify(:channel, payload) FROM unnest(:payloads) WITH ORDINALITY AS p(payload, n) "
+    "ORDER BY n"
+).bindparams(bindparam("payloads", type_=ARRAY(Text)))
+# Cache invalidations ride the same fan-out to every worker but only reach
+# listeners: they are neither kept for resume nor streamed to clients.
+CONTROL_EVENTS = {"user_invalidated"}
+
+
+@dataclass(frozen=True)
+class OrderEvent:
+    token: str
+    type: str
+    data: dict
+
+
+@dataclass(eq=False)
+class Subscription:
+    loop: asyncio.AbstractEventLoop
+    queue: asyncio.Queue
+    backlog: list[OrderEvent] = field(default_factory=list)
+    reset: bool = False
+    overflowed: bool = False
+
+    def deliver(self, event: OrderEvent) -> None:
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            # The client is too slow; it will reconnect and resume from its last token.
+            self.overflowed = True
+
+
+class OrderEventBroker:
+    def __init__(self, history_size: int = 1000, queue_size: int = 1000) -> None:
+        # Resume tokens embed the broker id so a token from another process
+        # (or from before a restart) is detected instead of silently skipped.
+        self.broker_id = uuid.uuid4().hex[:12]
+        self.queue_size = queue_size
+        self._history: deque[tuple[int, OrderEvent]] = deque(maxlen=history_size)
+        self._next_seq = 1
+        self._subscribers: set[Subscription] = set()
+        self._listeners: list = []
+        self._lock = threading.Lock()
+
+    def reset_after_fork(self) -> None:
+        # A forked worker must not share its parent's identity: sequences are
+        # counted per process, so another process's tokens have to be refused.
+        self.broker_id = uuid.uuid4().hex[:12]
+        self._history.clear()
+        self._next_seq = 1
+        self._subscribers = set()
+        self._lock = threading.Lock()
+
+    def add_listener(self, listener) -> None:
+        # Synchronous callbacks run on every published event, whichever worker wrote it.
+        self._listeners.append(listener)
+
+    def publish(self, event_type: str, data: dict) -> OrderEvent:
+        if event_type in CONTROL_EVENTS:
+            event = OrderEvent(token="", type=event_type, data=data)
+            self._notify_listeners(event)
+            return event
+        with self._lock:
+            seq = self._next_seq
+            self._next_seq += 1
+            event = OrderEvent(token=f"{self.broker_id}-{seq}", type=event_type, data=data)
+            self._history.append((seq, event))
+            subscribers = list(self._subscribers)
+        self._notify_listeners(event)
+        for subscription in subscribers:
+            try:
+                subscription.loop.call_soon_threadsafe(subscription.deliver, event)
+            except RuntimeError:
+                self.unsubscribe(subscription)
+        return event
+
+    def _notify_listeners(self, event: OrderEvent) -> None:
+        for listener in self._listeners:
+            try:
+                listener(event)
+            except Exception:
+                logger.exception("Order event listener failed")
+
+    def _resume_seq(self, last_token: str | None) -> int | None:
+        if not last_token:
+            return None
+        broker_id, _, seq = last_token.rpartition("-")
+        if broker_id != self.broker_id or not seq.isdigit():
+            return -1
+        return int(seq)
+
+    def subscribe(self, last_token: str | None = None) -> Subscription:
+        subscription = Subscription(
+            loop=asyncio.get_running_loop(), queue=asyncio.Queue(maxsize=self.queue_size)
+        )
+        with self._lock:
+            resume = self._resume_seq(last_token)
+            if resume is not None:
+                oldest = self._history[0][0] if self._history else self._next_seq
+                if resume < 0 or resume + 1 < oldest or resume >= self._next_seq:
+                    subscription.reset = True
+                else:
+                    subscription.backlog = [event for seq, event in self._history if seq > resume]
+            self._subscribers.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            self._subscribers.discard(subscription)
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+
+class PostgresNotifyBridge:
+    # Fans events out across API workers: every worker LISTENs and feeds its
+    # local broker, publishers only NOTIFY.
+    def __init__(self, broker: OrderEventBroker, engine) -> None:
+        self.broker = broker
+        self.engine = engine
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._listen, name="order-events", daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=10)
+            self._thread = None
+
+    def publish(self, events: list[tuple[str, dict]]) -> None:
+        # One statement for the whole batch: a 500-invoice import is a single
+        # round trip, and the notifications are delivered together on commit.
+        payloads = [json.dumps({"type": event_type, "data": data}) for event_type, data in events]
+        with self.engine.connect() as connection:
+            connection.execute(NOTIFY_STATEMENT, {"channel": NOTIFY_CHANNEL, "payloads": payloads})
+            connection.commit()
+
+    def _listen(self) -> None:
+        first_attempt = True
+        while not self._stop.is_set():
+            try:
+                raw = self.engine.raw_connection()
+            except Exception:
+                logger.exception("Order events listener cannot connect")
+                self._stop.wait(5)
+                continue
+            try:
+                connection = raw.driver_connection
+                connection.autocommit = True
+                with connection.cursor() as cursor:
+                    cursor.execute(f"LISTEN {NOTIFY_CHANNEL}")
+                if not first_attempt:
+                    # Notifications sent while disconnected are lost.
+                    self.broker.publish("reset", {})
+                first_attempt = False
+                while not self._stop.is_set():
+                    if select.select([connection], [], [], 5) == ([], [], []):
+                        continue
+                    connection.poll()
+                    while connection.notifies:
+                        notify = connection.notifies.pop(0)
+                        message = json.loads(notify.payload)
+                        self.broker.publish(message["type"], message["data"])
+            except Exception:
+                logger.exception("Order events listener failed, reconnecting")
+                time.sleep(1)
+            finally:
+                raw.close()
+
+
+settings = get_settings()
+broker = OrderEventBroker(history_size=settings.events_history_size)
+_bridge: PostgresNotifyBridge | None = None
+
+
+def start_event_bridge(engine) -> None:
+    global _bridge
+    if get_settings().events_backend == "postgres" and _bridge is None:
+        _bridge = PostgresNotifyBridge(broker, engine)
+        _bridge.start()
+
+
+def stop_event_bridge() -> None:
+    global _bridge
+    if _bridge is not None:
+        _bridge.stop()
+        _bridge = None
+
+
+def publish_order_events(events: list[tuple[str, dict]]) -> None:
+    if not events:
+        return
+    if _bridge is not None:
+        try:
+            _bridge.publish(events)
+            return
+        except Exception:
+            logger.exception("NOTIFY failed, delivering order events locally only")
+    for event_type, data in events:
+        broker.publish(event_type, data)
+
+
+def publish_order_event(event_type: str, data: dict) -> None:
+    publish_order_events([(event_type, data)])
+
+
+async def publish_order_event_async(event_type: str, data: dict) -> None:
+    # NOTIFY goes through the sync engine, so keep it off the event loop.
+    if _bridge is not None:
+        await run_in_threadpool(publish_order_event, event_type, data)
+    else:
+        broker.publish(event_type, data)
+
+
+def order_payload(order) -> dict:
+    return OrderOut.model_validate(order).model_dump(mode="json")
+
+
+def format_sse(event: OrderEvent) -> str:
+    return f"id: {event.token}\nevent: {event.type}\ndata: {json.dumps(event.data)}\n\n"
+
+
+async def order_event_stream(subscription: Subscription, is_disconnected, keepalive: float = 15):
+    yield "retry: 3000\n\n"
+    if subscription.reset:
+        yield "event: reset\ndata: {}\n\n"
+    for event in subscription.backlog:
+        yield format_sse(event)
+    while not subscription.overflowed:
+        try:
+            event = await asyncio.wait_for(subscription.queue.get(), timeout=keepalive)
+        except asyncio.TimeoutError:
+            if await is_disconnected():
+                return
+            yield ": keep-alive\n\n"
+            continue
+        yield format_sse(event)
@@ -0,0 +1,165 @@
+import logging
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import select, update
+
+from app.core.config import get_settings
+from app.core.processes import process_context
+from app.db.session import SessionLocal
+from app.models.import_job import ImportJob, ImportJobStatus
+from app.services.invoice_import import ParsedInvoice, import_parsed_invoices, parse_invoice_safe
+from app.services.parse_cache import parse_cached
+
+logger = logging.getLogger(__name__)
+
+
+def _parse_in_child(conn, payload: bytes, filename: str) -> None:
+    try:
+        conn.send(parse_invoice_safe(payload, filename))
+    finally:
+        conn.close()
+
+
+def parse_with_timeout(payload: bytes, timeout: float, filename: str = "") -> ParsedInvoice:
+    # One short-lived process per job so a pathological PDF can be killed
+    # without taking a shared pool down with it.
+    recv_conn, send_conn = process_context.Pipe(duplex=False)
+    process = process_context.Process(
+        target=_parse_in_child, args=(send_conn, payload, filename), daemon=True
+    )
+    started_at = time.perf_counter()
+    process.start()
+    send_conn.close()
+    try:
+        if not recv_conn.poll(timeout):
+            process.terminate()
+            return ParsedInvoice(
+                filename=filename,
+                error_code="PARSE_TIMEOUT",
+                duration=time.perf_counter() - started_at,
+            )
+        try:
+            return recv_conn.recv()
+        except EOFError:
+            return ParsedInvoice(filename=filename, error_code="PARSE_WORKER_CRASHED")
+    finally:
+        recv_conn.close()
+        process.join(1)
+        if process.is_alive():
+            process.kill()
+            process.join()
+
+
+class ImportJobRunner:
+    def __init__(self) -> None:
+        self.session_factory = SessionLocal
+        self._executor: ThreadPoolExecutor | None = None
+        self._lock = threading.Lock()
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                settings = get_settings()
+                self._executor = ThreadPoolExecutor(
+                    max_workers=max(1, settings.import_job_concurrency),
+                    thread_name_prefix="import-job",
+                )
+            return self._executor
+
+    def start(self) -> None:
+        settings = get_settings()
+        stale_before = datetime.now(timezone.utc) - timedelta(
+            seconds=settings.import_job_timeout_seconds * 2
+        )
+        db = self.session_factory()
+        try:
+            # Jobs left RUNNING by a worker that died are handed back to the queue.
+            db.execute(
+                update(ImportJob)
+                .where(
+                    ImportJob.status == ImportJobStatus.RUNNING,
+                    ImportJob.started_at < stale_before,
+                )
+                .values(status=ImportJobStatus.QUEUED, started_at=None)
+            )
+            db.commit()
+            pending = db.scalars(
+                select(ImportJob.id)
+                .where(ImportJob.status == ImportJobStatus.QUEUED)
+                .order_by(ImportJob.created_at)
+            ).all()
+        finally:
+            db.close()
+        for job_id in pending:
+            self.submit(job_id)
+
+    def shutdown(self) -> None:
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+
+    def submit(self, job_id: uuid.UUID) -> None:
+        self._get_executor().submit(self._run, job_id)
+
+    def _claim(self, db, job_id: uuid.UUID) -> bytes | None:
+        claimed = db.execute(
+            update(ImportJob)
+            .where(ImportJob.id == job_id, ImportJob.status == ImportJobStatus.QUEUED)
+            .values(status=ImportJobStatus.RUNNING, started_at=datetime.now(timezone.utc))
+        )
+        db.commit()
+        if claimed.rowcount != 1:
+            return None
+        return db.scalar(select(ImportJob.payload).where(ImportJob.id == job_id))
+
+    def _run(self, job_id: uuid.UUID) -> None:
+        settings = get_settings()
+        db = self.session_factory()
+        try:
+            payload = self._claim(db, job_id)
+            if payload is None:
+                return
+
+            job = db.get(ImportJob, job_id)
+            parsed = parse_cached(
+                db,
+                [(job.filename, payload)],
+                lambda files: [
+                    parse_with_timeout(content, settings.import_job_timeout_seconds, filename)
+                    for filename, content in files
+                ],
+            )[0]
+            result = import_parsed_invoices(db, [parsed], job.created_by)[0]
+
+            job = db.get(ImportJob, job_id)
+            job.status = ImportJobStatus.FAILED if result.status == "error" else ImportJobStatus.DONE
+            job.result = result.status
+            job.error_code = parsed.error_code
+            job.order_id = result.order.id if result.order else None
+            job.payload = None
+            job.finished_at = datetime.now(timezone.utc)
+            db.commit()
+        except Exception:
+            logger.exception("Import job %s failed", job_id)
+            db.rollback()
+            db.execute(
+                update(ImportJob)
+                .where(ImportJob.id == job_id)
+                .values(
+                    status=ImportJobStatus.FAILED,
+                    error_code="INTERNAL_ERROR",
+                    payload=None,
+                    finished_at=datetime.now(timezone.utc),
+                )
+            )
+            db.commit()
+        finally:
+            db.close()
+
+
+job_runner = ImportJobRunner()
@@ -0,0 +1,112 @@
+import re
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Iterable
+
+INVOICE_NUMBER_RE = re.compile(r"Facture\s+N°\s*([0-9-]+)")
+SOLD_AT_RE = re.compile(
+    r"Date\s*:\s*([0-9]{2}/[0-9]{2}/[0-9]{4}),\s*([0-9]{2}:[0-9]{2}:[0-9]{2})"
+)
+STORE_RE = re.compile(r"DREAM STATION", re.IGNORECASE)
+CLIENT_RE = re.compile(r"(?:Mme|M\.|Mr|Mlle)\s+")
+PRODUCT_RE = re.compile(r"(?:PACK COMPLET\s+)?PC\s+GAMER", re.IGNORECASE)
+WHITESPACE_RE = re.compile(r"\s+")
+
+COMPONENT_KEYWORDS = (
+    "boitier",
+    "cpu",
+    "carte mere",
+    "carte mère",
+    "ram",
+    "ssd",
+    "ventirad",
+    "carte graphique",
+    "alimentation",
+)
+
+
+@dataclass
+class InvoiceFields:
+    invoice_number: str | None = None
+    sold_at: datetime | None = None
+    store: str | None = None
+    client_name: str | None = None
+    product_name: str | None = None
+    # First "PC GAMER" line even when it looks like a component line.
+    any_product: str | None = None
+
+
+class InvoiceFieldScanner:
+    # Walks the invoice lines once and stops as soon as every field is known.
+    # Labels split over two consecutive lines ("Facture N°" / "02-...") are
+    # still matched, as the former whole-text searches did.
+
+    def __init__(self, product_exclusions: Iterable[str] = COMPONENT_KEYWORDS) -> None:
+        self.fields = InvoiceFields()
+        self._exclusions = re.compile("|".join(re.escape(word) for word in product_exclusions))
+        self._previous = ""
+
+    @property
+    def complete(self) -> bool:
+        fields = self.fields
+        return (
+            fields.invoice_number is not None
+            and fields.sold_at is not None
+            and fields.store is not None
+            and fields.client_name is not None
+            and fields.product_name is not None
+        )
+
+    def feed(self, lines: Iterable[str]) -> bool:
+        for raw_line in lines:
+            line = raw_line.strip()
+            if not line:
+                continue
+            self._scan(line)
+            if self.complete:
+                return True
+        return False
+
+    def _search(self, pattern: re.Pattern, line: str) -> re.Match | None:
+        return pattern.search(line) or (
+            pattern.search(f"{self._previous}\n{line}") if self._previous else None
+        )
+
+    def _scan(self, line: str) -> None:
+        fields = self.fields
+
+        if fields.invoice_number is None:
+            match = self._search(INVOICE_NUMBER_RE, line)
+            if match:
+                fields.invoice_number = match.group(1).strip()
+
+        if fields.sold_at is None:
+            match = self._search(SOLD_AT_RE, line)
+            if match:
+                try:
+                    fields.sold_at = datetime.strptime(
+                        f"{match.group(1)} {match.group(2)}", "%d/%m/%Y %H:%M:%S"
+                    )
+                except ValueError:
+                    pass
+
+        if fields.store is None and STORE_RE.search(line):
+            fields.store = line
+
+        if fields.client_name is None and CLIENT_RE.match(line):
+            fields.client_name = line
+
+        if fields.product_name is None and PRODUCT_RE.search(line):
+            cleaned = WHITESPACE_RE.sub(" ", line)
+            if fields.any_product is None:
+                fields.any_product = cleaned
+            if not self._exclusions.search(cleaned.lower()):
+                fields.product_name = cleaned
+
+        self._previous = line
+
+
+def scan_invoice_text(text: str, product_exclusions: Iterable[str] = COMPONENT_KEYWORDS) -> InvoiceFields:
+    scanner = InvoiceFieldScanner(product_exclusions)
+    scanner.feed(text.splitlines())
+    return scanner.fields
@@ -0,0 +1,181 @@
+import logging
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from datetime import datetime
+
+from sqlalchemy import insert, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.core.config import get_settings
+from app.core.metrics import INVOICE_PARSE_DURATION
+from app.core.processes import process_context
+from app.invoice_parser import InvoiceParseError, PdfSource, parse_invoice_pdf
+from app.models.order import Order
+from app.schemas.imports import ImportResult
+from app.schemas.order import OrderOut
+from app.services.events import order_payload, publish_order_events
+
+logger = logging.getLogger(__name__)
+
+_executor: ProcessPoolExecutor | None = None
+
+
+@dataclass
+class ParsedInvoice:
+    filename: str
+    data: dict | None = None
+    error_code: str | None = None
+    backend: str | None = None
+    # Measured in the worker; recorded by the parent, which owns the metrics.
+    duration: float | None = None
+
+
+def _get_executor() -> ProcessPoolExecutor:
+    global _executor
+    if _executor is None:
+        settings = get_settings()
+        _executor = ProcessPoolExecutor(
+            max_workers=settings.import_workers or None, mp_context=process_context
+        )
+    return _executor
+
+
+def _reset_executor() -> None:
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
+
+
+def parse_invoice_safe(source: PdfSource, filename: str = "") -> ParsedInvoice:
+    started_at = time.perf_counter()
+    try:
+        data = parse_invoice_pdf(source)
+    except InvoiceParseError as exc:
+        return ParsedInvoice(
+            filename=filename,
+            error_code=exc.code,
+            backend=exc.backend,
+            duration=time.perf_counter() - started_at,
+        )
+    return ParsedInvoice(
+        filename=filename,
+        data=data,
+        backend=data.pop("backend"),
+        duration=time.perf_counter() - started_at,
+    )
+
+
+def parse_invoices(files: list[tuple[str, PdfSource]]) -> list[ParsedInvoice]:
+    if len(files) <= 1:
+        return [parse_invoice_safe(source, filename) for filename, source in files]
+    filenames = [filename for filename, _ in files]
+    try:
+        return list(
+            _get_executor().map(parse_invoice_safe, [source for _, source in files], filenames)
+        )
+    except BrokenProcessPool:
+        _reset_executor()
+        return [
+            ParsedInvoice(filename=filename, error_code="PARSE_WORKER_CRASHED")
+            for filename in filenames
+        ]
+
+
+def order_row(data: dict, created_by) -> dict:
+    return {
+        "invoice_number": data["invoice_number"],
+        "store": data["store"],
+        "client_name": data["client_name"],
+        "product_name": data["product_name"],
+        "sold_at": datetime.fromisoformat(data["sold_at"]),
+        "created_by": created_by,
+    }
+
+
+def _existing_orders(db: Session, invoice_numbers: set[str]) -> dict[str, OrderOut]:
+    if not invoice_numbers:
+        return {}
+    orders = db.scalars(select(Order).where(Order.invoice_number.in_(invoice_numbers)))
+    return {order.invoice_number: OrderOut.model_validate(order) for order in orders}
+
+
+def import_parsed_invoices(
+    db: Session, parsed: list[ParsedInvoice], created_by
+) -> list[ImportResult]:
+    invoice_numbers = {item.data["invoice_number"] for item in parsed if item.data}
+    for item in parsed:
+        if item.duration is not None:
+            INVOICE_PARSE_DURATION.observe(
+                item.duration, backend=item.backend or "none", code=item.error_code or "OK"
+            )
+        if item.backend == "pdfplumber":
+            logger.warning("Invoice %s extracted with fallback %s", item.filename, item.backend)
+
+    for attempt in range(2):
+        existing = _existing_orders(db, invoice_numbers)
+        rows: dict[str, dict] = {}
+        for item in parsed:
+            if item.data is None:
+                continue
+            number = item.data["invoice_number"]
+            if number not in existing and number not in rows:
+                rows[number] = order_row(item.data, created_by)
+
+        created: dict[str, OrderOut] = {}
+        if rows:
+            try:
+                orders = db.scalars(
+                    insert(Order).returning(Order, sort_by_parameter_order=True),
+                    list(rows.values()),
+                ).all()
+                # Serialized from the RETURNING rows: the commit expires them,
+                # and each would otherwise be refreshed with its own SELECT.
+                created = {order.invoice_number: OrderOut.model_validate(order) for order in orders}
+                db.commit()
+            except IntegrityError:
+                # Another request inserted one of these invoices concurrently.
+                db.rollback()
+                if attempt:
+                    raise
+                continue
+            publish_order_events([("created", order_payload(order)) for order in created.values()])
+        break
+
+    results: list[ImportResult] = []
+    reported: set[str] = set()
+    for item in parsed:
+        if item.data is None:
+            results.append(
+                ImportResult(
+                    filename=item.filename,
+                    status="error",
+                    backend=item.backend,
+                    errors={"code": item.error_code},
+                )
+            )
+            continue
+        number = item.data["invoice_number"]
+        if number in created and number not in reported:
+            reported.add(number)
+            results.append(
+                ImportResult(
+                    filename=item.filename,
+                    status="created",
+                    backend=item.backend,
+                    order=created[number],
+                )
+            )
+        else:
+            results.append(
+                ImportResult(
+                    filename=item.filename,
+                    status="already_exists",
+                    backend=item.backend,
+                    order=existing.get(number) or created[number],
+                )
+            )
+    return results
@@ -0,0 +1,165 @@
+import csv
+import io
+import tempfile
+import uuid
+import zlib
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from importlib.util import find_spec
+from typing import AsyncIterator, Sequence
+
+from sqlalchemy import Select, select
+from starlette.concurrency import run_in_threadpool
+
+from app.models.order import Order
+from app.schemas.order import OrderOut
+
+EXPORT_FIELDS = tuple(OrderOut.model_fields)
+XLSX_CHUNK_BYTES = 64 * 1024
+
+
+@dataclass(frozen=True)
+class ExportFormat:
+    media_type: str
+    extension: str
+    # Optional dependency the writer needs, if any.
+    module: str | None = None
+
+    @property
+    def available(self) -> bool:
+        return self.module is None or find_spec(self.module) is not None
+
+
+EXPORT_FORMATS = {
+    "csv": ExportFormat("text/csv; charset=utf-8", "csv"),
+    "parquet": ExportFormat("application/vnd.apache.parquet", "parquet", "pyarrow"),
+    "xlsx": ExportFormat(
+        "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet", "xlsx", "openpyxl"
+    ),
+}
+
+Batches = AsyncIterator[Sequence[Sequence]]
+
+
+def export_statement(conditions: list) -> Select:
+    columns = [getattr(Order, name) for name in EXPORT_FIELDS]
+    return select(*columns).where(*conditions).order_by(Order.sold_at, Order.id)
+
+
+def _plain(value):
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    return value
+
+
+def _utc_naive(value):
+    # Excel has no time zones: cells hold UTC wall-clock times.
+    if isinstance(value, datetime) and value.tzinfo is not None:
+        return value.astimezone(timezone.utc).replace(tzinfo=None)
+    return _plain(value)
+
+
+async def csv_chunks(batches: Batches, gzip: bool = False) -> AsyncIterator[bytes]:
+    compressor = zlib.compressobj(wbits=31) if gzip else None
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    def drain() -> bytes:
+        data = buffer.getvalue().encode()
+        buffer.seek(0)
+        buffer.truncate()
+        return compressor.compress(data) if compressor else data
+
+    writer.writerow(EXPORT_FIELDS)
+    async for rows in batches:
+        writer.writerows(
+            [value.isoformat() if isinstance(value, datetime) else value for value in row]
+            for row in rows
+        )
+        yield drain()
+    tail = drain()
+    yield tail + compressor.flush() if compressor else tail
+
+
+class _ChunkSink(io.RawIOBase):
+    # Write-only file handed to pyarrow; what it wrote so far is drained
+    # after every row group.
+    def __init__(self) -> None:
+        self._chunks: list[bytes] = []
+        self._position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def _arrow_schema():
+    import pyarrow as pa
+
+    types = {str: pa.string(), bool: pa.bool_(), datetime: pa.timestamp("us", tz="UTC")}
+    columns = Order.__table__.columns
+    return pa.schema(
+        [(name, types.get(columns[name].type.python_type, pa.string())) for name in EXPORT_FIELDS]
+    )
+
+
+async def parquet_chunks(batches: Batches) -> AsyncIterator[bytes]:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    schema = _arrow_schema()
+    sink = _ChunkSink()
+    writer = pq.ParquetWriter(sink, schema, compression="zstd")
+    try:
+        async for rows in batches:
+            arrays = [
+                pa.array([_plain(value) for value in column], type=field.type)
+                for column, field in zip(zip(*rows), schema)
+            ]
+            writer.write_batch(pa.RecordBatch.from_arrays(arrays, schema=schema))
+            yield sink.drain()
+    finally:
+        writer.close()
+    yield sink.drain()
+
+
+def _append_rows(sheet, rows: Sequence[Sequence]) -> None:
+    for row in rows:
+        sheet.append([_utc_naive(value) for value in row])
+
+
+async def xlsx_chunks(batches: Batches) -> AsyncIterator[bytes]:
+    from openpyxl import Workbook
+
+    # Write-only sheets spill rows to a temporary file as they are appended;
+    # the zip container can only be produced once the last row is in.
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet("orders")
+    sheet.append(EXPORT_FIELDS)
+    async for rows in batches:
+        await run_in_threadpool(_append_rows, sheet, rows)
+    with tempfile.TemporaryFile() as output:
+        await run_in_threadpool(workbook.save, output)
+        output.seek(0)
+        while chunk := await run_in_threadpool(output.read, XLSX_CHUNK_BYTES):
+            yield chunk
+
+
+def export_chunks(export_format: str, batches: Batches, gzip: bool = False) -> AsyncIterator[bytes]:
+    if export_format == "parquet":
+        return parquet_chunks(batches)
+    if export_format == "xlsx":
+        return xlsx_chunks(batches)
+    return csv_chunks(batches, gzip)
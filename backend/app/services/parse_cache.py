@@ -0,0 +1,128 @@
+import hashlib
+import logging
+from dataclasses import replace
+from typing import Callable
+
+from sqlalchemy import delete, func, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.core.config import get_settings
+from app.invoice_parser import PARSER_VERSION, PdfSource
+from app.models.invoice_parse_cache import InvoiceParseCache
+from app.services.invoice_import import ParsedInvoice
+
+logger = logging.getLogger(__name__)
+
+# Outcomes that depend on the environment rather than on the file itself.
+UNCACHEABLE_CODES = {"PARSE_TIMEOUT", "PARSE_WORKER_CRASHED", "PDF_TOO_LARGE"}
+
+
+def content_hash(payload: bytes) -> str:
+    return hashlib.sha256(payload).hexdigest()
+
+
+def parser_signature() -> str:
+    return f"{PARSER_VERSION}:{get_settings().pdf_max_pages}"
+
+
+def _lookup(db: Session, digests: set[str], signature: str) -> dict[str, InvoiceParseCache]:
+    if not digests:
+        return {}
+    entries = db.scalars(
+        select(InvoiceParseCache).where(
+            InvoiceParseCache.sha256.in_(digests), InvoiceParseCache.parser_version == signature
+        )
+    ).all()
+    if entries:
+        db.execute(
+            update(InvoiceParseCache)
+            .where(InvoiceParseCache.sha256.in_([entry.sha256 for entry in entries]))
+            .values(last_used_at=func.now())
+        )
+        db.commit()
+    return {entry.sha256: entry for entry in entries}
+
+
+def _store(db: Session, parsed: dict[str, ParsedInvoice], signature: str) -> None:
+    entries = {
+        digest: item for digest, item in parsed.items() if item.error_code not in UNCACHEABLE_CODES
+    }
+    if not entries:
+        return
+    try:
+        # Stale entries from an older parser are replaced.
+        db.execute(delete(InvoiceParseCache).where(InvoiceParseCache.sha256.in_(entries)))
+        db.add_all(
+            InvoiceParseCache(
+                sha256=digest,
+                parser_version=signature,
+                data=item.data,
+                error_code=item.error_code,
+                backend=item.backend,
+            )
+            for digest, item in entries.items()
+        )
+        db.commit()
+    except IntegrityError:
+        # A concurrent import cached the same file first.
+        db.rollback()
+        return
+    _evict(db)
+
+
+def _evict(db: Session) -> None:
+    max_entries = get_settings().parse_cache_max_entries
+    overflow = db.scalar(select(func.count()).select_from(InvoiceParseCache)) - max_entries
+    if overflow <= 0:
+        return
+    oldest = (
+        select(InvoiceParseCache.sha256)
+        .order_by(InvoiceParseCache.last_used_at, InvoiceParseCache.sha256)
+        .limit(overflow)
+        .scalar_subquery()
+    )
+    db.execute(delete(InvoiceParseCache).where(InvoiceParseCache.sha256.in_(oldest)))
+    db.commit()
+
+
+def parse_cached(
+    db: Session,
+    files: list[tuple[str, PdfSource]],
+    parse: Callable[[list[tuple[str, PdfSource]]], list[ParsedInvoice]],
+    digests: list[str] | None = None,
+) -> list[ParsedInvoice]:
+    # Re-uploads of an already seen PDF skip extraction entirely; identical
+    # files within one call are parsed once. Digests must be given for paths.
+    signature = parser_signature()
+    if digests is None:
+        digests = [content_hash(payload) for _, payload in files]
+    cached = _lookup(db, set(digests), signature)
+
+    pending: dict[str, tuple[str, PdfSource]] = {}
+    for digest, item in zip(digests, files):
+        if digest not in cached and digest not in pending:
+            pending[digest] = item
+    parsed = dict(zip(pending, parse(list(pending.values())))) if pending else {}
+    _store(db, parsed, signature)
+
+    results = []
+    reported: set[str] = set()
+    for digest, (filename, _) in zip(digests, files):
+        entry = cached.get(digest)
+        if entry is not None:
+            results.append(
+                ParsedInvoice(
+                    filename=filename,
+                    data=dict(entry.data) if entry.data else None,
+                    error_code=entry.error_code,
+                    backend="cache",
+                )
+            )
+        elif digest in reported:
+            results.append(replace(parsed[digest], filename=filename, duration=None))
+        else:
+            reported.add(digest)
+            results.append(replace(parsed[digest], filename=filename))
+    logger.info("Parse cache hits=%d misses=%d", len(files) - len(pending), len(pending))
+    return results
@@ -0,0 +1,103 @@
+import hashlib
+import os
+import shutil
+import tempfile
+import zipfile
+from dataclasses import dataclass
+from typing import BinaryIO
+
+from app.core.config import get_settings
+
+CHUNK_SIZE = 1024 * 1024
+
+
+class UploadTooLarge(Exception):
+    def __init__(self, filename: str, max_bytes: int) -> None:
+        super().__init__(f"{filename} exceeds {max_bytes} bytes")
+        self.filename = filename
+        self.max_bytes = max_bytes
+
+
+class TooManyFiles(Exception):
+    def __init__(self, max_files: int) -> None:
+        super().__init__(f"more than {max_files} files")
+        self.max_files = max_files
+
+
+@dataclass
+class SpooledFile:
+    filename: str
+    path: str
+    size: int
+    sha256: str
+
+
+class UploadSpool:
+    # Owns the temporary files of one request; leaving the context removes them.
+
+    def __init__(self) -> None:
+        settings = get_settings()
+        self.directory = tempfile.mkdtemp(
+            prefix="pcmontage-upload-", dir=settings.upload_spool_dir or None
+        )
+        self._count = 0
+
+    def __enter__(self) -> "UploadSpool":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def add(self, filename: str, stream: BinaryIO, max_bytes: int) -> SpooledFile:
+        self._count += 1
+        extension = os.path.splitext(filename)[1].lower()
+        path = os.path.join(self.directory, f"{self._count}{extension}")
+        digest = hashlib.sha256()
+        size = 0
+        with open(path, "wb") as target:
+            while chunk := stream.read(CHUNK_SIZE):
+                size += len(chunk)
+                if max_bytes and size > max_bytes:
+                    raise UploadTooLarge(filename, max_bytes)
+                digest.update(chunk)
+                target.write(chunk)
+        return SpooledFile(filename=filename, path=path, size=size, sha256=digest.hexdigest())
+
+    def expand(
+        self, spooled: SpooledFile, max_files: int, max_total_bytes: int | None = None
+    ) -> list[SpooledFile]:
+        # Limits are checked against the central directory before anything is
+        # extracted; reads stop at each member's declared size, so a lying
+        # header fails the CRC check instead of extracting more.
+        if not spooled.filename.lower().endswith(".zip"):
+            return [spooled]
+        max_bytes = get_settings().pdf_max_bytes
+        try:
+            with zipfile.ZipFile(spooled.path) as archive:
+                members = [
+                    info
+                    for info in archive.infolist()
+                    if not info.is_dir()
+                    and info.filename.lower().endswith(".pdf")
+                    and not info.filename.startswith("__MACOSX/")
+                ]
+                if len(members) > max_files:
+                    raise TooManyFiles(max_files)
+                for info in members:
+                    if max_bytes and info.file_size > max_bytes:
+                        raise UploadTooLarge(f"{spooled.filename}/{info.filename}", max_bytes)
+                total_bytes = sum(info.file_size for info in members)
+                if max_total_bytes is not None and total_bytes > max_total_bytes:
+                    raise UploadTooLarge(spooled.filename, max_total_bytes)
+                expanded = []
+                for info in members:
+                    with archive.open(info) as member:
+                        expanded.append(
+                            self.add(f"{spooled.filename}/{info.filename}", member, max_bytes)
+                        )
+                return expanded
+        except zipfile.BadZipFile:
+            return []
@@ -0,0 +1,71 @@
+import gc
+import os
+
+# Past a few workers the API waits on PostgreSQL, not on CPU.
+MAX_DEFAULT_WORKERS = 4
+
+
+def available_cpus() -> int:
+    # cpu_count() ignores container limits: honour the cgroup v2 quota and
+    # the affinity mask.
+    cpus = len(os.sched_getaffinity(0))
+    try:
+        with open("/sys/fs/cgroup/cpu.max") as handle:
+            quota, period = handle.read().split()
+        if quota != "max":
+            cpus = min(cpus, max(int(quota) // int(period), 1))
+    except (OSError, ValueError):
+        pass
+    return cpus
+
+
+bind = os.getenv("BIND", "0.0.0.0:8000")
+worker_class = "uvicorn.workers.UvicornWorker"
+workers = int(os.getenv("WEB_CONCURRENCY") or 0) or min(available_cpus(), MAX_DEFAULT_WORKERS)
+
+# Each worker holds a sync and an async pool (DB_POOL_SIZE + DB_MAX_OVERFLOW
+# each) plus one LISTEN connection. Unless the pools are sized explicitly,
+# split DB_CONNECTION_BUDGET between workers so they fit under PostgreSQL's
+# default max_connections=100, leaving room for prestart, the CLI and psql.
+connection_budget = int(os.getenv("DB_CONNECTION_BUDGET", "80"))
+per_engine = max((connection_budget // workers - 1) // 2, 2)
+os.environ.setdefault("DB_POOL_SIZE", str(min(5, per_engine)))
+overflow = min(10, per_engine - int(os.environ["DB_POOL_SIZE"]))
+os.environ.setdefault("DB_MAX_OVERFLOW", str(max(overflow, 0)))
+
+# The app is imported once in the master and forked, so workers share its
+# modules copy-on-write instead of each importing them.
+preload_app = True
+
+# Recycle workers to cap memory left behind by PDF parsing; the jitter keeps
+# them from restarting all at once.
+max_requests = int(os.getenv("MAX_REQUESTS", "1000"))
+max_requests_jitter = int(os.getenv("MAX_REQUESTS_JITTER", "100"))
+
+# Imports may legitimately take up to IMPORT_JOB_TIMEOUT_SECONDS.
+timeout = int(os.getenv("WORKER_TIMEOUT", "120"))
+graceful_timeout = int(os.getenv("GRACEFUL_TIMEOUT", "30"))
+keepalive = 5
+
+accesslog = "-"
+
+
+def on_starting(server):
+    # Parser backends are imported lazily by the app; load them before forking too.
+    import fitz  # noqa: F401
+    import pdfplumber  # noqa: F401
+
+    # Keep the preloaded objects out of the workers' garbage collections, which
+    # would otherwise touch (and copy) every shared page.
+    gc.freeze()
+
+
+def post_fork(server, worker):
+    # Connections must never be shared across processes; pools, executors and
+    # the event bridge are created lazily or in each worker's lifespan.
+    from app.db.session import async_engine, engine
+    from app.services.events import broker
+
+    engine.dispose(close=False)
+    async_engine.sync_engine.dispose(close=False)
+    broker.reset_after_fork()
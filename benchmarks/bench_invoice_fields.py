@@ -0,0 +1,88 @@
+"""Micro-benchmark of invoice field extraction on synthetic invoice texts.
+
+Usage: PYTHONPATH=backend python benchmarks/bench_invoice_fields.py [--count 2000]
+"""
+import argparse
+import re
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# The synthetic invoice corpus is shared with the test suite.
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "tests"))
+
+from synthetic_invoices import generate_corpus  # noqa: E402
+
+from app.invoice_parser import parse_invoice_text  # noqa: E402
+from app.services import pdf_parser  # noqa: E402
+
+
+def legacy_parse_text(text: str) -> dict:
+    # The previous implementation: whole-text searches plus several line scans.
+    lines = [line.strip() for line in text.splitlines() if line.strip()]
+    invoice_match = re.search(r"Facture\s+N°\s*([0-9-]+)", text, re.MULTILINE)
+    date_match = re.search(
+        r"Date\s*:\s*([0-9]{2}/[0-9]{2}/[0-9]{4}),\s*([0-9]{2}:[0-9]{2}:[0-9]{2})", text
+    )
+    store = next((line for line in lines if re.search(r"DREAM STATION", line, re.IGNORECASE)), None)
+    client = next((line for line in lines if re.match(r"^(Mme|M\.|Mr|Mlle)\s+", line)), None)
+    keywords = (
+        "boitier", "cpu", "carte mere", "carte mère", "ram", "ssd", "ventirad",
+        "carte graphique", "alimentation",
+    )
+    products = []
+    for line in lines:
+        if not re.search(r"(PACK COMPLET\s+)?PC\s+GAMER", line, re.IGNORECASE):
+            continue
+        cleaned = re.sub(r"\s+", " ", line).strip()
+        if any(keyword in cleaned.lower() for keyword in keywords):
+            continue
+        products.append(cleaned)
+    return {
+        "invoice_number": invoice_match.group(1) if invoice_match else None,
+        "sold_at": date_match.groups() if date_match else None,
+        "store": store,
+        "client_name": client,
+        "product_name": products[0] if products else None,
+    }
+
+
+def measure(name: str, parse, texts: list[str], repeat: int) -> list[float]:
+    timings = []
+    for _ in range(repeat):
+        for text in texts:
+            start = time.perf_counter()
+            parse(text)
+            timings.append(time.perf_counter() - start)
+    timings.sort()
+    p50 = statistics.median(timings) * 1e6
+    p99 = timings[int(len(timings) * 0.99) - 1] * 1e6
+    mean = statistics.fmean(timings) * 1e6
+    print(f"{name:<28} mean {mean:8.1f} µs   p50 {p50:8.1f} µs   p99 {p99:8.1f} µs")
+    return timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--count", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    corpus = generate_corpus(args.count)
+    texts = [invoice.text for invoice in corpus]
+    mismatches = 0
+    for invoice in corpus:
+        data = parse_invoice_text(invoice.text)
+        expected = (invoice.invoice_number, invoice.client_name, invoice.product_name)
+        mismatches += (data["invoice_number"], data["client_name"], data["product_name"]) != expected
+    print(f"{len(texts)} synthetic invoices, {sum(map(len, texts)) / len(texts):.0f} chars avg, "
+          f"{mismatches} mismatches")
+
+    measure("legacy regex scans", legacy_parse_text, texts, args.repeat)
+    measure("invoice_parser (scanner)", parse_invoice_text, texts, args.repeat)
+    measure("pdf_parser (scanner)", pdf_parser.parse_invoice_text, texts, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""Latency, memory and correctness of the PDF invoice parsers on synthetic invoices.
+
+Renders a corpus of Dream Station-style PDFs (varying page counts, client prefixes and
+component lines) and runs every parser over it:
+- app.invoice_parser.parse_invoice_pdf on the bytes (fitz, then pdfplumber as fallback),
+- the same with pdfplumber forced (--pdfplumber),
+- app.services.pdf_parser.parse_invoice_pdf on a file path.
+Memory peaks come from tracemalloc and only cover the Python heap, not MuPDF's own buffers.
+
+Usage: PYTHONPATH=backend python benchmarks/bench_invoice_parser.py [--count 300] [--pdfplumber]
+"""
+import argparse
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections import Counter
+from pathlib import Path
+
+# The synthetic invoice corpus is shared with the test suite.
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "tests"))
+
+from synthetic_invoices import SyntheticInvoice, write_corpus  # noqa: E402
+
+from app import invoice_parser  # noqa: E402
+from app.services import pdf_parser  # noqa: E402
+
+FIELDS = ("invoice_number", "sold_at", "store", "client_name", "product_name")
+
+
+def expected_fields(invoice: SyntheticInvoice) -> dict:
+    return {
+        "invoice_number": invoice.invoice_number,
+        "sold_at": invoice.sold_at.isoformat(),
+        "store": invoice.store,
+        "client_name": invoice.client_name,
+        "product_name": invoice.product_name,
+    }
+
+
+def invoice_parser_fields(path: Path) -> dict:
+    try:
+        return invoice_parser.parse_invoice_pdf(path.read_bytes())
+    except invoice_parser.InvoiceParseError:
+        return {}
+
+
+def pdfplumber_fields(path: Path) -> dict:
+    backends = invoice_parser.PDF_BACKENDS
+    invoice_parser.PDF_BACKENDS = tuple(item for item in backends if item[0] == "pdfplumber")
+    try:
+        return invoice_parser_fields(path)
+    finally:
+        invoice_parser.PDF_BACKENDS = backends
+
+
+def pdf_parser_fields(path: Path) -> dict:
+    data, _ = pdf_parser.parse_invoice_pdf(str(path))
+    if data is None:
+        return {}
+    return {**vars(data), "sold_at": data.sold_at.isoformat()}
+
+
+def run(name: str, parse, corpus: list[tuple[Path, SyntheticInvoice]], repeat: int) -> None:
+    timings = []
+    wrong: Counter = Counter()
+    for attempt in range(repeat):
+        for path, invoice in corpus:
+            start = time.perf_counter()
+            fields = parse(path)
+            timings.append(time.perf_counter() - start)
+            if attempt == 0:
+                expected = expected_fields(invoice)
+                wrong.update(field for field in FIELDS if fields.get(field) != expected[field])
+
+    tracemalloc.start()
+    peak = 0
+    for path, _ in corpus:
+        tracemalloc.reset_peak()
+        parse(path)
+        peak = max(peak, tracemalloc.get_traced_memory()[1])
+    tracemalloc.stop()
+
+    timings.sort()
+    p50 = statistics.median(timings) * 1e3
+    p99 = timings[max(int(len(timings) * 0.99) - 1, 0)] * 1e3
+    mismatches = ", ".join(f"{field} {count}" for field, count in wrong.most_common()) or "none"
+    print(f"{name:<28} p50 {p50:7.2f} ms   p99 {p99:7.2f} ms   peak {peak / 2**20:6.2f} MiB"
+          f"   mismatches: {mismatches}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--count", type=int, default=300)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=1234)
+    parser.add_argument("--pdfplumber", action="store_true", help="also time the fallback backend")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="bench-invoices-") as workdir:
+        corpus = write_corpus(Path(workdir), args.count, args.seed)
+        sizes = [path.stat().st_size for path, _ in corpus]
+        pages = Counter(len(invoice.pages) for _, invoice in corpus)
+        print(f"{len(corpus)} synthetic PDFs, {statistics.fmean(sizes) / 1024:.1f} KiB avg, "
+              f"logical pages {dict(sorted(pages.items()))}")
+
+        run("invoice_parser", invoice_parser_fields, corpus, args.repeat)
+        if args.pdfplumber:
+            run("invoice_parser (pdfplumber)", pdfplumber_fields, corpus, args.repeat)
+        run("services.pdf_parser", pdf_parser_fields, corpus, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
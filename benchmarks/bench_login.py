@@ -0,0 +1,89 @@
+"""Login throughput under concurrency, and how much it slows the rest of the API.
+
+Runs a burst of POST /api/auth/login while a few clients keep calling GET /api/auth/me,
+once with bcrypt in the request threadpool (PASSWORD_HASH_WORKERS=0) and once with the
+dedicated process pool.
+
+Usage: python benchmarks/bench_login.py [--concurrency 16] [--duration 10] [--workers 2]
+"""
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import httpx
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from bench_orders_api import BENCH_PASSWORD, report, seed, start_server  # noqa: E402
+
+
+async def drive(base_url: str, token: str, username: str, concurrency: int,
+                duration: float) -> tuple[list[float], list[float]]:
+    logins: list[float] = []
+    reads: list[float] = []
+    deadline = time.perf_counter() + duration
+
+    async def login_worker(client: httpx.AsyncClient) -> None:
+        while time.perf_counter() < deadline:
+            start = time.perf_counter()
+            response = await client.post(
+                "/api/auth/login", json={"username": username, "password": BENCH_PASSWORD}
+            )
+            response.raise_for_status()
+            logins.append(time.perf_counter() - start)
+
+    async def read_worker(client: httpx.AsyncClient) -> None:
+        while time.perf_counter() < deadline:
+            start = time.perf_counter()
+            response = await client.get(
+                "/api/auth/me", headers={"Authorization": f"Bearer {token}"}
+            )
+            response.raise_for_status()
+            reads.append(time.perf_counter() - start)
+
+    limits = httpx.Limits(max_connections=concurrency + 4)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=60) as client:
+        await asyncio.gather(
+            *(login_worker(client) for _ in range(concurrency)),
+            *(read_worker(client) for _ in range(4)),
+        )
+    return logins, reads
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--duration", type=float, default=10)
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--port", type=int, default=8766)
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="bench-login-")
+    database_url = os.environ.get("DATABASE_URL") or f"sqlite:///{workdir}/bench.db"
+    token, username, _ = seed(database_url, 0)
+    base_url = f"http://127.0.0.1:{args.port}"
+
+    print(f"{args.concurrency} concurrent logins + 4 GET /auth/me clients, "
+          f"{args.duration:.0f}s each, {os.cpu_count()} CPUs")
+    for label, workers in (("threadpool", 0), (f"process pool x{args.workers}", args.workers)):
+        process = start_server(
+            database_url, args.port, {"PASSWORD_HASH_WORKERS": str(workers)}
+        )
+        try:
+            logins, reads = asyncio.run(
+                drive(base_url, token, username, args.concurrency, args.duration)
+            )
+        finally:
+            process.terminate()
+            process.wait()
+        print(label)
+        report("  POST /auth/login", logins, args.duration)
+        report("  GET /auth/me", reads, args.duration)
+
+
+if __name__ == "__main__":
+    main()
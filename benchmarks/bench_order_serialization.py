@@ -0,0 +1,93 @@
+"""Cost of turning the order table into the GET /api/orders body.
+
+Compares, on the same SQLite rows:
+- ORM objects through FastAPI's response_model path (validate, jsonable_encoder, json.dumps),
+- ORM objects through a pydantic TypeAdapter dump_json,
+- plain column tuples straight to orjson (what the endpoint does now).
+
+Usage: python benchmarks/bench_order_serialization.py [--sizes 10000 100000] [--repeat 3]
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from bench_orders_api import BACKEND, seed  # noqa: E402
+
+
+def measure(run, repeat: int) -> tuple[float, float, int]:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        size = len(run())
+        timings.append(time.perf_counter() - start)
+    tracemalloc.start()
+    run()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return statistics.median(timings), peak, size
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    for count in args.sizes:
+        workdir = tempfile.mkdtemp(prefix="bench-serialize-")
+        database_url = f"sqlite:///{workdir}/bench.db"
+        seed(database_url, count)
+        os.environ["DATABASE_URL"] = database_url
+        sys.path.insert(0, str(BACKEND))
+        from fastapi.encoders import jsonable_encoder
+        from pydantic import TypeAdapter
+        from sqlalchemy import create_engine, select
+        from sqlalchemy.orm import Session
+
+        from app.api.routes.orders import KEYSET_FIELDS, ORDER_FIELDS, order_rows_json
+        from app.models.order import Order
+        from app.schemas.order import OrderOut
+
+        adapter = TypeAdapter(list[OrderOut])
+        engine = create_engine(database_url)
+        ordering = (Order.sold_at.desc(), Order.id.desc())
+        columns = [getattr(Order, name) for name in dict.fromkeys(ORDER_FIELDS + KEYSET_FIELDS)]
+
+        def fastapi_default() -> bytes:
+            with Session(engine) as db:
+                orders = db.scalars(select(Order).order_by(*ordering)).all()
+                content = jsonable_encoder(adapter.validate_python(orders, from_attributes=True))
+                return json.dumps(content).encode()
+
+        def pydantic_dump_json() -> bytes:
+            with Session(engine) as db:
+                orders = db.scalars(select(Order).order_by(*ordering)).all()
+                return adapter.dump_json(adapter.validate_python(orders, from_attributes=True))
+
+        def tuples_orjson() -> bytes:
+            with Session(engine) as db:
+                rows = db.execute(select(*columns).order_by(*ordering)).all()
+                return order_rows_json(rows, ORDER_FIELDS)
+
+        print(f"{count} orders")
+        for name, run in (
+            ("ORM + jsonable_encoder", fastapi_default),
+            ("ORM + pydantic dump_json", pydantic_dump_json),
+            ("tuples + orjson", tuples_orjson),
+        ):
+            median, peak, size = measure(run, args.repeat)
+            print(f"  {name:<26} {median * 1e3:9.1f} ms   peak {peak / 2**20:7.1f} MiB"
+                  f"   body {size / 2**20:6.1f} MiB")
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
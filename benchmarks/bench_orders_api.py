@@ -0,0 +1,155 @@
+"""Requests/sec of GET /api/orders and PATCH /api/orders/{id} against a live server.
+
+Seeds a throwaway SQLite database (or uses DATABASE_URL as is), starts uvicorn on it
+and drives it with concurrent httpx clients.
+
+Usage: python benchmarks/bench_orders_api.py [--orders 5000] [--concurrency 32] [--duration 10]
+"""
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import uuid
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import httpx
+
+BACKEND = Path(__file__).resolve().parent.parent / "backend"
+BENCH_PASSWORD = "bench"
+
+
+def seed(database_url: str, count: int) -> tuple[str, str, list[str]]:
+    os.environ["DATABASE_URL"] = database_url
+    sys.path.insert(0, str(BACKEND))
+    from sqlalchemy import create_engine, insert
+    from sqlalchemy.orm import Session
+
+    from app.core.security import create_access_token, hash_password
+    from app.db.base import Base
+    from app.models.order import Order
+    from app.models.user import User, UserRole
+
+    engine = create_engine(database_url)
+    Base.metadata.create_all(engine)
+    admin_id = uuid.uuid4()
+    username = f"bench-{admin_id.hex[:8]}"
+    order_ids = [uuid.uuid4() for _ in range(count)]
+    start = datetime(2025, 1, 1)
+    with Session(engine) as db:
+        db.add(User(id=admin_id, username=username,
+                    password_hash=hash_password(BENCH_PASSWORD), role=UserRole.ADMIN))
+        db.commit()
+        if order_ids:
+            db.execute(insert(Order), [
+                {
+                    "id": order_id,
+                    "invoice_number": f"BENCH-{order_id.hex[:12]}",
+                    "sold_at": start + timedelta(minutes=index),
+                    "store": f"DREAM STATION {index % 4}",
+                    "client_name": f"M. Client {index}",
+                    "product_name": "PC GAMER Bench",
+                    "created_by": admin_id,
+                }
+                for index, order_id in enumerate(order_ids)
+            ])
+            db.commit()
+    engine.dispose()
+    return create_access_token(str(admin_id)), username, [str(order_id) for order_id in order_ids]
+
+
+async def drive(base_url: str, token: str, order_ids: list[str], concurrency: int,
+                duration: float, scenario: str) -> list[float]:
+    headers = {"Authorization": f"Bearer {token}"}
+    timings: list[float] = []
+    errors = 0
+    deadline = time.perf_counter() + duration
+
+    async def worker(client: httpx.AsyncClient) -> None:
+        nonlocal errors
+        while time.perf_counter() < deadline:
+            start = time.perf_counter()
+            if scenario == "list":
+                response = await client.get("/api/orders", params={"limit": 50})
+            else:
+                response = await client.patch(
+                    f"/api/orders/{random.choice(order_ids)}",
+                    json={"prepared": random.random() < 0.5},
+                )
+            if response.status_code != 200:
+                errors += 1
+            timings.append(time.perf_counter() - start)
+
+    limits = httpx.Limits(max_connections=concurrency)
+    async with httpx.AsyncClient(base_url=base_url, headers=headers, limits=limits,
+                                 timeout=30) as client:
+        await asyncio.gather(*(worker(client) for _ in range(concurrency)))
+    if errors:
+        print(f"  {errors} non-200 responses")
+    return timings
+
+
+def report(name: str, timings: list[float], duration: float) -> None:
+    timings.sort()
+    p50 = statistics.median(timings) * 1e3
+    p99 = timings[int(len(timings) * 0.99) - 1] * 1e3
+    print(f"{name:<22} {len(timings) / duration:8.1f} req/s   p50 {p50:7.1f} ms   p99 {p99:7.1f} ms")
+
+
+def start_server(database_url: str, port: int, env: dict | None = None) -> subprocess.Popen:
+    env = {**os.environ, "DATABASE_URL": database_url, "CORS_ORIGINS": "*", **(env or {})}
+    process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port),
+         "--log-level", "warning"],
+        cwd=BACKEND, env=env,
+    )
+    wait_until_ready(f"http://127.0.0.1:{port}", process)
+    return process
+
+
+def wait_until_ready(base_url: str, process: subprocess.Popen) -> None:
+    for _ in range(100):
+        if process.poll() is not None:
+            raise SystemExit("uvicorn exited")
+        try:
+            if httpx.get(f"{base_url}/health").status_code == 200:
+                return
+        except httpx.TransportError:
+            pass
+        time.sleep(0.1)
+    raise SystemExit("uvicorn did not start")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--orders", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--duration", type=float, default=10)
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="bench-orders-")
+    database_url = os.environ.get("DATABASE_URL") or f"sqlite:///{workdir}/bench.db"
+    token, _, order_ids = seed(database_url, args.orders)
+
+    base_url = f"http://127.0.0.1:{args.port}"
+    process = start_server(database_url, args.port)
+    try:
+        print(f"{args.orders} orders, {args.concurrency} concurrent clients, {args.duration:.0f}s each")
+        for scenario, name in (("list", "GET /orders?limit=50"), ("patch", "PATCH /orders/{id}")):
+            timings = asyncio.run(
+                drive(base_url, token, order_ids, args.concurrency, args.duration, scenario)
+            )
+            report(name, timings, args.duration)
+    finally:
+        process.terminate()
+        process.wait()
+
+
+if __name__ == "__main__":
+    main()
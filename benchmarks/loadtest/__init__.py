@@ -0,0 +1,11 @@
+import sys
+from pathlib import Path
+
+# The package reuses the sibling benchmark modules (server helpers) and the
+# synthetic invoices shared with the test suite.
+BENCHMARKS = Path(__file__).resolve().parent.parent
+BACKEND = BENCHMARKS.parent / "backend"
+TESTS = BENCHMARKS.parent / "tests"
+for path in (BENCHMARKS, TESTS):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
@@ -0,0 +1,80 @@
+"""Replays a realistic request mix against the API and reports throughput and latency per route.
+
+Seeds users and orders into a throwaway SQLite database (or DATABASE_URL, e.g. the Postgres of
+benchmarks/loadtest/docker-compose.yml), starts uvicorn on it unless --base-url points at a
+running server, then drives logins, order lists across every view, searches, workflow PATCHes
+and PDF imports from concurrent virtual users.
+
+Usage: python -m benchmarks.loadtest [--orders 10000] [--users 12] [--concurrency 32]
+       [--duration 30] [--invoices 200] [--mix list=10,search=4,patch=4,import=1,login=1]
+"""
+import argparse
+import asyncio
+import os
+import random
+import tempfile
+
+from bench_orders_api import start_server
+from synthetic_invoices import generate_invoice, render_pdf
+
+from .driver import report, run_load
+from .scenarios import DEFAULT_MIX, SCENARIOS, Workload
+from .seed import seed
+
+
+def parse_mix(value: str) -> dict[str, int]:
+    mix = {}
+    for item in value.split(","):
+        name, _, weight = item.partition("=")
+        if name not in SCENARIOS or not weight.isdigit():
+            raise argparse.ArgumentTypeError(f"invalid mix entry {item!r}")
+        mix[name] = int(weight)
+    return mix
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.loadtest")
+    parser.add_argument("--orders", type=int, default=10000)
+    parser.add_argument("--users", type=int, default=12)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--duration", type=float, default=30)
+    parser.add_argument("--invoices", type=int, default=200,
+                        help="distinct PDFs to import; they are reused once exhausted")
+    parser.add_argument("--mix", type=parse_mix,
+                        default=",".join(f"{name}={weight}" for name, weight in DEFAULT_MIX.items()))
+    parser.add_argument("--base-url", help="target a running server sharing DATABASE_URL")
+    parser.add_argument("--port", type=int, default=8766)
+    parser.add_argument("--seed", type=int)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    workdir = tempfile.mkdtemp(prefix="loadtest-")
+    database_url = os.environ.get("DATABASE_URL") or f"sqlite:///{workdir}/loadtest.db"
+    seeded = seed(database_url, args.orders, args.users, rng)
+    offset = rng.randint(0, 10**6)
+    invoices = []
+    for index in range(args.invoices):
+        invoice = generate_invoice(rng, offset + index)
+        invoices.append((f"{invoice.invoice_number}.pdf", render_pdf(invoice)))
+    work = Workload(order_ids=seeded.order_ids, invoices=invoices, rng=rng)
+
+    process = None
+    base_url = args.base_url
+    if base_url is None:
+        base_url = f"http://127.0.0.1:{args.port}"
+        process = start_server(database_url, args.port)
+    try:
+        print(f"{args.orders} orders, {args.users} users, {args.concurrency} virtual users, "
+              f"{args.duration:.0f}s against {base_url} ({database_url.split(':')[0]})")
+        samples = asyncio.run(
+            run_load(base_url, seeded.users, work, args.mix, args.concurrency, args.duration)
+        )
+        report(samples, args.duration)
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+import asyncio
+import statistics
+import time
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+
+import httpx
+
+from .scenarios import SCENARIOS, VirtualUser, Workload, allowed, login
+from .seed import SeededUser
+
+
+@dataclass(frozen=True)
+class Sample:
+    scenario: str
+    status: int
+    seconds: float
+
+
+async def run_load(
+    base_url: str,
+    users: list[SeededUser],
+    work: Workload,
+    mix: dict[str, int],
+    concurrency: int,
+    duration: float,
+) -> list[Sample]:
+    samples: list[Sample] = []
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=60) as client:
+        virtual_users = [VirtualUser(users[index % len(users)]) for index in range(concurrency)]
+        # Sessions open before the clock starts; later logins are part of the mix.
+        for vu in virtual_users:
+            (await login(client, vu, work)).raise_for_status()
+
+        deadline = time.perf_counter() + duration
+
+        async def worker(vu: VirtualUser) -> None:
+            names = [name for name in mix if allowed(name, vu.user)]
+            weights = [mix[name] for name in names]
+            while time.perf_counter() < deadline:
+                name = work.rng.choices(names, weights)[0]
+                start = time.perf_counter()
+                try:
+                    status = (await SCENARIOS[name](client, vu, work)).status_code
+                except httpx.TransportError:
+                    status = 0
+                samples.append(Sample(name, status, time.perf_counter() - start))
+
+        await asyncio.gather(*(worker(vu) for vu in virtual_users))
+    return samples
+
+
+def _percentile(sorted_values: list[float], fraction: float) -> float:
+    return sorted_values[max(int(len(sorted_values) * fraction) - 1, 0)]
+
+
+def report(samples: list[Sample], duration: float) -> None:
+    by_scenario: dict[str, list[Sample]] = defaultdict(list)
+    for sample in samples:
+        by_scenario[sample.scenario].append(sample)
+
+    print(f"{'scenario':<10} {'requests':>8} {'req/s':>8} {'p50 ms':>8} {'p95 ms':>8} "
+          f"{'p99 ms':>8} {'max ms':>8}  errors")
+    for name, group in [*sorted(by_scenario.items()), ("total", samples)]:
+        if not group:
+            continue
+        timings = sorted(sample.seconds * 1e3 for sample in group)
+        errors = Counter(sample.status for sample in group if not 200 <= sample.status < 400)
+        print(
+            f"{name:<10} {len(group):>8} {len(group) / duration:>8.1f} "
+            f"{statistics.median(timings):>8.1f} {_percentile(timings, 0.95):>8.1f} "
+            f"{_percentile(timings, 0.99):>8.1f} {timings[-1]:>8.1f}  "
+            + (", ".join(f"{status}: {count}" for status, count in sorted(errors.items())) or "-")
+        )
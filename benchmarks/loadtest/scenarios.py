@@ -0,0 +1,106 @@
+import itertools
+import random
+from dataclasses import dataclass, field
+
+import httpx
+from synthetic_invoices import LAST_NAMES, PRODUCTS, STORES
+
+from .seed import PASSWORD, SeededUser
+
+VIEWS = ("all", "to_prepare", "to_build", "to_deliver", "done")
+SEARCH_TERMS = (
+    *LAST_NAMES,
+    *(product.split()[-1] for product in PRODUCTS),
+    *(store.removeprefix("DREAM STATION ").lower() for store in STORES),
+)
+# Workflow flags each role may set, as enforced by patch_denied.
+PATCH_FIELDS = {
+    "VENDOR": ("prepared", "delivered"),
+    "BUILDER": ("built",),
+    "ADMIN": ("prepared", "built", "delivered"),
+}
+IMPORTERS = {"VENDOR", "ADMIN"}
+DEFAULT_MIX = {"list": 10, "search": 4, "patch": 4, "import": 1, "login": 1}
+
+
+@dataclass
+class Workload:
+    order_ids: list[str]
+    invoices: list[tuple[str, bytes]]
+    rng: random.Random
+    _next_invoice: itertools.cycle = field(init=False)
+
+    def __post_init__(self) -> None:
+        self._next_invoice = itertools.cycle(self.invoices)
+
+    def next_invoice(self) -> tuple[str, bytes]:
+        return next(self._next_invoice)
+
+
+@dataclass
+class VirtualUser:
+    user: SeededUser
+    token: str = ""
+    cursors: dict[str, str] = field(default_factory=dict)
+
+    @property
+    def headers(self) -> dict[str, str]:
+        return {"Authorization": f"Bearer {self.token}"}
+
+
+async def login(client: httpx.AsyncClient, vu: VirtualUser, work: Workload) -> httpx.Response:
+    response = await client.post(
+        "/api/auth/login", json={"username": vu.user.username, "password": PASSWORD}
+    )
+    if response.status_code == 200:
+        vu.token = response.json()["access_token"]
+    return response
+
+
+async def list_orders(client: httpx.AsyncClient, vu: VirtualUser, work: Workload) -> httpx.Response:
+    view = work.rng.choice(VIEWS)
+    params = {"view": view, "limit": 50}
+    # Some clients keep scrolling: continue from the last page of that view.
+    cursor = vu.cursors.pop(view, None)
+    if cursor and work.rng.random() < 0.3:
+        params["cursor"] = cursor
+    response = await client.get("/api/orders", params=params, headers=vu.headers)
+    if "X-Next-Cursor" in response.headers:
+        vu.cursors[view] = response.headers["X-Next-Cursor"]
+    return response
+
+
+async def search_orders(client: httpx.AsyncClient, vu: VirtualUser, work: Workload) -> httpx.Response:
+    params = {"q": work.rng.choice(SEARCH_TERMS), "view": work.rng.choice(VIEWS), "limit": 50}
+    return await client.get("/api/orders", params=params, headers=vu.headers)
+
+
+async def patch_order(client: httpx.AsyncClient, vu: VirtualUser, work: Workload) -> httpx.Response:
+    name = work.rng.choice(PATCH_FIELDS[vu.user.role])
+    return await client.patch(
+        f"/api/orders/{work.rng.choice(work.order_ids)}",
+        json={name: work.rng.random() < 0.8},
+        headers=vu.headers,
+    )
+
+
+async def import_invoice(client: httpx.AsyncClient, vu: VirtualUser, work: Workload) -> httpx.Response:
+    filename, content = work.next_invoice()
+    return await client.post(
+        "/api/import/invoice",
+        files={"file": (filename, content, "application/pdf")},
+        headers=vu.headers,
+    )
+
+
+SCENARIOS = {
+    "list": list_orders,
+    "search": search_orders,
+    "patch": patch_order,
+    "import": import_invoice,
+    "login": login,
+}
+
+
+def allowed(scenario: str, user: SeededUser) -> bool:
+    return scenario != "import" or user.role in IMPORTERS
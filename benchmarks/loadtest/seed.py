@@ -0,0 +1,78 @@
+import random
+import sys
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+from synthetic_invoices import CLIENT_PREFIXES, FIRST_NAMES, LAST_NAMES, PRODUCTS, STORES
+
+from . import BACKEND
+
+PASSWORD = "loadtest"
+ROLES = ("VENDOR", "BUILDER", "ADMIN")
+CHUNK_SIZE = 5000
+# Each workflow stage gets its own quarter of the ~700 days of sales.
+STAGE_SPAN_MINUTES = 60 * 24 * 175
+
+
+@dataclass(frozen=True)
+class SeededUser:
+    username: str
+    role: str
+
+
+@dataclass
+class Seeded:
+    users: list[SeededUser]
+    order_ids: list[str]
+
+
+def seed(database_url: str, orders: int, users: int, rng: random.Random) -> Seeded:
+    # Imported late: app settings read DATABASE_URL when first loaded.
+    sys.path.insert(0, str(BACKEND))
+    from sqlalchemy import create_engine, insert
+    from sqlalchemy.orm import Session
+
+    from app.core.security import hash_password
+    from app.db.base import Base
+    from app.models.order import Order
+    from app.models.user import User, UserRole
+
+    engine = create_engine(database_url)
+    Base.metadata.create_all(engine)
+    run_id = uuid.uuid4().hex[:6]
+    password_hash = hash_password(PASSWORD)
+    seeded_users = [
+        SeededUser(f"load-{run_id}-{index}", ROLES[index % len(ROLES)]) for index in range(users)
+    ]
+    order_ids = [uuid.uuid4() for _ in range(orders)]
+    start = datetime(2024, 1, 1)
+    with Session(engine) as db:
+        db.add_all(
+            User(username=user.username, password_hash=password_hash, role=UserRole(user.role))
+            for user in seeded_users
+        )
+        db.commit()
+        for offset in range(0, orders, CHUNK_SIZE):
+            rows = []
+            for order_id in order_ids[offset:offset + CHUNK_SIZE]:
+                # Every view gets rows, and orders further along the workflow
+                # are older, as in a real shop.
+                stage = rng.choices((0, 1, 2, 3), weights=(3, 2, 2, 5))[0]
+                minutes = (3 - stage) * STAGE_SPAN_MINUTES + rng.randint(0, STAGE_SPAN_MINUTES)
+                rows.append({
+                    "id": order_id,
+                    "invoice_number": f"LOAD-{run_id}-{order_id.hex[:10]}",
+                    "sold_at": start + timedelta(minutes=minutes),
+                    "store": rng.choice(STORES),
+                    "client_name": f"{rng.choice(CLIENT_PREFIXES)} {rng.choice(LAST_NAMES)} "
+                                   f"{rng.choice(FIRST_NAMES)}",
+                    "product_name": rng.choice(PRODUCTS),
+                    "prepared": stage >= 1,
+                    "built": stage >= 2,
+                    "delivered": stage >= 3,
+                })
+            db.execute(insert(Order), rows)
+            db.commit()
+    engine.dispose()
+    return Seeded(users=seeded_users, order_ids=[str(order_id) for order_id in order_ids])
@@ -1,14 +1,16 @@
-import React, { useEffect, useMemo, useState } from "react";
+import React, { useEffect, useMemo, useRef, useState } from "react";
 import {
   createOrder,
   createUser,
   deleteOrder,
   deleteUser,
   getMe,
+  getOrderStats,
   importInvoice,
   listOrders,
   listUsers,
   login,
+  openOrderStream,
   setToken,
   updateOrder,
   updateUser,
@@ -22,6 +24,69 @@ const views = [
   { key: "done", label: "Terminé" },
 ];
 
+const RESET_RELOAD_DELAY_MS = 1000;
+const STATS_RELOAD_DELAY_MS = 2000;
+
+// Mirrors ORDER_VIEW_FILTERS and normalize_search_text on the backend so
+// live events can be applied without reloading the list.
+function matchesView(order, view) {
+  const notGiven = order.status !== "DEJA DONNER";
+  switch (view) {
+    case "to_prepare":
+      return !order.prepared && notGiven;
+    case "to_build":
+      return order.prepared && !order.built && notGiven;
+    case "to_deliver":
+      return order.built && !order.delivered;
+    case "done":
+      return order.delivered;
+    default:
+      return true;
+  }
+}
+
+function normalizeSearchText(...parts) {
+  return parts
+    .filter(Boolean)
+    .join(" ")
+    .normalize("NFKD")
+    .replace(/[\u0300-\u036f]/g, "")
+    .toLowerCase()
+    .split(/\s+/)
+    .filter(Boolean)
+    .join(" ");
+}
+
+function matchesSearch(order, search) {
+  const term = normalizeSearchText(search);
+  if (!term) {
+    return true;
+  }
+  const text = normalizeSearchText(
+    order.invoice_number,
+    order.client_name,
+    order.product_name,
+    order.store
+  );
+  return text.includes(term);
+}
+
+function compareOrders(a, b) {
+  const bySoldAt = new Date(b.sold_at) - new Date(a.sold_at);
+  if (bySoldAt !== 0) {
+    return bySoldAt;
+  }
+  return a.id < b.id ? 1 : a.id > b.id ? -1 : 0;
+}
+
+function applyOrderEvent(orders, type, data, { view, search }) {
+  const others = orders.filter((order) => order.id !== data.id);
+  if (type === "deleted" || !matchesView(data, view) || !matchesSearch(data, search)) {
+    return others.length === orders.length ? orders : others;
+  }
+  return [...others, data].sort(compareOrders);
+}
+
 function formatDateTime(value) {
   const date = new Date(value);
   return {
@@ -72,7 +137,7 @@ function LoginForm({ onLogin }) {
 
 function OrdersView({ user }) {
   const [orders, setOrders] = useState([]);
-  const [allOrders, setAllOrders] = useState([]);
+  const [stats, setStats] = useState(null);
   const [view, setView] = useState("all");
   const [search, setSearch] = useState("");
   const [error, setError] = useState("");
@@ -86,9 +151,35 @@ function OrdersView({ user }) {
     sold_at: "",
   });
 
+  const filters = useRef({ view, search });
+  filters.current = { view, search };
+
   useEffect(() => {
-    const timer = setInterval(() => setRefreshTick((tick) => tick + 1), 15000);
-    return () => clearInterval(timer);
+    // Events are applied to the loaded list; a batch import sends one per
+    // order, so only the stats and a "reset" are reloaded, debounced.
+    let resetTimer;
+    let statsTimer;
+    const source = openOrderStream((type, data) => {
+      if (type === "reset") {
+        clearTimeout(resetTimer);
+        resetTimer = setTimeout(() => setRefreshTick((tick) => tick + 1), RESET_RELOAD_DELAY_MS);
+        return;
+      }
+      setOrders((current) => applyOrderEvent(current, type, data, filters.current));
+      clearTimeout(statsTimer);
+      statsTimer = setTimeout(() => {
+        getOrderStats()
+          .then((statsData) => setStats(statsData.totals))
+          .catch(() => {});
+      }, STATS_RELOAD_DELAY_MS);
+    });
+    const timer = setInterval(() => setRefreshTick((tick) => tick + 1), 60000);
+    return () => {
+      source.close();
+      clearInterval(timer);
+      clearTimeout(resetTimer);
+      clearTimeout(statsTimer);
+    };
   }, []);
 
   useEffect(() => {
@@ -98,8 +189,8 @@ function OrdersView({ user }) {
       try {
         const data = await listOrders({ view, q: search || undefined });
         setOrders(data);
-        const fullData = await listOrders({ view: "all" });
-        setAllOrders(fullData);
+        const statsData = await getOrderStats();
+        setStats(statsData.totals);
       } catch (err) {
         setError(err.message);
       } finally {
@@ -109,17 +200,15 @@ function OrdersView({ user }) {
     load();
   }, [view, search, refreshTick]);
 
-  const counters = useMemo(() => {
-    const total = allOrders.length;
-    const toPrepare = allOrders.filter(
-      (order) => !order.prepared && (!order.status || order.status !== "DEJA DONNER")
-    ).length;
-    const toBuild = allOrders.filter(
-      (order) => order.prepared && !order.built && (!order.status || order.status !== "DEJA DONNER")
-    ).length;
-    const toDeliver = allOrders.filter((order) => order.built && !order.delivered).length;
-    return { total, toPrepare, toBuild, toDeliver };
-  }, [allOrders]);
+  const counters = useMemo(
+    () => ({
+      total: stats?.total ?? 0,
+      toPrepare: stats?.to_prepare ?? 0,
+      toBuild: stats?.to_build ?? 0,
+      toDeliver: stats?.to_deliver ?? 0,
+    }),
+    [stats]
+  );
 
   const canEditPrepared = user.role === "ADMIN" || user.role === "VENDOR";
   const canEditBuilt = user.role === "ADMIN" || user.role === "BUILDER";
@@ -48,6 +48,68 @@ export function listOrders(params = {}) {
   return request(`/orders?${search}`);
 }
 
+export function getOrderStats(params = {}) {
+  const search = new URLSearchParams(params).toString();
+  return request(`/orders/stats?${search}`);
+}
+
+const STREAM_RETRY_MS = 3000;
+
+export function openOrderStream(onEvent) {
+  // The stream token expires within a minute, so the browser's own reconnect
+  // (same URL) would be refused: reconnect with a fresh token and resume from
+  // the last event received.
+  let source = null;
+  let closed = false;
+  let lastEventId = "";
+  let retryTimer;
+
+  const retry = () => {
+    if (!closed) {
+      retryTimer = setTimeout(connect, STREAM_RETRY_MS);
+    }
+  };
+
+  async function connect() {
+    let token;
+    try {
+      ({ access_token: token } = await request("/auth/stream-token", { method: "POST" }));
+    } catch {
+      retry();
+      return;
+    }
+    if (closed) {
+      return;
+    }
+    const params = new URLSearchParams({ access_token: token });
+    if (lastEventId) {
+      params.set("resume", lastEventId);
+    }
+    source = new EventSource(`${API_BASE}/orders/stream?${params}`);
+    ["created", "updated", "deleted", "reset"].forEach((type) =>
+      source.addEventListener(type, (event) => {
+        lastEventId = event.lastEventId || lastEventId;
+        onEvent(type, JSON.parse(event.data));
+      })
+    );
+    source.onerror = () => {
+      source.close();
+      retry();
+    };
+  }
+
+  connect();
+  return {
+    close() {
+      closed = true;
+      clearTimeout(retryTimer);
+      if (source) {
+        source.close();
+      }
+    },
+  };
+}
+
 export function createOrder(payload) {
   return request("/orders", {
     method: "POST",
@@ -4,19 +4,31 @@ import uuid
 import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
 
 sys.path.append("backend")
 
-from app.api.deps import get_db  # noqa: E402
+from app.api.deps import get_db, get_session_factory, get_sync_db, user_cache  # noqa: E402
+from app.api.routes.orders import order_list_cache  # noqa: E402
+from app.core.metrics import instrument_engine  # noqa: E402
 from app.core.security import hash_password  # noqa: E402
 from app.db.base import Base  # noqa: E402
 from app.main import app  # noqa: E402
 from app.models.user import User, UserRole  # noqa: E402
+from app.services.import_jobs import job_runner  # noqa: E402
 
 SQLALCHEMY_DATABASE_URL = "sqlite:///./test.db"
 engine = create_engine(SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False})
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+async_engine = create_async_engine("sqlite+aiosqlite:///./test.db", poolclass=NullPool)
+TestingAsyncSessionLocal = async_sessionmaker(
+    bind=async_engine, autoflush=False, expire_on_commit=False
+)
+job_runner.session_factory = TestingSessionLocal
+instrument_engine(engine)
+instrument_engine(async_engine.sync_engine)
 
 
 @pytest.fixture(scope="session", autouse=True)
@@ -33,18 +45,27 @@ def db_session():
     try:
         yield session
     finally:
+        session.rollback()
+        for table in reversed(Base.metadata.sorted_tables):
+            session.execute(table.delete())
+        session.commit()
         session.close()
+        user_cache.clear()
+        order_list_cache.clear()
 
 
 @pytest.fixture()
 def client(db_session):
-    def override_get_db():
-        try:
-            yield db_session
-        finally:
-            pass
+    async def override_get_db():
+        async with TestingAsyncSessionLocal() as session:
+            yield session
+
+    def override_get_sync_db():
+        yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_sync_db] = override_get_sync_db
+    app.dependency_overrides[get_session_factory] = lambda: TestingAsyncSessionLocal
     with TestClient(app) as test_client:
         yield test_client
 
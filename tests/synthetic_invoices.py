@@ -0,0 +1,130 @@
+import random
+import textwrap
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+
+STORES = (
+    "DREAM STATION SAINT PIERRE",
+    "DREAM STATION SAINT DENIS",
+    "DREAM STATION LE PORT",
+    "DREAM STATION SAINT ANDRE",
+)
+CLIENT_PREFIXES = ("Mme", "M.", "Mr", "Mlle")
+FIRST_NAMES = ("Charline", "Hélène", "Paul", "Zoé", "Anaïs", "Jean", "Mickaël", "Léa")
+LAST_NAMES = ("RUH", "GRONDIN", "PAYET", "HOARAU", "MÈRE", "FONTAINE", "RIVIERE")
+PRODUCTS = (
+    "PC GAMER Raijin",
+    "PC GAMER Kitsune",
+    "PACK COMPLET PC GAMER Susanoo",
+    "PC GAMER Fujin RTX",
+)
+COMPONENTS = (
+    "BOITIER DF FT418 BLACK + 6 ARGB FAN",
+    "CARTE MERE GIGABYTE B850M D3HP",
+    "CPU AMD RYZEN 7 8700F TRAY (4.2 GHZ / 4.7 GHZ)",
+    "VENTIRAD DF M400 ARGB BLACK",
+    "DDR 5 16 GO CRUCIAL PRO   (1 X 16 GO) 5600 MHZ CL46",
+    "SSD NVME CRUCIAL E100 1TO (1000 GO) GEN4 2280",
+    "CARTE GRAPHIQUE MSI RTX 5060 Ti 8G SHADOW 2X OC",
+    "ALIMENTATION DF AP750 750W BLACK",
+)
+PAGE_WIDTH, PAGE_HEIGHT = 595, 842
+MARGIN = 36
+FONT_SIZE = 7
+LINE_HEIGHT = FONT_SIZE * 1.25
+CGV_LINE = (
+    "Les présentes Conditions Générales de Vente régissent les ventes en ligne de jeux, consoles, "
+    "accessoires et guides conclues entre le client et la société DREAMSTATION."
+)
+
+
+@dataclass
+class SyntheticInvoice:
+    invoice_number: str
+    sold_at: datetime
+    store: str
+    client_name: str
+    product_name: str
+    pages: list[list[str]]
+
+    @property
+    def text(self) -> str:
+        return "\n\n".join("\n".join(page) for page in self.pages)
+
+
+def _header(invoice: "SyntheticInvoice") -> list[str]:
+    return [
+        f"Facture N°{invoice.invoice_number}",
+        invoice.store,
+        "51 RUE DE LORION",
+        "97410 SAINT PIERRE",
+        "Reunion (RE)",
+        invoice.client_name,
+        "62 rue romain rolland",
+        f"Date : {invoice.sold_at:%d/%m/%Y, %H:%M:%S}",
+        "S.A.R.L M.S.2D au capital de 102000 Euros - RCS : ST-DENIS DE LA REUNION",
+    ]
+
+
+def generate_invoice(rng: random.Random, index: int) -> SyntheticInvoice:
+    product = rng.choice(PRODUCTS)
+    invoice = SyntheticInvoice(
+        invoice_number=f"{rng.randint(1, 9):02d}-{10000 + index}-{rng.randint(1, 3)}",
+        sold_at=datetime(2024, 1, 1) + timedelta(minutes=rng.randint(0, 60 * 24 * 900)),
+        store=rng.choice(STORES),
+        client_name=f"{rng.choice(CLIENT_PREFIXES)} {rng.choice(LAST_NAMES)} {rng.choice(FIRST_NAMES)}",
+        product_name=product,
+        pages=[],
+    )
+    page_count = rng.choice((1, 1, 2, 4, 9))
+    body = ["Désignation", "Rem", "PU Net HT", "Qté", "Taux TVA", "HT", "TTC"]
+    # Component lines sometimes come first so the parser has to skip them.
+    components = rng.sample(COMPONENTS, rng.randint(3, len(COMPONENTS)))
+    if rng.random() < 0.3:
+        body += [f"{rng.choice(COMPONENTS[:4])} PC GAMER"]
+    for line in [product, product, *components]:
+        body += [line, "100%", "0.00", "1", "0.00", "0.00", "0.00"]
+    body += ["Net à payer : 0.00 €", f"Page 1/{page_count}"]
+    invoice.pages.append(_header(invoice) + body)
+    for page in range(2, page_count + 1):
+        filler = [CGV_LINE] * rng.randint(20, 60)
+        invoice.pages.append(_header(invoice) + filler + [f"Page {page}/{page_count}"])
+    return invoice
+
+
+def generate_corpus(count: int, seed: int = 1234) -> list[SyntheticInvoice]:
+    rng = random.Random(seed)
+    return [generate_invoice(rng, index) for index in range(count)]
+
+
+def render_pdf(invoice: SyntheticInvoice) -> bytes:
+    # One line of text per PDF line, in reading order, so the extracted text
+    # matches `invoice.text` up to wrapping; long logical pages overflow onto
+    # extra PDF pages the way the real invoices do.
+    import fitz
+
+    lines_per_page = int((PAGE_HEIGHT - 2 * MARGIN) / LINE_HEIGHT)
+    document = fitz.open()
+    for lines in invoice.pages:
+        wrapped = [part for line in lines for part in textwrap.wrap(line, 140) or [""]]
+        for start in range(0, len(wrapped), lines_per_page):
+            page = document.new_page(width=PAGE_WIDTH, height=PAGE_HEIGHT)
+            for row, line in enumerate(wrapped[start:start + lines_per_page]):
+                page.insert_text(
+                    (MARGIN, MARGIN + (row + 1) * LINE_HEIGHT), line, fontsize=FONT_SIZE
+                )
+    try:
+        return document.tobytes(garbage=3, deflate=True)
+    finally:
+        document.close()
+
+
+def write_corpus(directory: Path, count: int, seed: int = 1234) -> list[tuple[Path, SyntheticInvoice]]:
+    directory.mkdir(parents=True, exist_ok=True)
+    written = []
+    for invoice in generate_corpus(count, seed):
+        path = directory / f"{invoice.invoice_number}.pdf"
+        path.write_bytes(render_pdf(invoice))
+        written.append((path, invoice))
+    return written
@@ -1,4 +1,14 @@
-from app.core.security import create_access_token
+import asyncio
+import os
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+
+from app.core import security
+from app.core.config import get_settings
+from app.core.security import create_access_token, decode_access_token, pwd_context
+from app.models.user import User, UserRole
+from app.services.events import broker
 
 
 def test_login(client, admin_user):
@@ -8,8 +18,92 @@ def test_login(client, admin_user):
     assert "access_token" in data
 
 
+def test_login_rejects_wrong_password(client, admin_user):
+    response = client.post("/api/auth/login", json={"username": "admin", "password": "nope"})
+    assert response.status_code == 401
+
+
+def test_login_rehashes_outdated_cost(client, db_session, admin_user):
+    admin_user.password_hash = pwd_context.copy(bcrypt__rounds=4).hash("secret")
+    db_session.commit()
+
+    response = client.post("/api/auth/login", json={"username": "admin", "password": "secret"})
+    assert response.status_code == 200
+
+    db_session.expire_all()
+    rehashed = db_session.get(User, admin_user.id).password_hash
+    assert not pwd_context.needs_update(rehashed)
+    assert pwd_context.verify("secret", rehashed)
+
+
+def test_password_hashing_replaces_a_broken_pool(monkeypatch):
+    monkeypatch.setattr(get_settings(), "password_hash_workers", 1)
+    security.shutdown_hash_executor()
+    broken = security._get_hash_executor()
+    with pytest.raises(BrokenProcessPool):
+        broken.submit(os._exit, 1).result()
+
+    try:
+        hashed = asyncio.run(security.hash_password_async("secret"))
+        assert pwd_context.verify("secret", hashed)
+        assert security._hash_executor is not broken
+    finally:
+        security.shutdown_hash_executor()
+
+
 def test_me(client, admin_user):
     token = create_access_token(str(admin_user.id))
     response = client.get("/api/auth/me", headers={"Authorization": f"Bearer {token}"})
     assert response.status_code == 200
     assert response.json()["username"] == "admin"
+
+
+def test_current_user_cache(client, db_session, admin_user, vendor_user):
+    admin_headers = {"Authorization": f"Bearer {create_access_token(str(admin_user.id))}"}
+    vendor_headers = {"Authorization": f"Bearer {create_access_token(str(vendor_user.id))}"}
+
+    before = client.get("/api/auth/cache-stats", headers=admin_headers).json()
+    assert client.get("/api/auth/me", headers=vendor_headers).status_code == 200
+    assert client.get("/api/auth/me", headers=vendor_headers).status_code == 200
+    after = client.get("/api/auth/cache-stats", headers=admin_headers).json()
+    assert after["hits"] - before["hits"] >= 2
+
+    response = client.patch(
+        f"/api/users/{vendor_user.id}", json={"role": "BUILDER"}, headers=admin_headers
+    )
+    assert response.status_code == 200
+    assert client.get("/api/auth/me", headers=vendor_headers).json()["role"] == "BUILDER"
+
+    assert client.delete(f"/api/users/{vendor_user.id}", headers=admin_headers).status_code == 200
+    assert client.get("/api/auth/me", headers=vendor_headers).status_code == 401
+
+
+def test_stream_token_is_only_valid_for_the_stream(client, vendor_user):
+    access_token = create_access_token(str(vendor_user.id))
+    headers = {"Authorization": f"Bearer {access_token}"}
+
+    response = client.post("/api/auth/stream-token", headers=headers)
+    assert response.status_code == 200
+    stream_token = response.json()["access_token"]
+    assert decode_access_token(stream_token)["scope"] == "stream"
+
+    stream_headers = {"Authorization": f"Bearer {stream_token}"}
+    assert client.get("/api/auth/me", headers=stream_headers).status_code == 401
+    assert client.get("/api/orders/stream", headers=stream_headers).status_code == 401
+    # Long-lived tokens are refused in the URL, where they would be logged.
+    response = client.get("/api/orders/stream", params={"access_token": access_token})
+    assert response.status_code == 401
+
+
+def test_user_invalidation_from_another_worker(client, db_session, vendor_user):
+    headers = {"Authorization": f"Bearer {create_access_token(str(vendor_user.id))}"}
+    assert client.get("/api/auth/me", headers=headers).json()["role"] == "VENDOR"
+    vendor_user.role = UserRole.BUILDER
+    db_session.commit()
+    history = list(broker._history)
+
+    # What the NOTIFY listener does when another worker demotes the user.
+    broker.publish("user_invalidated", {"id": str(vendor_user.id)})
+
+    assert client.get("/api/auth/me", headers=headers).json()["role"] == "BUILDER"
+    assert list(broker._history) == history
@@ -1,6 +1,23 @@
+import io
+import time
+import zipfile
 from pathlib import Path
 
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event, select
+from starlette.applications import Starlette
+from starlette.responses import PlainTextResponse
+from starlette.routing import Route
+
+from app.core.config import get_settings
+from app.core.limits import BodySizeLimitMiddleware
 from app.core.security import create_access_token
+from app.models.invoice_parse_cache import InvoiceParseCache
+from app.models.order import Order
+from app.services import invoice_import, parse_cache
+from app.services.archive_import import Checkpoint, import_directory
+from app.services.invoice_import import ParsedInvoice
 
 
 def test_import_invoice(client, vendor_user):
@@ -16,3 +33,249 @@ def test_import_invoice(client, vendor_user):
     data = response.json()
     assert data["status"] in {"created", "already_exists"}
     assert data["order"]["invoice_number"] == "02-13073-1"
+    assert data["backend"] == "fitz"
+
+
+def test_import_invoices_batch(client, vendor_user):
+    token = create_access_token(str(vendor_user.id))
+    pdf_bytes = Path("tests/fixtures/facture_exemple.pdf").read_bytes()
+    sample_bytes = Path("tests/fixtures/invoice-sample.pdf").read_bytes()
+    archive = io.BytesIO()
+    with zipfile.ZipFile(archive, "w") as handle:
+        handle.writestr("march/facture.pdf", pdf_bytes)
+        handle.writestr("march/notes.txt", b"ignored")
+
+    response = client.post(
+        "/api/import/invoices",
+        files=[
+            ("files", ("a.pdf", pdf_bytes, "application/pdf")),
+            ("files", ("notes.txt", b"hello", "text/plain")),
+            ("files", ("sample.pdf", sample_bytes, "application/pdf")),
+            ("files", ("batch.zip", archive.getvalue(), "application/zip")),
+        ],
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    assert response.status_code == 200
+    results = response.json()
+    assert [item["filename"] for item in results] == [
+        "a.pdf",
+        "notes.txt",
+        "sample.pdf",
+        "batch.zip/march/facture.pdf",
+    ]
+    assert results[0]["status"] == "created"
+    assert results[0]["order"]["invoice_number"] == "02-13073-1"
+    assert results[1]["errors"] == {"code": "UNSUPPORTED_FILE"}
+    assert results[2]["status"] == "error"
+    assert results[3]["status"] == "already_exists"
+    assert results[3]["order"]["id"] == results[0]["order"]["id"]
+
+
+def test_import_parsed_invoices_uses_bulk_statements(db_session, vendor_user):
+    parsed = [
+        ParsedInvoice(
+            filename=f"{index}.pdf",
+            data={
+                "invoice_number": f"BULK-{index}",
+                "store": "DREAM STATION SAINT PIERRE",
+                "client_name": "Mme Jane Doe",
+                "product_name": "PC GAMER Raijin",
+                "sold_at": "2026-03-01T10:00:00",
+            },
+        )
+        for index in range(20)
+    ]
+    created_by = vendor_user.id
+    statements = []
+
+    def record(conn, cursor, statement, *args):
+        statements.append(statement.split()[0])
+
+    event.listen(db_session.get_bind(), "before_cursor_execute", record)
+    try:
+        results = invoice_import.import_parsed_invoices(db_session, parsed, created_by)
+    finally:
+        event.remove(db_session.get_bind(), "before_cursor_execute", record)
+
+    assert [result.status for result in results] == ["created"] * 20
+    assert results[0].order.invoice_number == "BULK-0"
+    # One lookup of existing invoices and one INSERT ... RETURNING, no refreshes.
+    assert statements == ["SELECT", "INSERT"]
+
+
+def test_import_directory_resumes_from_checkpoint(db_session, tmp_path):
+    archive = tmp_path / "archive"
+    for name, fixture in (
+        ("2023/01/facture.pdf", "facture_exemple.pdf"),
+        ("2023/02/copie.PDF", "facture_exemple.pdf"),
+        ("2024/sample.pdf", "invoice-sample.pdf"),
+    ):
+        target = archive / name
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_bytes(Path("tests/fixtures", fixture).read_bytes())
+    (archive / "2024/notes.txt").write_text("ignored")
+
+    checkpoint = Checkpoint(tmp_path / "archive.checkpoint")
+    stats = import_directory(db_session, archive, checkpoint, workers=2, chunk_size=2)
+    assert (stats.files, stats.created, stats.already_exists, stats.resumed) == (3, 1, 1, 0)
+    assert sum(stats.errors.values()) == 1
+    assert db_session.scalars(select(Order.invoice_number)).all() == ["02-13073-1"]
+    assert sorted(checkpoint.path.read_text().split()) == [
+        "2023/01/facture.pdf",
+        "2023/02/copie.PDF",
+        "2024/sample.pdf",
+    ]
+
+    resumed = import_directory(
+        db_session, archive, Checkpoint(checkpoint.path), workers=2, chunk_size=2
+    )
+    assert (resumed.files, resumed.created, resumed.resumed) == (0, 0, 3)
+
+
+def test_import_invoice_reuses_parse_cache(client, vendor_user, db_session, monkeypatch):
+    headers = {"Authorization": f"Bearer {create_access_token(str(vendor_user.id))}"}
+    pdf_bytes = Path("tests/fixtures/facture_exemple.pdf").read_bytes()
+
+    def upload():
+        return client.post(
+            "/api/import/invoice",
+            files={"file": ("invoice.pdf", pdf_bytes, "application/pdf")},
+            headers=headers,
+        ).json()
+
+    first = upload()
+    monkeypatch.setattr(
+        invoice_import, "parse_invoice_pdf", lambda payload: pytest.fail("cache miss")
+    )
+    second = upload()
+
+    assert first["backend"] == "fitz"
+    assert second["backend"] == "cache"
+    assert second["status"] == "already_exists"
+    assert second["order"]["id"] == first["order"]["id"]
+    entry = db_session.get(InvoiceParseCache, parse_cache.content_hash(pdf_bytes))
+    assert entry.data["invoice_number"] == "02-13073-1"
+
+
+def test_parse_cache_evicts_least_recently_used(db_session, monkeypatch):
+    monkeypatch.setattr(get_settings(), "parse_cache_max_entries", 2)
+
+    def parse(files):
+        return [ParsedInvoice(filename=name, error_code="MISSING_STORE") for name, _ in files]
+
+    for payload in (b"a", b"b", b"a", b"c"):
+        parse_cache.parse_cached(db_session, [("x.pdf", payload)], parse)
+        time.sleep(0.01)
+
+    kept = set(db_session.scalars(select(InvoiceParseCache.sha256)))
+    assert kept == {parse_cache.content_hash(b"a"), parse_cache.content_hash(b"c")}
+
+
+def test_import_invoice_rejects_oversized_upload(client, vendor_user, monkeypatch, tmp_path):
+    monkeypatch.setattr(get_settings(), "pdf_max_bytes", 1024)
+    monkeypatch.setattr(get_settings(), "upload_spool_dir", str(tmp_path))
+    response = client.post(
+        "/api/import/invoice",
+        files={"file": ("big.pdf", b"%PDF" + b"0" * 4096, "application/pdf")},
+        headers={"Authorization": f"Bearer {create_access_token(str(vendor_user.id))}"},
+    )
+    assert response.status_code == 413
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_import_invoices_checks_archive_limits_before_extracting(client, vendor_user, monkeypatch):
+    headers = {"Authorization": f"Bearer {create_access_token(str(vendor_user.id))}"}
+
+    def make_archive(members):
+        archive = io.BytesIO()
+        with zipfile.ZipFile(archive, "w", zipfile.ZIP_DEFLATED) as handle:
+            for name, payload in members:
+                handle.writestr(name, payload)
+        return archive.getvalue()
+
+    def upload(archive):
+        return client.post(
+            "/api/import/invoices",
+            files=[("files", ("batch.zip", archive, "application/zip"))],
+            headers=headers,
+        )
+
+    crowded = make_archive([(f"{index}.pdf", b"%PDF") for index in range(3)])
+    bomb = make_archive([("bomb.pdf", b"%PDF" + b"0" * 1024 * 1024)])
+    bulky = make_archive([(f"{index}.pdf", b"%PDF" + b"0" * 3000) for index in range(2)])
+    monkeypatch.setattr(get_settings(), "import_batch_max_files", 2)
+    monkeypatch.setattr(get_settings(), "pdf_max_bytes", 1024)
+    monkeypatch.setattr(zipfile.ZipFile, "open", lambda *args, **kwargs: pytest.fail("extracted"))
+
+    response = upload(crowded)
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Too many files (max 2)"
+
+    response = upload(bomb)
+    assert response.status_code == 413
+    assert response.json()["detail"] == "File too large: batch.zip/bomb.pdf"
+
+    monkeypatch.setattr(get_settings(), "pdf_max_bytes", 0)
+    monkeypatch.setattr(get_settings(), "upload_max_request_bytes", 4096)
+    assert upload(bulky).status_code == 413
+
+
+def test_body_size_limit_middleware():
+    async def echo(request):
+        return PlainTextResponse(str(len(await request.body())))
+
+    app = Starlette(routes=[Route("/upload", echo, methods=["POST"])])
+    app.add_middleware(BodySizeLimitMiddleware, max_bytes=10, path_prefix="/upload")
+    limited = TestClient(app)
+
+    assert limited.post("/upload", content=b"x" * 10).text == "10"
+    assert limited.post("/upload", content=b"x" * 11).status_code == 413
+
+    def chunks():
+        yield b"x" * 8
+        yield b"x" * 8
+
+    assert limited.post("/upload", content=chunks()).status_code == 413
+
+
+def _wait_for_job(client, job_id, headers, timeout=20):
+    deadline = time.monotonic() + timeout
+    while True:
+        data = client.get(f"/api/import/jobs/{job_id}", headers=headers).json()
+        if data["status"] in {"DONE", "FAILED"} or time.monotonic() > deadline:
+            return data
+        time.sleep(0.05)
+
+
+def test_import_job(client, vendor_user):
+    headers = {"Authorization": f"Bearer {create_access_token(str(vendor_user.id))}"}
+    pdf_path = Path("tests/fixtures/facture_exemple.pdf")
+    with pdf_path.open("rb") as handle:
+        response = client.post(
+            "/api/import/jobs",
+            files={"file": ("invoice.pdf", handle, "application/pdf")},
+            headers=headers,
+        )
+    assert response.status_code == 202
+    job = response.json()
+    assert job["status"] in {"QUEUED", "RUNNING", "DONE"}
+
+    data = _wait_for_job(client, job["id"], headers)
+    assert data["status"] == "DONE"
+    assert data["result"] == "created"
+    assert data["order"]["invoice_number"] == "02-13073-1"
+
+
+def test_import_job_timeout(client, vendor_user, monkeypatch):
+    monkeypatch.setattr(get_settings(), "import_job_timeout_seconds", 0)
+    headers = {"Authorization": f"Bearer {create_access_token(str(vendor_user.id))}"}
+    pdf_bytes = Path("tests/fixtures/facture_exemple.pdf").read_bytes()
+    response = client.post(
+        "/api/import/jobs",
+        files={"file": ("invoice.pdf", pdf_bytes, "application/pdf")},
+        headers=headers,
+    )
+
+    data = _wait_for_job(client, response.json()["id"], headers)
+    assert data["status"] == "FAILED"
+    assert data["error_code"] == "PARSE_TIMEOUT"
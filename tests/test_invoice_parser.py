@@ -1,6 +1,19 @@
 from pathlib import Path
 
-from app.invoice_parser import extract_pdf_text, parse_invoice_pdf
+import pytest
+
+from app import invoice_parser
+from app.core.config import get_settings
+from app.invoice_parser import (
+    InvoiceParseError,
+    extract_pdf_text,
+    parse_invoice_pdf,
+    parse_invoice_text,
+    scan_pdf_fields,
+)
+from app.services import pdf_parser
+from app.services.invoice_fields import InvoiceFieldScanner
+from synthetic_invoices import write_corpus
 
 
 def test_parse_invoice_pdf_extracts_fields():
@@ -21,3 +34,116 @@ def test_parse_invoice_pdf_deduplicates_pc_gamer_lines():
 
     text = extract_pdf_text(pdf_bytes)
     assert text.count(data["product_name"]) >= 2
+
+
+def test_parse_invoice_text_fields_split_across_lines():
+    text = "\n".join(
+        [
+            "Facture N°",
+            "02-99999-1",
+            "DREAM STATION SAINT DENIS",
+            "M. Paul Durand",
+            "Date :",
+            "16/01/2026, 10:01:41",
+            "CARTE MERE PC GAMER B850",
+            "PC GAMER   Kitsune",
+        ]
+    )
+    data = parse_invoice_text(text)
+
+    assert data["invoice_number"] == "02-99999-1"
+    assert data["sold_at"] == "2026-01-16T10:01:41"
+    assert data["client_name"] == "M. Paul Durand"
+    assert data["product_name"] == "PC GAMER Kitsune"
+
+
+def test_scanner_stops_once_all_fields_are_found():
+    lines = [
+        "Facture N°02-1-1",
+        "DREAM STATION LE PORT",
+        "Mme Jane Doe",
+        "Date : 01/02/2026, 08:00:00",
+        "PC GAMER Raijin",
+    ]
+    consumed = []
+
+    def tracked():
+        for line in lines + ["never read"]:
+            consumed.append(line)
+            yield line
+
+    scanner = InvoiceFieldScanner()
+    assert scanner.feed(tracked())
+    assert consumed == lines
+
+
+def test_services_pdf_parser_matches_invoice_parser():
+    pdf_path = Path("tests/fixtures/facture_exemple.pdf")
+    data, errors = pdf_parser.parse_invoice_pdf(str(pdf_path))
+    expected = parse_invoice_pdf(pdf_path.read_bytes())
+
+    assert errors == {}
+    assert data.invoice_number == expected["invoice_number"]
+    assert data.sold_at.isoformat() == expected["sold_at"]
+    assert data.client_name == expected["client_name"]
+    assert data.product_name == expected["product_name"]
+
+
+def test_parsers_on_synthetic_invoices(tmp_path):
+    for path, invoice in write_corpus(tmp_path, 12, seed=7):
+        data = parse_invoice_pdf(path.read_bytes())
+        assert data["invoice_number"] == invoice.invoice_number
+        assert data["sold_at"] == invoice.sold_at.isoformat()
+        assert data["store"] == invoice.store
+        assert data["client_name"] == invoice.client_name
+        assert data["product_name"] == invoice.product_name
+
+        # The legacy parser has a shorter exclusion list, so only its other fields are pinned.
+        legacy, errors = pdf_parser.parse_invoice_pdf(str(path))
+        assert errors == {}
+        assert (legacy.invoice_number, legacy.sold_at, legacy.client_name) == (
+            invoice.invoice_number,
+            invoice.sold_at,
+            invoice.client_name,
+        )
+
+
+def test_scan_pdf_fields_reads_only_the_first_page(monkeypatch):
+    pdf_bytes = Path("tests/fixtures/facture_exemple.pdf").read_bytes()
+    read_pages = []
+    fitz_pages = invoice_parser._fitz_pages
+
+    def tracked(payload, max_pages):
+        for text in fitz_pages(payload, max_pages):
+            read_pages.append(text)
+            yield text
+
+    monkeypatch.setattr(invoice_parser, "PDF_BACKENDS", (("fitz", tracked),))
+    fields, backend = scan_pdf_fields(pdf_bytes, max_pages=3)
+
+    assert backend == "fitz"
+    assert fields.invoice_number == "02-13073-1"
+    assert len(read_pages) == 1
+
+
+def test_parse_invoice_pdf_falls_back_to_pdfplumber(monkeypatch):
+    def broken(payload, max_pages):
+        raise RuntimeError("boom")
+        yield
+
+    monkeypatch.setattr(
+        invoice_parser,
+        "PDF_BACKENDS",
+        (("fitz", broken), ("pdfplumber", invoice_parser._pdfplumber_pages)),
+    )
+    data = parse_invoice_pdf(Path("tests/fixtures/facture_exemple.pdf").read_bytes())
+
+    assert data["backend"] == "pdfplumber"
+    assert data["invoice_number"] == "02-13073-1"
+
+
+def test_parse_invoice_pdf_rejects_oversized_files(monkeypatch):
+    monkeypatch.setattr(get_settings(), "pdf_max_bytes", 10)
+    with pytest.raises(InvoiceParseError) as excinfo:
+        parse_invoice_pdf(Path("tests/fixtures/facture_exemple.pdf").read_bytes())
+    assert excinfo.value.code == "PDF_TOO_LARGE"
@@ -0,0 +1,65 @@
+import re
+
+from app.core.metrics import Histogram, db_metrics
+from app.core.security import create_access_token
+
+
+def test_server_timing_and_db_metrics(client, admin_user):
+    db_metrics.clear()
+    headers = {"Authorization": f"Bearer {create_access_token(str(admin_user.id))}"}
+
+    response = client.get("/api/orders", params={"limit": 10}, headers=headers)
+    assert response.status_code == 200
+    timing = response.headers["Server-Timing"]
+    match = re.match(r'db;dur=[0-9.]+;desc="(\d+) queries", app;dur=[0-9.]+', timing)
+    # User lookup, count and page.
+    assert match and int(match.group(1)) == 3
+
+    metrics = client.get("/api/metrics/db", headers=headers).json()
+    route = metrics["routes"]["GET /api/orders"]
+    assert route["requests"] == 1
+    assert route["queries"] == 3
+    assert "sync" in metrics["pools"] and "async" in metrics["pools"]
+
+
+def test_db_metrics_requires_admin(client, vendor_user):
+    headers = {"Authorization": f"Bearer {create_access_token(str(vendor_user.id))}"}
+    assert client.get("/api/metrics/db", headers=headers).status_code == 403
+
+
+def test_prometheus_metrics_endpoint(client, admin_user):
+    headers = {"Authorization": f"Bearer {create_access_token(str(admin_user.id))}"}
+    client.post("/api/auth/login", json={"username": "admin", "password": "secret"})
+    with open("tests/fixtures/facture_exemple.pdf", "rb") as handle:
+        client.post(
+            "/api/import/invoice",
+            files={"file": ("invoice.pdf", handle, "application/pdf")},
+            headers=headers,
+        )
+    client.get("/api/orders", headers=headers)
+
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    body = response.text
+    assert "# TYPE http_request_duration_seconds histogram" in body
+    assert 'http_request_duration_seconds_count{method="GET",route="/api/orders",status="200"}' in body
+    assert 'invoice_parse_duration_seconds_count{backend="fitz",code="OK"}' in body
+    assert 'password_hash_duration_seconds_count{operation="verify"}' in body
+    assert "http_requests_in_flight 1" in body
+
+
+def test_histogram_exposition():
+    histogram = Histogram(
+        "test_latency_seconds", "Test.", ("route",), buckets=(0.1, 1.0), registry=None
+    )
+    histogram.observe(0.05, route='/a"b')
+    histogram.observe(0.5, route='/a"b')
+
+    assert histogram.samples() == [
+        'test_latency_seconds_bucket{route="/a\\"b",le="0.1"} 1',
+        'test_latency_seconds_bucket{route="/a\\"b",le="1"} 2',
+        'test_latency_seconds_bucket{route="/a\\"b",le="+Inf"} 2',
+        'test_latency_seconds_sum{route="/a\\"b"} 0.55',
+        'test_latency_seconds_count{route="/a\\"b"} 2',
+    ]
@@ -0,0 +1,130 @@
+import asyncio
+import json
+import threading
+from datetime import datetime, timezone
+
+from app.core.security import create_access_token
+from app.services.events import (
+    OrderEventBroker,
+    PostgresNotifyBridge,
+    broker,
+    order_event_stream,
+    publish_order_events,
+)
+
+
+def test_broker_resume_and_live_delivery():
+    event_broker = OrderEventBroker(history_size=3)
+    first = event_broker.publish("created", {"id": "1"})
+    event_broker.publish("updated", {"id": "1"})
+
+    async def scenario():
+        resumed = event_broker.subscribe(first.token)
+        assert [event.type for event in resumed.backlog] == ["updated"]
+        assert not resumed.reset
+
+        # Publishers run in the request threadpool, not on the event loop.
+        thread = threading.Thread(target=event_broker.publish, args=("deleted", {"id": "1"}))
+        thread.start()
+        thread.join()
+        live = await asyncio.wait_for(resumed.queue.get(), timeout=1)
+        assert live.type == "deleted"
+
+        for index in range(5):
+            event_broker.publish("updated", {"id": str(index)})
+        assert event_broker.subscribe(first.token).reset
+        assert event_broker.subscribe("other-broker-12").reset
+        assert not event_broker.subscribe(None).reset
+
+    asyncio.run(scenario())
+
+
+def test_order_event_stream_format():
+    event_broker = OrderEventBroker()
+    first = event_broker.publish("created", {"id": "1"})
+    event_broker.publish("deleted", {"id": "1"})
+
+    async def collect():
+        subscription = event_broker.subscribe(first.token)
+
+        async def disconnected():
+            return True
+
+        return [chunk async for chunk in order_event_stream(subscription, disconnected, 0.01)]
+
+    chunks = asyncio.run(collect())
+    assert chunks[0] == "retry: 3000\n\n"
+    assert chunks[1].startswith(f"id: {event_broker.broker_id}-2\nevent: deleted\n")
+
+
+def test_order_writes_publish_events(client, vendor_user):
+    token = create_access_token(str(vendor_user.id))
+    headers = {"Authorization": f"Bearer {token}"}
+    payload = {
+        "invoice_number": "EVT-001",
+        "client_name": "Mme Jane Doe",
+        "product_name": "PC GAMER Raijin",
+        "sold_at": datetime.now(timezone.utc).isoformat(),
+    }
+
+    async def capture():
+        return broker.subscribe(None)
+
+    loop = asyncio.new_event_loop()
+    subscription = loop.run_until_complete(capture())
+    try:
+        order = client.post("/api/orders", json=payload, headers=headers).json()
+        client.patch(f"/api/orders/{order['id']}", json={"prepared": True}, headers=headers)
+
+        async def drain():
+            return [await asyncio.wait_for(subscription.queue.get(), timeout=1) for _ in range(2)]
+
+        events = loop.run_until_complete(drain())
+    finally:
+        broker.unsubscribe(subscription)
+        loop.close()
+
+    assert [event.type for event in events] == ["created", "updated"]
+    assert events[1].data["prepared"] is True
+    assert events[0].data["invoice_number"] == "EVT-001"
+
+
+def test_broker_reset_after_fork_refuses_parent_tokens():
+    event_broker = OrderEventBroker()
+    first = event_broker.publish("created", {"id": "1"})
+    parent_id = event_broker.broker_id
+    event_broker.reset_after_fork()
+    assert event_broker.broker_id != parent_id
+
+    async def scenario():
+        assert event_broker.subscribe(first.token).reset
+
+    asyncio.run(scenario())
+
+
+def test_bridge_notifies_a_batch_in_one_statement(monkeypatch):
+    executed = []
+
+    class Connection:
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc_info):
+            return False
+
+        def execute(self, statement, params):
+            executed.append(params)
+
+        def commit(self):
+            pass
+
+    class Engine:
+        def connect(self):
+            return Connection()
+
+    monkeypatch.setattr("app.services.events._bridge", PostgresNotifyBridge(broker, Engine()))
+    publish_order_events([("created", {"id": str(index)}) for index in range(3)])
+
+    assert len(executed) == 1
+    payloads = [json.loads(payload) for payload in executed[0]["payloads"]]
+    assert [payload["data"]["id"] for payload in payloads] == ["0", "1", "2"]
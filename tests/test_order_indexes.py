@@ -0,0 +1,46 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import select, text
+
+from app.api.routes.orders import order_filters
+from app.models.order import Order
+
+
+@pytest.fixture()
+def seeded_orders(db_session):
+    base = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    for index in range(400):
+        stage = index % 10
+        db_session.add(
+            Order(
+                invoice_number=f"IDX-{index}",
+                client_name="M. John Doe",
+                product_name="PC GAMER Raijin",
+                sold_at=base + timedelta(hours=index),
+                prepared=stage >= 2,
+                built=stage >= 4,
+                delivered=stage >= 6,
+                status="DEJA DONNER" if stage == 9 else None,
+            )
+        )
+    db_session.commit()
+    db_session.execute(text("ANALYZE"))
+
+
+@pytest.mark.parametrize("view", ["to_prepare", "to_build", "to_deliver", "done"])
+def test_order_views_use_partial_index(db_session, seeded_orders, view):
+    statement = (
+        select(Order)
+        .where(*order_filters(view))
+        .order_by(Order.sold_at.desc(), Order.id.desc())
+        .limit(50)
+    )
+    compiled = statement.compile(
+        dialect=db_session.get_bind().dialect, compile_kwargs={"literal_binds": True}
+    )
+    plan = db_session.execute(text(f"EXPLAIN QUERY PLAN {compiled}")).all()
+    details = " ".join(row[-1] for row in plan)
+
+    assert f"ix_orders_{view}" in details
+    assert "TEMP B-TREE" not in details
@@ -0,0 +1,56 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.core.security import create_access_token
+from app.models.order import Order
+
+
+@pytest.fixture()
+def search_orders(db_session):
+    base = datetime(2026, 2, 1, tzinfo=timezone.utc)
+    orders = [
+        ("SRCH-1", "Mme Hélène Mère", "PC GAMER Raijin", "DREAM STATION SAINT PIERRE"),
+        ("SRCH-2", "M. Paul Durand", "PC GAMER Mère Edition", "DREAM STATION SAINT DENIS"),
+        ("SRCH-3", "Mlle Zoé Martin", "PC GAMER Kitsune", "DREAM STATION LE PORT"),
+    ]
+    for index, (number, client, product, store) in enumerate(orders):
+        db_session.add(
+            Order(
+                invoice_number=number,
+                client_name=client,
+                product_name=product,
+                store=store,
+                sold_at=base + timedelta(days=index),
+            )
+        )
+    db_session.commit()
+
+
+def _search(client, user, **params):
+    token = create_access_token(str(user.id))
+    response = client.get(
+        "/api/orders", params=params, headers={"Authorization": f"Bearer {token}"}
+    )
+    assert response.status_code == 200
+    return [item["invoice_number"] for item in response.json()]
+
+
+def test_search_is_accent_and_case_insensitive(client, vendor_user, search_orders):
+    assert set(_search(client, vendor_user, q="mere")) == {"SRCH-1", "SRCH-2"}
+    assert _search(client, vendor_user, q="HELENE") == ["SRCH-1"]
+    assert _search(client, vendor_user, q="zo") == ["SRCH-3"]
+    assert _search(client, vendor_user, q="100%") == []
+
+
+def test_search_relevance_ranking(client, vendor_user, search_orders):
+    assert _search(client, vendor_user, q="mere", sort="relevance") == ["SRCH-1", "SRCH-2"]
+
+
+def test_search_text_follows_updates(client, db_session, vendor_user, search_orders):
+    order = db_session.query(Order).filter(Order.invoice_number == "SRCH-3").one()
+    order.client_name = "Mme Anaïs Grondin"
+    db_session.commit()
+
+    assert _search(client, vendor_user, q="anais") == ["SRCH-3"]
+    assert _search(client, vendor_user, q="zoe") == []
@@ -1,6 +1,17 @@
-from datetime import datetime, timezone
+import csv
+import io
+import json
+import uuid
+from datetime import datetime, timedelta, timezone
 
+import pytest
+from sqlalchemy import update
+
+from app.api.routes.orders import decode_sync_cursor, encode_sync_cursor, order_list_cache
 from app.core.security import create_access_token
+from app.models.order import Order
+from app.models.order_tombstone import OrderTombstone
+from app.schemas.order import OrderOut
 
 
 def test_create_order(client, vendor_user):
@@ -16,3 +27,284 @@ def test_create_order(client, vendor_user):
     assert response.status_code == 200
     data = response.json()
     assert data["invoice_number"] == "INV-001"
+
+
+def test_list_orders_keyset_pagination(client, db_session, vendor_user):
+    token = create_access_token(str(vendor_user.id))
+    headers = {"Authorization": f"Bearer {token}"}
+    base = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    for index in range(5):
+        db_session.add(
+            Order(
+                invoice_number=f"PAGE-{index}",
+                client_name="Mme Jane Doe",
+                product_name="PC GAMER Raijin",
+                # Two orders share a timestamp to exercise the id tie-breaker.
+                sold_at=base + timedelta(days=min(index, 3)),
+            )
+        )
+    db_session.commit()
+
+    seen = []
+    cursor = None
+    while True:
+        params = {"limit": 2, "fields": "invoice_number,sold_at"}
+        if cursor:
+            params["cursor"] = cursor
+        response = client.get("/api/orders", params=params, headers=headers)
+        assert response.status_code == 200
+        if cursor is None:
+            assert response.headers["X-Total-Count"] == "5"
+        else:
+            assert "X-Total-Count" not in response.headers
+        page = response.json()
+        assert all(set(item) == {"invoice_number", "sold_at"} for item in page)
+        seen.extend(item["invoice_number"] for item in page)
+        cursor = response.headers.get("X-Next-Cursor")
+        if not cursor:
+            break
+
+    assert len(seen) == 5
+    assert set(seen) == {f"PAGE-{index}" for index in range(5)}
+    assert seen[0] in {"PAGE-3", "PAGE-4"}
+    assert seen[-1] == "PAGE-0"
+
+    response = client.get("/api/orders", params={"fields": "nope"}, headers=headers)
+    assert response.status_code == 400
+    response = client.get("/api/orders", params={"cursor": "garbage"}, headers=headers)
+    assert response.status_code == 400
+
+
+def test_list_orders_matches_order_out(client, db_session, admin_user):
+    headers = {"Authorization": f"Bearer {create_access_token(str(admin_user.id))}"}
+    order = Order(
+        invoice_number="FAST-1",
+        store="DREAM STATION SAINT PIERRE",
+        client_name="Mme Jane Doe",
+        product_name="PC GAMER Raijin",
+        sold_at=datetime(2026, 1, 1, 10, 30, 15, 250000),
+        prepared=True,
+        created_by=admin_user.id,
+    )
+    db_session.add(order)
+    db_session.commit()
+    db_session.refresh(order)
+
+    response = client.get("/api/orders", headers=headers)
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    expected = json.loads(OrderOut.model_validate(order).model_dump_json())
+    assert response.json() == [expected]
+
+
+def test_list_orders_conditional_get(client, db_session, admin_user):
+    headers = {"Authorization": f"Bearer {create_access_token(str(admin_user.id))}"}
+    orders = [
+        Order(
+            invoice_number=f"ETAG-{index}",
+            client_name="Mme Jane Doe",
+            product_name="PC GAMER Raijin",
+            sold_at=datetime(2026, 1, 1 + index, tzinfo=timezone.utc),
+        )
+        for index in range(3)
+    ]
+    db_session.add_all(orders)
+    db_session.commit()
+    params = {"view": "to_prepare"}
+
+    first = client.get("/api/orders", params=params, headers=headers)
+    etag = first.headers["ETag"]
+    assert etag.startswith('W/"')
+    assert len(first.json()) == 3
+
+    hits = order_list_cache.hits
+    cached = client.get("/api/orders", params=params, headers=headers)
+    assert cached.content == first.content
+    assert order_list_cache.hits == hits + 1
+
+    conditional = {**headers, "If-None-Match": etag}
+    not_modified = client.get("/api/orders", params=params, headers=conditional)
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
+
+    # Leaving the filtered set is detected even when the row is not the newest.
+    response = client.patch(
+        f"/api/orders/{orders[0].id}", json={"prepared": True}, headers=headers
+    )
+    assert response.status_code == 200
+    changed = client.get("/api/orders", params=params, headers=conditional)
+    assert changed.status_code == 200
+    assert len(changed.json()) == 2
+    assert changed.headers["ETag"] != etag
+
+    conditional = {**headers, "If-None-Match": changed.headers["ETag"]}
+    client.delete(f"/api/orders/{orders[1].id}", headers=headers)
+    after_delete = client.get("/api/orders", params=params, headers=conditional)
+    assert after_delete.status_code == 200
+    assert [item["invoice_number"] for item in after_delete.json()] == ["ETAG-2"]
+
+
+def test_order_stats(client, db_session, vendor_user):
+    token = create_access_token(str(vendor_user.id))
+    base = datetime(2026, 3, 1, 12, tzinfo=timezone.utc)
+    fixtures = [
+        ("STAT-1", "DREAM STATION SAINT PIERRE", 0, {}),
+        ("STAT-2", "DREAM STATION SAINT PIERRE", 0, {"prepared": True}),
+        ("STAT-3", "DREAM STATION SAINT DENIS", 1, {"prepared": True, "built": True}),
+        ("STAT-4", "DREAM STATION SAINT DENIS", 1, {"prepared": True, "built": True, "delivered": True}),
+        ("STAT-5", None, 2, {"status": "DEJA DONNER"}),
+        ("STAT-6", None, 30, {}),
+    ]
+    for number, store, offset, flags in fixtures:
+        db_session.add(
+            Order(
+                invoice_number=number,
+                store=store,
+                client_name="Mme Jane Doe",
+                product_name="PC GAMER Raijin",
+                sold_at=base + timedelta(days=offset),
+                **flags,
+            )
+        )
+    db_session.commit()
+
+    response = client.get(
+        "/api/orders/stats",
+        params={"to": (base + timedelta(days=10)).isoformat()},
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["totals"] == {
+        "total": 5,
+        "to_prepare": 1,
+        "to_build": 1,
+        "to_deliver": 1,
+        "done": 1,
+    }
+    stores = {item["store"]: item for item in data["stores"]}
+    assert stores["DREAM STATION SAINT DENIS"]["total"] == 2
+    assert stores[None]["to_prepare"] == 0
+    assert [item["day"] for item in data["days"]] == ["2026-03-01", "2026-03-02", "2026-03-03"]
+    assert data["days"][0]["total"] == 2
+
+
+def test_order_changes_feed(client, db_session, admin_user):
+    headers = {"Authorization": f"Bearer {create_access_token(str(admin_user.id))}"}
+    for index in range(3):
+        payload = {
+            "invoice_number": f"SYNC-{index}",
+            "client_name": "Mme Jane Doe",
+            "product_name": "PC GAMER Raijin",
+            "sold_at": datetime.now(timezone.utc).isoformat(),
+        }
+        client.post("/api/orders", json=payload, headers=headers)
+
+    first = client.get("/api/orders/changes", params={"limit": 2}, headers=headers).json()
+    assert len(first["orders"]) == 2 and first["has_more"]
+    second = client.get(
+        "/api/orders/changes", params={"since": first["cursor"], "limit": 2}, headers=headers
+    ).json()
+    assert not second["has_more"]
+    synced = {item["invoice_number"] for item in first["orders"] + second["orders"]}
+    assert synced == {"SYNC-0", "SYNC-1", "SYNC-2"}
+
+    ids = {item["invoice_number"]: item["id"] for item in first["orders"] + second["orders"]}
+    client.patch(f"/api/orders/{ids['SYNC-0']}", json={"prepared": True}, headers=headers)
+    client.delete(f"/api/orders/{ids['SYNC-1']}", headers=headers)
+
+    changes = client.get(
+        "/api/orders/changes", params={"since": second["cursor"]}, headers=headers
+    ).json()
+    changed = {item["invoice_number"]: item for item in changes["orders"]}
+    assert changed["SYNC-0"]["prepared"] is True
+    assert "SYNC-1" not in changed
+    assert changes["deleted"] == [ids["SYNC-1"]]
+    assert changes["cursor"]
+
+    # Nothing changed since: the poll is empty and the cursor stays put.
+    idle = client.get(
+        "/api/orders/changes", params={"since": changes["cursor"]}, headers=headers
+    ).json()
+    assert (idle["orders"], idle["deleted"]) == ([], [])
+    assert decode_sync_cursor(idle["cursor"])[1:] == decode_sync_cursor(changes["cursor"])[1:]
+
+    stale = encode_sync_cursor(datetime.now(timezone.utc) - timedelta(days=365), None, None)
+    response = client.get("/api/orders/changes", params={"since": stale}, headers=headers)
+    assert response.json()["reset"] is True
+
+
+def test_order_changes_quiet_past_retention(client, db_session, admin_user):
+    headers = {"Authorization": f"Bearer {create_access_token(str(admin_user.id))}"}
+    long_ago = datetime.now(timezone.utc) - timedelta(days=40)
+    db_session.add_all(
+        [
+            Order(
+                invoice_number="QUIET-1",
+                client_name="Mme Jane Doe",
+                product_name="PC",
+                sold_at=long_ago,
+            ),
+            OrderTombstone(order_id=uuid.uuid4(), invoice_number="QUIET-0", deleted_at=long_ago),
+        ]
+    )
+    db_session.commit()
+    db_session.execute(update(Order).values(updated_at=long_ago))
+    db_session.commit()
+
+    # Nothing was written or deleted within the retention window, but the
+    # client keeps polling: its cursor stays valid.
+    synced = client.get("/api/orders/changes", headers=headers).json()
+    assert [item["invoice_number"] for item in synced["orders"]] == ["QUIET-1"]
+    polled = client.get(
+        "/api/orders/changes", params={"since": synced["cursor"]}, headers=headers
+    ).json()
+    assert polled["reset"] is False
+    assert (polled["orders"], polled["deleted"]) == ([], [])
+
+
+def test_export_orders(client, db_session, admin_user):
+    headers = {"Authorization": f"Bearer {create_access_token(str(admin_user.id))}"}
+    for index in range(3):
+        db_session.add(
+            Order(
+                invoice_number=f"EXPORT-{index}",
+                client_name="Mme Jane Doe, fille",
+                product_name="PC GAMER Raijin",
+                sold_at=datetime(2026, 1, 1 + index, 9, 0),
+                prepared=index == 0,
+            )
+        )
+    db_session.commit()
+
+    response = client.get(
+        "/api/orders/export", params={"view": "to_prepare"}, headers=headers
+    )
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert "attachment" in response.headers["content-disposition"]
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert [row["invoice_number"] for row in rows] == ["EXPORT-1", "EXPORT-2"]
+    assert rows[0]["client_name"] == "Mme Jane Doe, fille"
+    assert rows[0]["sold_at"] == "2026-01-02T09:00:00"
+
+    plain = client.get(
+        "/api/orders/export", headers={**headers, "Accept-Encoding": "identity"}
+    )
+    assert "content-encoding" not in plain.headers
+    assert len(list(csv.DictReader(io.StringIO(plain.text)))) == 3
+
+    pq = pytest.importorskip("pyarrow.parquet")
+    response = client.get("/api/orders/export", params={"format": "parquet"}, headers=headers)
+    assert response.status_code == 200
+    table = pq.read_table(io.BytesIO(response.content))
+    assert table.column("invoice_number").to_pylist() == [f"EXPORT-{index}" for index in range(3)]
+    assert table.column("prepared").to_pylist() == [True, False, False]
+
+    openpyxl = pytest.importorskip("openpyxl")
+    response = client.get("/api/orders/export", params={"format": "xlsx"}, headers=headers)
+    assert response.status_code == 200
+    sheet = openpyxl.load_workbook(io.BytesIO(response.content)).active
+    values = list(sheet.values)
+    assert values[0][0] == "invoice_number"
+    assert [row[0] for row in values[1:]] == [f"EXPORT-{index}" for index in range(3)]
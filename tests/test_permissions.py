@@ -1,3 +1,4 @@
+import uuid
 from datetime import datetime, timezone
 
 from app.core.security import create_access_token
@@ -38,3 +39,46 @@ def test_permissions_vendor_builder(client, vendor_user, builder_user):
         headers={"Authorization": f"Bearer {builder_token}"},
     )
     assert response.status_code == 403
+
+
+def test_bulk_patch_orders(client, vendor_user, builder_user):
+    vendor_headers = {"Authorization": f"Bearer {create_access_token(str(vendor_user.id))}"}
+    builder_headers = {"Authorization": f"Bearer {create_access_token(str(builder_user.id))}"}
+
+    order_ids = []
+    for index in range(3):
+        payload = {
+            "invoice_number": f"BULK-{index}",
+            "client_name": "Mme Jane Doe",
+            "product_name": "PC GAMER Raijin",
+            "sold_at": datetime.now(timezone.utc).isoformat(),
+        }
+        response = client.post("/api/orders", json=payload, headers=vendor_headers)
+        order_ids.append(response.json()["id"])
+    missing_id = str(uuid.uuid4())
+
+    response = client.patch(
+        "/api/orders",
+        json=[
+            {"id": order_ids[0], "built": True},
+            {"id": order_ids[1], "built": True},
+            {"id": order_ids[2], "prepared": True},
+            {"id": missing_id, "built": True},
+        ],
+        headers=builder_headers,
+    )
+    assert response.status_code == 200
+    results = response.json()
+    assert [item["status"] for item in results] == ["updated", "updated", "forbidden", "not_found"]
+    assert results[0]["order"]["built"] is True
+    assert results[2]["detail"] == "Forbidden fields"
+
+    response = client.patch(
+        "/api/orders",
+        json=[{"id": order_ids[2], "prepared": True, "status": "DEJA DONNER"}],
+        headers=vendor_headers,
+    )
+    assert response.json()[0]["order"]["status"] == "DEJA DONNER"
+
+    listed = client.get("/api/orders", params={"view": "to_deliver"}, headers=vendor_headers)
+    assert {item["id"] for item in listed.json()} == set(order_ids[:2])